@@ -0,0 +1,322 @@
+"""Command line non-interaktif untuk semua algoritma, dengan output JSON.
+
+Contoh pemakaian:
+    python cli.py bfs --start a
+    python cli.py dfs --edges graf.txt --start 0
+    python cli.py bfs --snapshot graf.snap --start 0
+    python cli.py forest
+    python cli.py topo
+    python cli.py classify --start a --plot
+    python cli.py mst --algorithm prim --start A
+    python cli.py mst --algorithm boruvka --workers 4 --edges graf_besar.txt
+    python cli.py mst --algorithm filter-kruskal --edges graf_besar.txt
+    python cli.py dijkstra --source s
+    python cli.py knight --size 5 --row 0 --col 0 --trace knight.trace
+    python cli.py --stats dijkstra.json dijkstra --source s
+    cat edges.txt | python cli.py stream --root a
+
+Tanpa --edges (atau --snapshot, snapshot biner dari nomor_1/graph_snapshot.py
+yang dimuat dengan mmap) dipakai graf default dari soal. Command stream membaca edge
+dari stdin (atau --edges) dan menulis satu delta JSON per baris per batch. NetworkX dan Matplotlib
+hanya dimuat jika --plot diberikan; --layout-cache DIR menyimpan posisi
+layout ke disk sehingga plot graf yang sama berikutnya tidak di-layout
+ulang. --stats FILE menulis jumlah operasi (heap push/pop, relaksasi,
+find, vertex diproses, backtrack) serta waktu dan puncak memori per fase
+ke FILE sebagai JSON; --stats - menambahkannya ke output dengan key
+"stats". Output print dari algoritma dibuang
+(atau dikirim ke stderr dengan --verbose) sehingga stdout hanya berisi JSON.
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for folder in ('nomor_1', 'nomor_2', 'nomor_3', 'nomor_4'):
+    if os.path.join(ROOT, folder) not in sys.path:
+        sys.path.append(os.path.join(ROOT, folder))
+
+
+def load_directed_graph(graph_cls, path, snapshot=None):
+    """Graf berarah dari snapshot biner, file edge list, atau graf default nomor_1"""
+    if snapshot:
+        from graph_snapshot import load_graph
+        return load_graph(snapshot, graph_cls)
+    if path:
+        from edge_loader import build_graph, load_edge_list
+        return build_graph(graph_cls, load_edge_list(path))
+
+    from graph_traversal import DEFAULT_EDGES
+    g = graph_cls()
+    for u, v in DEFAULT_EDGES:
+        g.add_edge(u, v)
+    return g
+
+
+def pick_start(start, vertices):
+    """Vertex start yang diminta, atau 'a'/vertex terkecil jika tidak diberikan"""
+    if start is not None:
+        if start not in vertices:
+            raise SystemExit(f"Vertex '{start}' tidak ada di graf")
+        return start
+    return 'a' if 'a' in vertices else min(vertices)
+
+
+def stats_phase(args, name):
+    """Fase RunStats bernama name jika --stats diberikan"""
+    return args.run_stats.phase(name) if args.run_stats else contextlib.nullcontext()
+
+
+def traversal_graph(args):
+    from graph_traversal import Graph
+    with stats_phase(args, 'load'):
+        g = load_directed_graph(Graph, args.edges, args.snapshot)
+        g.freeze()
+    return g
+
+
+@contextlib.contextmanager
+def trace_sink(path):
+    """BinarySink ke path jika --trace diberikan, selain itu None (tanpa tracing)"""
+    if not path:
+        yield None
+        return
+    from tracing import BinarySink
+    with BinarySink(path) as sink:
+        yield sink
+
+
+def run_bfs(args):
+    g = traversal_graph(args)
+    start = pick_start(args.start, g.vertices)
+    with stats_phase(args, 'search'):
+        tree_edges, order = g.bfs_tree(start, args.run_stats)
+    result = {'start': start, 'order': order, 'tree_edges': tree_edges}
+    return result, lambda: g.visualize_graph(f"BFS Tree dari '{start}'", highlight_edges=tree_edges)
+
+
+def run_dfs(args):
+    g = traversal_graph(args)
+    start = pick_start(args.start, g.vertices)
+    with stats_phase(args, 'search'):
+        tree_edges, order = g.dfs_tree(start, args.run_stats)
+    result = {'start': start, 'order': order, 'tree_edges': tree_edges}
+    return result, lambda: g.visualize_graph(f"DFS Tree dari '{start}'", highlight_edges=tree_edges)
+
+
+def run_forest(args):
+    g = traversal_graph(args)
+    with stats_phase(args, 'search'):
+        forest_edges, order, trees = g.dfs_forest(args.run_stats)
+    return {'order': order, 'trees': trees}, lambda: g.visualize_graph("DFS Forest", highlight_edges=forest_edges)
+
+
+def run_topo(args):
+    from kahn import collect_order
+
+    g = traversal_graph(args)
+    with stats_phase(args, 'search'):
+        order, cycle = collect_order(g.topological_order_stream())
+    return {'order': None if cycle else order, 'cycle': cycle}, lambda: g.visualize_graph("Graf Topological")
+
+
+def run_classify(args):
+    from dfs_graph import DFSGraph
+
+    with stats_phase(args, 'load'):
+        g = load_directed_graph(DFSGraph, args.edges, args.snapshot)
+    start = pick_start(args.start, g.vertices)
+    with trace_sink(args.trace) as tracer, stats_phase(args, 'search'):
+        order, tree_edges = g.dfs_with_timestamps(start, tracer, args.run_stats)
+    result = {
+        'start': start,
+        'order': order,
+        'timestamps': {v: {'d': d, 'f': f} for v, (d, f) in g.timestamps.items()},
+        'edges': [{'u': u, 'v': v, 'type': kind} for (u, v), kind in g.edge_types.items()],
+    }
+    return result, g.visualize_graph_with_timestamps
+
+
+def run_mst(args):
+    from kruskal_prim import Graph, create_default_graph
+
+    with stats_phase(args, 'load'):
+        if args.edges:
+            from edge_loader import build_weighted_graph, load_edge_list
+            g = build_weighted_graph(Graph, load_edge_list(args.edges, weighted=True))
+        else:
+            g = create_default_graph()
+    start = pick_start(args.start, g.vertices_set)
+
+    result = {}
+    if args.algorithm in ('kruskal', 'both'):
+        with stats_phase(args, 'kruskal'):
+            final = g.kruskal_mst(args.run_stats)[-1]
+        result['kruskal'] = {'edges': list(final['mst_edges']), 'total_weight': final['total_weight']}
+    if args.algorithm in ('prim', 'both'):
+        with stats_phase(args, 'prim'):
+            final = g.prim_mst(start, args.run_stats)[-1]
+        result['prim'] = {'start': start, 'edges': list(final['mst_edges']), 'total_weight': final['total_weight']}
+    if args.algorithm == 'filter-kruskal':
+        from kruskal_engine import filter_kruskal_indices
+
+        with stats_phase(args, 'filter_kruskal'):
+            labels, src, dst, weights = g.interned.arrays(g.graph)
+            mst = filter_kruskal_indices(len(labels), src, dst, weights, args.run_stats)
+        edges = [tuple(g.graph[i]) for i in mst.tolist()]
+        result['filter-kruskal'] = {'edges': edges, 'total_weight': sum(w for _, _, w in edges)}
+    if args.algorithm == 'boruvka':
+        from boruvka import boruvka_indices
+        with stats_phase(args, 'boruvka'):
+            labels, src, dst, weights = g.interned.arrays(g.graph)
+            mst = boruvka_indices(len(labels), src, dst, weights, args.workers, args.run_stats)
+        edges = [tuple(g.graph[i]) for i in mst.tolist()]
+        result['boruvka'] = {'edges': edges, 'total_weight': sum(w for _, _, w in edges)}
+
+    def plot():
+        import matplotlib.pyplot as plt
+        from kruskal_prim import MST_Visualizer
+        visualizer = MST_Visualizer(g, initial_prim_vertex=start)  # Referensi menjaga tombol tetap aktif
+        plt.ioff()
+        plt.show()
+    return result, plot
+
+
+def run_dijkstra(args):
+    from dijkstra_dinamis import DEFAULT_EDGES, DEFAULT_NODE_MAP, dijkstra, plot_dijkstra
+
+    if args.edges:
+        from edge_loader import load_edge_list, to_dijkstra_input
+        with stats_phase(args, 'load'):
+            node_map, edges = to_dijkstra_input(load_edge_list(args.edges, weighted=True))
+    else:
+        node_map, edges = DEFAULT_NODE_MAP, DEFAULT_EDGES
+    source = args.source
+    if source is None:
+        source = 's' if 's' in node_map else min(node_map)
+    elif source not in node_map:
+        raise SystemExit(f"Simpul '{source}' tidak ada di graf")
+
+    dist, prev = dijkstra(node_map, edges, source, args.run_stats)
+    result = {
+        'source': source,
+        'dist': {v: None if d == sys.maxsize else d for v, d in dist.items()},
+        'prev': prev,
+    }
+    return result, lambda: plot_dijkstra(edges, prev)
+
+
+def run_knight(args):
+    from knightProb import solve
+
+    with trace_sink(args.trace) as tracer, stats_phase(args, 'search'):
+        found, board, steps, m, count = solve(args.size, args.row, args.col, tracer, args.run_stats)
+    return {'found': found, 'board': board, 'steps': steps, 'nodes': count}, None
+
+
+def run_stream(args):
+    from edge_stream import read_edge_batches, stream_deltas
+
+    source = open(args.edges, 'rb') if args.edges else sys.stdin.buffer
+    with source:
+        yield from stream_deltas(read_edge_batches(source, args.batch_size), args.root)
+
+
+@contextlib.contextmanager
+def algorithm_output(verbose):
+    """Print dari algoritma dikirim ke stderr (--verbose) atau dibuang; stdout khusus JSON"""
+    if verbose:
+        with contextlib.redirect_stdout(sys.stderr):
+            yield
+    else:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            yield
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Algoritma graf Kelompok-8 (output JSON)")
+    parser.add_argument('--verbose', action='store_true', help="Teruskan print algoritma ke stderr")
+    parser.add_argument('--indent', type=int, default=None, help="Indentasi JSON")
+    parser.add_argument('--layout-cache', metavar='DIR', help="Folder cache layout untuk --plot")
+    parser.add_argument('--stats', metavar='FILE',
+                        help="Simpan jumlah operasi dan waktu per fase ke FILE ('-': key 'stats' di output)")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def add(name, func, help_text, edges=True, plot=True, snapshot=False):
+        p = sub.add_parser(name, help=help_text)
+        if edges:
+            source = p.add_mutually_exclusive_group() if snapshot else p
+            source.add_argument('--edges', help="File edge list (default: graf dari soal)")
+            if snapshot:
+                source.add_argument('--snapshot', help="File snapshot biner dari graph_snapshot.py (dimuat dengan mmap)")
+        if plot:
+            p.add_argument('--plot', action='store_true', help="Tampilkan visualisasi")
+        p.set_defaults(func=func, plot=False)
+        return p
+
+    add('bfs', run_bfs, "BFS tree", snapshot=True).add_argument('--start')
+    add('dfs', run_dfs, "DFS tree", snapshot=True).add_argument('--start')
+    add('forest', run_forest, "DFS forest", snapshot=True)
+    add('topo', run_topo, "Topological sort (Kahn)", snapshot=True)
+    classify = add('classify', run_classify, "DFS dengan timestamps dan klasifikasi edge", snapshot=True)
+    classify.add_argument('--start')
+    classify.add_argument('--trace', metavar='FILE', help="Tulis event DFS ke file trace biner")
+
+    mst = add('mst', run_mst, "Minimum spanning tree (Kruskal/Prim)")
+    mst.add_argument('--algorithm', choices=('kruskal', 'prim', 'both', 'filter-kruskal', 'boruvka'), default='both')
+    mst.add_argument('--start', help="Vertex awal Prim")
+    mst.add_argument('--workers', type=int, help="Jumlah proses untuk Borůvka paralel (default: jumlah CPU)")
+
+    add('dijkstra', run_dijkstra, "Shortest path Dijkstra").add_argument('--source')
+
+    knight = add('knight', run_knight, "Knight's tour", edges=False, plot=False)
+    knight.add_argument('--size', type=int, default=5)
+    knight.add_argument('--row', type=int, default=0)
+    knight.add_argument('--col', type=int, default=0)
+    knight.add_argument('--trace', metavar='FILE', help="Tulis event expand/backtrack ke file trace biner")
+
+    stream = sub.add_parser('stream', help="BFS dan komponen online dari stream edge (JSON lines)")
+    stream.add_argument('--edges', help="File edge list (default: stdin)")
+    stream.add_argument('--root', help="Root untuk jarak BFS")
+    stream.add_argument('--batch-size', type=int, default=10000)
+    stream.set_defaults(func=run_stream, plot=False)
+
+    args = parser.parse_args()
+    args.run_stats = None
+    if args.stats:
+        if args.command == 'stream':
+            parser.error("--stats tidak didukung untuk command stream")
+        from instrumentation import RunStats
+        args.run_stats = RunStats(args.command)
+
+    out = sys.stdout
+    if args.command == 'stream':
+        # Delta ditulis segera setelah setiap batch diterapkan
+        with algorithm_output(args.verbose):
+            for delta in args.func(args):
+                out.write(json.dumps(delta, ensure_ascii=False) + '\n')
+                out.flush()
+        return
+
+    # Setiap command mengembalikan (hasil untuk JSON, fungsi plot atau None)
+    with algorithm_output(args.verbose):
+        result, plot = args.func(args)
+    if args.stats == '-':
+        result['stats'] = args.run_stats.to_dict()
+    elif args.stats:
+        args.run_stats.save(args.stats)
+    json.dump(result, sys.stdout, ensure_ascii=False, indent=args.indent)
+    sys.stdout.write('\n')
+    sys.stdout.flush()
+
+    if args.plot and plot is not None:
+        if args.layout_cache:
+            from layout_cache import default_cache
+            default_cache.path = args.layout_cache
+        with algorithm_output(args.verbose):
+            plot()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+"""Benchmark untuk algoritma graf pada nomor_1.
+
+Contoh pemakaian:
+    python benchmark.py dfs
+    python benchmark.py dfs --sizes 1000 100000 10000000
+    python benchmark.py bfs
+    python benchmark.py path
+    python benchmark.py msbfs
+    python benchmark.py dobfs
+    python benchmark.py pbfs --workers 1 2 4 8 16 32
+    python benchmark.py load --lines 1000000 10000000
+    python benchmark.py snapshot --lines 1000000 10000000
+    python benchmark.py trace --sizes 100000 1000000
+"""
+import argparse
+import contextlib
+import math
+import os
+import random
+import tempfile
+import time
+
+from bfs_graph import BFSGraph
+from dfs_graph import DFSGraph
+from tracing import BinarySink, ConsoleSink, CounterSink
+
+
+def path_graph(graph_cls, n):
+    """Graf path 0 -> 1 -> ... -> n-1 (kasus terburuk untuk kedalaman DFS)"""
+    g = graph_cls()
+    for i in range(n - 1):
+        g.add_edge(i, i + 1)
+    if n == 1:
+        g.vertices.add(0)
+    return g
+
+
+def random_graph(graph_cls, n, m, seed=42):
+    """Graf berarah acak dengan n vertex dan m edge"""
+    rng = random.Random(seed)
+    g = graph_cls()
+    for v in range(n):
+        g.vertices.add(v)
+    for _ in range(m):
+        g.add_edge(rng.randrange(n), rng.randrange(n))
+    return g
+
+
+def star_graph(graph_cls, n):
+    """Graf bintang: pusat 0 dengan edge ke n-1 daun (frontier sangat lebar)"""
+    g = graph_cls()
+    for i in range(1, n):
+        g.add_edge(0, i)
+    return g
+
+
+def power_law_graph(graph_cls, n, m=8, seed=42):
+    """Graf power-law (preferential attachment), edge dua arah, diameter kecil"""
+    rng = random.Random(seed)
+    g = graph_cls()
+    endpoints = list(range(m + 1))
+    for v in range(m + 1):
+        g.vertices.add(v)
+    for v in range(m + 1, n):
+        for u in {rng.choice(endpoints) for _ in range(m)}:
+            g.add_edge(u, v)
+            g.add_edge(v, u)
+            endpoints.extend((u, v))
+    return g
+
+
+def timed(fn, *args):
+    """Menjalankan fn dengan output print dibuang; mengembalikan (hasil, detik)"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        result = fn(*args)
+        return result, time.perf_counter() - start
+
+
+def dfs_with_timestamps_recursive(g, start_vertex=None):
+    """Versi rekursif lama DFSGraph.dfs_with_timestamps (sebagai pembanding)"""
+    g.reset_dfs_data()
+
+    visited_order = []
+    tree_edges = []
+
+    def dfs_visit(u):
+        g.time += 1
+        g.timestamps[u] = [g.time, 0]
+        g.colors[u] = 'gray'
+        visited_order.append(u)
+
+        print(f"Menemukan vertex {u} pada waktu {g.time}")
+
+        for v in sorted(g.graph[u]):
+            edge = (u, v)
+            if g.colors[v] == 'white':
+                g.edge_types[edge] = 'T'
+                g.parent[v] = u
+                tree_edges.append(edge)
+                print(f"  Edge {u} -> {v}: Tree edge (T)")
+                dfs_visit(v)
+            elif g.colors[v] == 'gray':
+                g.edge_types[edge] = 'B'
+                print(f"  Edge {u} -> {v}: Back edge (B)")
+            elif g.timestamps[u][0] < g.timestamps[v][0]:
+                g.edge_types[edge] = 'F'
+                print(f"  Edge {u} -> {v}: Forward edge (F)")
+            else:
+                g.edge_types[edge] = 'C'
+                print(f"  Edge {u} -> {v}: Cross edge (C)")
+
+        g.colors[u] = 'black'
+        g.time += 1
+        g.timestamps[u][1] = g.time
+        print(f"Selesai memproses vertex {u} pada waktu {g.time}")
+
+    if start_vertex is not None and start_vertex in g.vertices:
+        dfs_visit(start_vertex)
+    for vertex in sorted(g.vertices):
+        if g.colors[vertex] == 'white':
+            dfs_visit(vertex)
+
+    return visited_order, tree_edges
+
+
+def run_recursive(g):
+    """Menjalankan versi rekursif dengan batas rekursi default Python"""
+    try:
+        return timed(dfs_with_timestamps_recursive, g, 0)
+    except RecursionError:
+        return None, None
+
+
+def bench_dfs(args):
+    print("DFS dengan timestamps: rekursif vs stack eksplisit")
+    print(f"{'graf':<10}{'vertex':>12}{'edge':>12}{'rekursif (s)':>16}{'iteratif (s)':>16}")
+    for n in args.sizes:
+        for name, g in (('path', path_graph(DFSGraph, n)),
+                        ('acak', random_graph(DFSGraph, n, 3 * n))):
+            edges = sum(len(nbrs) for nbrs in g.graph.values())
+
+            # ConsoleSink: output sama dengan versi rekursif agar perbandingan adil
+            (order, tree), iter_time = timed(g.dfs_with_timestamps, 0, ConsoleSink())
+            snapshot = (dict(g.timestamps), dict(g.parent), dict(g.edge_types))
+
+            rec_result, rec_time = run_recursive(g)
+            if rec_result is None:
+                rec_text = 'RecursionError'
+            else:
+                # Hasil kedua versi harus identik
+                assert rec_result == (order, tree)
+                assert snapshot == (g.timestamps, g.parent, g.edge_types)
+                rec_text = f"{rec_time:.3f}"
+
+            print(f"{name:<10}{n:>12,}{edges:>12,}{rec_text:>16}{iter_time:>16.3f}")
+
+
+def bench_bfs(args):
+    print("BFSGraph.bfs_tree: waktu per (V+E) harus konstan jika linear")
+    print(f"{'graf':<10}{'vertex':>12}{'V+E':>12}{'waktu (s)':>12}{'ns/(V+E)':>12}")
+    for name, build in (('bintang', star_graph),
+                        ('acak', lambda cls, n: random_graph(cls, n, 4 * n))):
+        points = []
+        for n in args.sizes:
+            g = build(BFSGraph, n)
+            work = len(g.vertices) + sum(len(nbrs) for nbrs in g.graph.values())
+            _, seconds = timed(g.bfs_tree, 0)
+            points.append((work, seconds))
+            print(f"{name:<10}{n:>12,}{work:>12,}{seconds:>12.3f}{seconds / work * 1e9:>12.1f}")
+
+        # Kemiringan log-log antara ukuran terkecil dan terbesar (~1.0 = linear)
+        (w0, t0), (w1, t1) = points[0], points[-1]
+        if t0 > 0 and w1 > w0:
+            slope = math.log(t1 / t0) / math.log(w1 / w0)
+            print(f"{'':<10}eksponen empiris: {slope:.2f}")
+
+
+def bench_path(args):
+    print("Query shortest path: BFS satu arah vs BFS dua arah")
+    print(f"{'vertex':>12}{'query':>8}{'satu arah (ms)':>18}{'dua arah (ms)':>18}")
+    rng = random.Random(7)
+    for n in args.sizes:
+        g = random_graph(BFSGraph, n, 4 * n)
+        g.reverse_adjacency()  # Dibangun sekali, tidak ikut diukur per query
+        queries = [(rng.randrange(n), rng.randrange(n)) for _ in range(args.queries)]
+
+        forward_time = bidirectional_time = 0.0
+        for start, end in queries:
+            (_, d1), t1 = timed(g.shortest_path_bfs, start, end)
+            (_, d2), t2 = timed(g.shortest_path_bidirectional, start, end)
+            assert d1 == d2
+            forward_time += t1
+            bidirectional_time += t2
+
+        print(f"{n:>12,}{len(queries):>8}{forward_time / len(queries) * 1e3:>18.3f}"
+              f"{bidirectional_time / len(queries) * 1e3:>18.3f}")
+
+
+def bench_msbfs(args):
+    print("Tabel jarak: loop bfs_levels vs bfs_levels_multi (MS-BFS)")
+    print(f"{'vertex':>12}{'sumber':>8}{'loop (s)':>12}{'MS-BFS (s)':>12}{'speedup':>10}")
+    rng = random.Random(11)
+    for n in args.sizes:
+        g = random_graph(BFSGraph, n, 4 * n)
+        sources = rng.sample(range(n), min(args.sources, n))
+
+        loop_result, loop_time = timed(lambda: {s: g.bfs_levels(s) for s in sources})
+        multi_result, multi_time = timed(g.bfs_levels_multi, sources)
+        for source in sources:
+            expected = {level: sorted(vs) for level, vs in loop_result[source].items()}
+            assert multi_result[source] == expected
+
+        print(f"{n:>12,}{len(sources):>8}{loop_time:>12.3f}{multi_time:>12.3f}"
+              f"{loop_time / multi_time:>9.1f}x")
+
+
+def bench_dobfs(args):
+    print("bfs_levels vs direction-optimizing BFS pada graf power-law")
+    print(f"{'vertex':>12}{'edge':>12}{'edge top-down':>16}{'edge DO-BFS':>14}"
+          f"{'hemat':>8}{'top-down (s)':>14}{'DO-BFS (s)':>12}")
+    for n in args.sizes:
+        g = power_law_graph(BFSGraph, n)
+        edges = sum(len(nbrs) for nbrs in g.graph.values())
+        g.reverse_adjacency()
+
+        expected, td_time = timed(g.bfs_levels, 0)
+        levels, do_time = timed(g.bfs_levels_direction_optimizing, 0)
+        assert levels == {level: sorted(vs) for level, vs in expected.items()}
+
+        # BFS top-down biasa memeriksa semua edge keluar dari vertex yang tercapai
+        td_edges = sum(len(g.graph.get(v, ())) for vs in expected.values() for v in vs)
+        stats = g.last_bfs_stats
+        do_edges = stats['top_down_edges'] + stats['bottom_up_edges']
+        print(f"{n:>12,}{edges:>12,}{td_edges:>16,}{do_edges:>14,}"
+              f"{td_edges / do_edges:>7.1f}x{td_time:>14.3f}{do_time:>12.3f}")
+
+
+def bench_pbfs(args):
+    from parallel_bfs import ParallelBFS
+
+    print("Strong scaling BFS paralel (shared memory) pada graf acak")
+    for n in args.sizes:
+        g = random_graph(BFSGraph, n, args.degree * n)
+        expected = {level: sorted(vs) for level, vs in g.bfs_levels(0).items()}
+        print(f"\nvertex: {n:,}  edge: {args.degree * n:,}")
+        print(f"{'worker':>8}{'waktu (s)':>12}{'speedup':>10}{'efisiensi':>12}")
+
+        baseline = None
+        for workers in args.workers:
+            with ParallelBFS(g, workers) as engine:
+                engine.levels(0)  # Pemanasan: worker sudah terpasang ke shared memory
+                levels, seconds = timed(engine.levels, 0)
+            assert levels == expected
+            baseline = baseline or seconds
+            speedup = baseline / seconds
+            print(f"{workers:>8}{seconds:>12.3f}{speedup:>9.2f}x{speedup / workers:>11.0%}")
+
+
+# (isi file, argumen weighted, edge (u, v[, w]) yang diharapkan atau None jika harus ValueError)
+LOADER_CASES = [
+    (b"a b\nb c\n  \n", None, [("a", "b"), ("b", "c")]),
+    (b"a b\n\t\n\nb c\n \t \n", False, [("a", "b"), ("b", "c")]),
+    (b"1 2\n   \n2 3\n\n", None, [("1", "2"), ("2", "3")]),
+    (b"a b 1\n \nb c 2\n\t\n", None, [("a", "b", 1), ("b", "c", 2)]),
+    (b"# komentar\n  \na b\n", None, [("a", "b")]),
+    (b"p q\nx\ny z w\n", False, None),
+    (b"1 2\n3\n4 5 6\n", False, None),
+    (b"a b 1\nc d\ne f 2 3\n", True, None),
+]
+
+
+def check_loader():
+    """Kasus regresi loader: baris kosong, baris spasi saja dan jumlah kolom tidak rata"""
+    from edge_loader import load_edge_list
+
+    for content, weighted, expected in LOADER_CASES:
+        with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as f:
+            f.write(content)
+        try:
+            for chunk_size in (4, 1 << 20):  # Chunk kecil menguji batas baris antar chunk
+                try:
+                    edges = load_edge_list(f.name, weighted, chunk_size)
+                except ValueError:
+                    if expected is None:
+                        continue
+                    raise
+                if expected is None:
+                    raise AssertionError(f"File {content!r} seharusnya ditolak")
+                labels = edges.labels
+                got = [(labels[u], labels[v]) for u, v in zip(edges.src.tolist(), edges.dst.tolist())]
+                if edges.weights is not None:
+                    got = [edge + (w,) for edge, w in zip(got, edges.weights.tolist())]
+                if got != expected:
+                    raise AssertionError(f"File {content!r}: {got} != {expected}")
+        finally:
+            os.remove(f.name)
+    print(f"{len(LOADER_CASES)} kasus format loader sesuai")
+
+
+def bench_load(args):
+    import numpy as np
+    from edge_loader import build_graph, load_edge_list, to_csr
+
+    check_loader()
+    print("Loader edge list (mmap + NumPy) dari file teks berbobot")
+    print(f"{'baris':>12}{'muat (s)':>10}{'edge/s':>14}{'CSR (s)':>10}{'BFSGraph (s)':>14}")
+    rng = np.random.default_rng(3)
+    for m in args.lines:
+        n = max(m // args.degree, 1)
+        table = np.column_stack((rng.integers(0, n, m), rng.integers(0, n, m), rng.integers(1, 100, m)))
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            np.savetxt(f, table, fmt='%d', delimiter=args.sep)
+        try:
+            edges, load_time = timed(load_edge_list, f.name)
+            _, csr_time = timed(to_csr, edges)
+            _, build_time = timed(build_graph, BFSGraph, edges)
+        finally:
+            os.remove(f.name)
+        print(f"{m:>12,}{load_time:>10.2f}{m / load_time:>14,.0f}{csr_time:>10.2f}{build_time:>14.2f}")
+
+
+def bench_snapshot(args):
+    import numpy as np
+    from edge_loader import load_edge_list
+    from graph_snapshot import load_graph, load_snapshot, save_snapshot
+    from graph_traversal import Graph
+
+    print("Startup: parsing edge list teks vs memuat snapshot biner (mmap)")
+    print("  load_graph: BFSGraph/Graph siap pakai dari snapshot; BFS: bfs_tree pertama BFSGraph hasil load_graph")
+    print(f"{'baris':>12}{'teks (s)':>10}{'snapshot (ms)':>15}{'BFSGraph (ms)':>15}{'Graph (ms)':>12}"
+          f"{'ukuran (MB)':>13}{'BFS (s)':>10}")
+    rng = np.random.default_rng(5)
+    for m in args.lines:
+        n = max(m // args.degree, 1)
+        with tempfile.TemporaryDirectory() as tmp:
+            text_path = os.path.join(tmp, 'edges.txt')
+            snapshot_path = os.path.join(tmp, 'graph.snap')
+            np.savetxt(text_path, np.column_stack((rng.integers(0, n, m), rng.integers(0, n, m))), fmt='%d')
+            edges, text_time = timed(load_edge_list, text_path)
+            save_snapshot(snapshot_path, edges)
+
+            _, snapshot_time = timed(load_snapshot, snapshot_path)
+            g, bfs_graph_time = timed(load_graph, snapshot_path, BFSGraph)
+            _, graph_time = timed(load_graph, snapshot_path, Graph)
+            _, bfs_time = timed(g.bfs_tree, g.csr.labels[0])  # Query pertama langsung dari mmap
+            size = os.path.getsize(snapshot_path) / 2 ** 20
+            del g, _  # Lepaskan mmap sebelum direktori dihapus
+        print(f"{m:>12,}{text_time:>10.2f}{snapshot_time * 1e3:>15.2f}{bfs_graph_time * 1e3:>15.2f}"
+              f"{graph_time * 1e3:>12.2f}{size:>13.1f}{bfs_time:>10.2f}")
+
+
+def bench_trace(args):
+    print("DFSGraph.dfs_with_timestamps dengan berbagai sink tracing (print ke /dev/null)")
+    print(f"{'vertex':>12}{'edge':>12}{'tanpa (s)':>11}{'counter (s)':>13}{'biner (s)':>11}{'konsol (s)':>12}{'trace (MB)':>12}")
+    for n in args.sizes:
+        g = random_graph(DFSGraph, n, 3 * n)
+        _, plain = timed(g.dfs_with_timestamps, 0)
+        _, counted = timed(g.dfs_with_timestamps, 0, CounterSink())
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'dfs.trace')
+            with BinarySink(path) as sink:
+                _, binary = timed(g.dfs_with_timestamps, 0, sink)
+            size = os.path.getsize(path) / 2 ** 20
+        _, console = timed(g.dfs_with_timestamps, 0, ConsoleSink())
+        print(f"{n:>12,}{3 * n:>12,}{plain:>11.3f}{counted:>13.3f}{binary:>11.3f}{console:>12.3f}{size:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark algoritma graf nomor_1")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    dfs = sub.add_parser('dfs', help="DFS rekursif vs iteratif")
+    dfs.add_argument('--sizes', type=int, nargs='+', default=[500, 5000, 100000, 1000000])
+    dfs.set_defaults(func=bench_dfs)
+
+    bfs = sub.add_parser('bfs', help="Skalabilitas BFS tree")
+    bfs.add_argument('--sizes', type=int, nargs='+', default=[25000, 50000, 100000, 200000, 400000])
+    bfs.set_defaults(func=bench_bfs)
+
+    path = sub.add_parser('path', help="Shortest path satu arah vs dua arah")
+    path.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    path.add_argument('--queries', type=int, default=50)
+    path.set_defaults(func=bench_path)
+
+    msbfs = sub.add_parser('msbfs', help="Multi-source BFS bit-parallel")
+    msbfs.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    msbfs.add_argument('--sources', type=int, default=64)
+    msbfs.set_defaults(func=bench_msbfs)
+
+    dobfs = sub.add_parser('dobfs', help="Direction-optimizing BFS")
+    dobfs.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 500000])
+    dobfs.set_defaults(func=bench_dobfs)
+
+    pbfs = sub.add_parser('pbfs', help="Strong scaling BFS paralel")
+    pbfs.add_argument('--sizes', type=int, nargs='+', default=[1000000])
+    pbfs.add_argument('--degree', type=int, default=8)
+    pbfs.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32])
+    pbfs.set_defaults(func=bench_pbfs)
+
+    load = sub.add_parser('load', help="Throughput loader edge list")
+    load.add_argument('--lines', type=int, nargs='+', default=[1000000, 5000000])
+    load.add_argument('--degree', type=int, default=8)
+    load.add_argument('--sep', default=' ', help="Pemisah kolom file uji (spasi, koma atau tab)")
+    load.set_defaults(func=bench_load)
+
+    snapshot = sub.add_parser('snapshot', help="Waktu startup teks vs snapshot biner")
+    snapshot.add_argument('--lines', type=int, nargs='+', default=[1000000, 5000000])
+    snapshot.add_argument('--degree', type=int, default=8)
+    snapshot.set_defaults(func=bench_snapshot)
+
+    trace = sub.add_parser('trace', help="Overhead sink tracing pada DFS")
+    trace.add_argument('--sizes', type=int, nargs='+', default=[100000, 1000000])
+    trace.set_defaults(func=bench_trace)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,4 @@
 from collections import deque
-import networkx as nx
-import matplotlib.pyplot as plt
 
 def bfs_tree(graph, start):
     visited = set()
@@ -27,6 +25,9 @@ def input_graph():
     return graph
 
 def draw_graph(graph, tree_edges=None):
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
     G = nx.DiGraph()
     for node in graph:
         for neighbor in graph[node]:
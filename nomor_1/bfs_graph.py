@@ -1,17 +1,102 @@
 from collections import defaultdict, deque
-import networkx as nx
-import matplotlib.pyplot as plt
+
+# Graf default dari soal
+DEFAULT_EDGES = [
+    ('a', 'b'), ('a', 'd'), ('a', 'e'),
+    ('b', 'c'), ('b', 'd'),
+    ('c', 'h'), ('c', 'g'),
+    ('d', 'f'),
+    ('e', 'd'), ('e', 'f'),
+    ('f', 'j'),
+    ('h', 'g'),
+    ('i', 'g'), ('i', 'h')
+]
+
+class DisjointSet:
+    """Union-find berbasis array dengan path halving dan union by rank"""
+    def __init__(self):
+        self.index = {}  # label -> ID integer
+        self.labels = []
+        self.parent = []
+        self.rank = []
+    
+    def add(self, x):
+        """Mendaftarkan x sebagai himpunan baru (jika belum ada); mengembalikan ID-nya"""
+        i = self.index.get(x)
+        if i is None:
+            i = len(self.labels)
+            self.index[x] = i
+            self.labels.append(x)
+            self.parent.append(i)
+            self.rank.append(0)
+        return i
+    
+    def _find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # Path halving
+            i = parent[i]
+        return i
+    
+    def find(self, x):
+        """Representatif himpunan yang memuat x"""
+        return self.labels[self._find(self.add(x))]
+    
+    def union(self, x, y):
+        """Menggabungkan himpunan x dan y; True jika sebelumnya terpisah"""
+        rx, ry = self._find(self.add(x)), self._find(self.add(y))
+        if rx == ry:
+            return False
+        if self.rank[rx] < self.rank[ry]:
+            rx, ry = ry, rx
+        self.parent[ry] = rx
+        if self.rank[rx] == self.rank[ry]:
+            self.rank[rx] += 1
+        return True
+    
+    def connected(self, x, y):
+        if x not in self.index or y not in self.index:
+            return x == y
+        return self._find(self.index[x]) == self._find(self.index[y])
+    
+    def groups(self):
+        """Semua himpunan sebagai list terurut, diurutkan menurut anggota terkecil"""
+        members = defaultdict(list)
+        for i, label in enumerate(self.labels):
+            members[self._find(i)].append(label)
+        return sorted(sorted(group) for group in members.values())
 
 class BFSGraph:
     def __init__(self):
         self.graph = defaultdict(list)
         self.vertices = set()
+        self.reverse_graph = None  # Indeks edge masuk, dibangun saat pertama dibutuhkan
+        self.last_bfs_stats = {}  # Jumlah edge yang diperiksa oleh BFS terakhir
+        self.components = None  # Union-find komponen lemah, dibangun saat pertama dibutuhkan
+        self.csr = None  # CSRGraph dari snapshot (graph_snapshot.load_graph), dipakai traversal
     
     def add_edge(self, u, v):
         """Menambahkan edge dari vertex u ke vertex v"""
+        if self.csr is not None:
+            from graph_snapshot import thaw
+            thaw(self)  # View snapshot read-only disalin sekali sebelum graf diubah
+            self.csr = None
         self.graph[u].append(v)
         self.vertices.add(u)
         self.vertices.add(v)
+        if self.reverse_graph is not None:
+            self.reverse_graph[v].append(u)
+        if self.components is not None:
+            self.components.union(u, v)
+    
+    def reverse_adjacency(self):
+        """Indeks adjacency terbalik (v -> daftar u dengan edge u -> v)"""
+        if self.reverse_graph is None:
+            self.reverse_graph = defaultdict(list)
+            for u, neighbors in self.graph.items():
+                for v in neighbors:
+                    self.reverse_graph[v].append(u)
+        return self.reverse_graph
     
     def display_graph(self):
         """Menampilkan representasi graf"""
@@ -23,31 +108,46 @@ class BFSGraph:
                 print(f"{vertex} -> (tidak ada edge keluar)")
         print()
     
-    def bfs_tree(self, start):
-        """Breadth-First Search Tree dari vertex start"""
+    def bfs_tree(self, start, stats=None):
+        """Breadth-First Search Tree dari vertex start (stats: RunStats opsional)"""
         if start not in self.vertices:
             return None, []
         
-        visited = set()
-        queue = deque([start])
+        if self.csr is not None:
+            tree_edges, traversal_order, levels = self.csr.bfs_layers(start)
+            if stats:
+                stats.add(expanded=len(traversal_order),
+                          edges_scanned=sum(map(self.csr.out_degree, traversal_order)))
+            return tree_edges, traversal_order, levels
+        
+        # BFS per level: parent sekaligus menjadi penanda vertex yang sudah
+        # ditemukan, sehingga setiap edge diperiksa tepat sekali (O(V+E))
+        parent = {start: None}
+        frontier = [start]
         tree_edges = []
         traversal_order = []
         levels = {start: 0}  # Untuk menampilkan level
+        depth = 0
         
-        while queue:
-            vertex = queue.popleft()
-            if vertex not in visited:
-                visited.add(vertex)
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for vertex in frontier:
                 traversal_order.append(vertex)
                 
                 # Urutkan neighbors untuk konsistensi
                 neighbors = sorted(self.graph[vertex])
                 for neighbor in neighbors:
-                    if neighbor not in visited and neighbor not in queue:
+                    if neighbor not in parent:
+                        parent[neighbor] = vertex
                         tree_edges.append((vertex, neighbor))
-                        levels[neighbor] = levels[vertex] + 1
-                        queue.append(neighbor)
+                        levels[neighbor] = depth
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
         
+        if stats:
+            stats.add(expanded=len(traversal_order),
+                      edges_scanned=sum(len(self.graph.get(v, ())) for v in traversal_order))
         return tree_edges, traversal_order, levels
     
     def bfs_levels(self, start):
@@ -55,6 +155,13 @@ class BFSGraph:
         if start not in self.vertices:
             return None
         
+        if self.csr is not None:
+            _, traversal_order, depth = self.csr.bfs_layers(start)
+            levels = defaultdict(list)
+            for vertex in traversal_order:
+                levels[depth[vertex]].append(vertex)
+            return dict(levels)
+        
         visited = set()
         queue = deque([(start, 0)])  # (vertex, level)
         levels = defaultdict(list)
@@ -73,6 +180,138 @@ class BFSGraph:
         
         return dict(levels)
     
+    def bfs_levels_direction_optimizing(self, start, alpha=14, beta=24):
+        """BFS level dengan pergantian top-down / bottom-up (direction-optimizing).
+
+        Saat frontier besar, vertex yang belum dikunjungi memeriksa edge
+        masuknya untuk mencari parent di frontier (bottom-up); saat frontier
+        kembali kecil, pencarian beralih ke top-down lagi. Level yang
+        dihasilkan sama dengan bfs_levels (vertex dalam satu level diurutkan).
+        Jumlah edge yang diperiksa disimpan di self.last_bfs_stats.
+        """
+        if start not in self.vertices:
+            return None
+        
+        reverse = self.reverse_adjacency()
+        num_vertices = len(self.vertices)
+        visited = {start}
+        frontier = [start]
+        levels = {0: [start]}
+        unvisited = None  # Daftar kandidat bottom-up, dibuat saat pertama dibutuhkan
+        # Jumlah edge keluar dari vertex yang belum dikunjungi (m_u)
+        unexplored_edges = sum(len(neighbors) for neighbors in self.graph.values())
+        unexplored_edges -= len(self.graph.get(start, ()))
+        
+        stats = {'top_down_edges': 0, 'bottom_up_edges': 0,
+                 'top_down_levels': 0, 'bottom_up_levels': 0}
+        top_down = True
+        level = 0
+        
+        while frontier:
+            level += 1
+            
+            # Heuristik pergantian arah (Beamer dkk.)
+            if top_down:
+                frontier_edges = sum(len(self.graph.get(vertex, ())) for vertex in frontier)
+                if frontier_edges > unexplored_edges / alpha:
+                    top_down = False
+            elif len(frontier) < num_vertices / beta:
+                top_down = True
+            
+            next_frontier = []
+            if top_down:
+                stats['top_down_levels'] += 1
+                for vertex in frontier:
+                    for neighbor in self.graph.get(vertex, ()):
+                        stats['top_down_edges'] += 1
+                        if neighbor not in visited:
+                            visited.add(neighbor)
+                            next_frontier.append(neighbor)
+            else:
+                stats['bottom_up_levels'] += 1
+                frontier_set = set(frontier)
+                if unvisited is None:
+                    unvisited = [vertex for vertex in self.vertices if vertex not in visited]
+                
+                remaining = []
+                for vertex in unvisited:
+                    if vertex in visited:
+                        continue
+                    for predecessor in reverse.get(vertex, ()):
+                        stats['bottom_up_edges'] += 1
+                        if predecessor in frontier_set:
+                            next_frontier.append(vertex)
+                            break
+                    else:
+                        remaining.append(vertex)
+                visited.update(next_frontier)
+                unvisited = remaining
+            
+            for vertex in next_frontier:
+                unexplored_edges -= len(self.graph.get(vertex, ()))
+            if next_frontier:
+                levels[level] = sorted(next_frontier)
+            frontier = next_frontier
+        
+        self.last_bfs_stats = stats
+        return levels
+    
+    def bfs_levels_parallel(self, start, workers=None):
+        """BFS level paralel antar proses (lihat parallel_bfs.py); tiap level terurut"""
+        from parallel_bfs import parallel_bfs_levels  # numpy hanya dimuat jika mode ini dipakai
+        return parallel_bfs_levels(self.csr if self.csr is not None else self, start, workers)
+    
+    def bfs_levels_multi(self, sources, batch_size=64):
+        """BFS dari banyak sumber sekaligus (multi-source BFS bit-parallel).
+
+        Setiap vertex menyimpan bitmask sumber yang sudah mencapainya, sehingga
+        satu kali scan adjacency melayani hingga batch_size sumber. Hasilnya
+        dict sumber -> tabel level seperti bfs_levels (vertex dalam satu level
+        diurutkan), atau None untuk sumber yang tidak ada di graf.
+        """
+        unique_sources = list(dict.fromkeys(sources))
+        results = {source: None for source in unique_sources}
+        valid = [source for source in unique_sources if source in self.vertices]
+        
+        for i in range(0, len(valid), batch_size):
+            batch = valid[i:i + batch_size]
+            for source, levels in zip(batch, self._bfs_levels_batch(batch)):
+                results[source] = levels
+        
+        return results
+    
+    def _bfs_levels_batch(self, batch):
+        """Satu kali MS-BFS untuk sekumpulan sumber; bit ke-i milik batch[i]"""
+        tables = [defaultdict(list) for _ in batch]
+        seen = {}  # vertex -> bitmask sumber yang sudah mencapai vertex
+        visit = {}  # Frontier: vertex -> bitmask sumber yang tiba pada level ini
+        
+        for bit, source in enumerate(batch):
+            seen[source] = visit[source] = 1 << bit
+            tables[bit][0].append(source)
+        
+        level = 0
+        while visit:
+            level += 1
+            visit_next = {}
+            for vertex, mask in visit.items():
+                for neighbor in self.graph.get(vertex, ()):
+                    new_mask = mask & ~seen.get(neighbor, 0)
+                    if new_mask:
+                        visit_next[neighbor] = visit_next.get(neighbor, 0) | new_mask
+                        seen[neighbor] = seen.get(neighbor, 0) | new_mask
+            
+            # Catat level untuk setiap sumber yang baru mencapai vertex
+            for vertex, mask in visit_next.items():
+                while mask:
+                    low_bit = mask & -mask
+                    tables[low_bit.bit_length() - 1][level].append(vertex)
+                    mask ^= low_bit
+            visit = visit_next
+        
+        return [{level: sorted(vertices) for level, vertices in table.items()}
+                for table in tables]
+    
     def shortest_path_bfs(self, start, end):
         """Mencari shortest path menggunakan BFS"""
         if start not in self.vertices or end not in self.vertices:
@@ -81,25 +320,86 @@ class BFSGraph:
         if start == end:
             return [start], 0
         
-        visited = set()
-        queue = deque([(start, [start])])
+        # Simpan parent pointer saja; path dibangun ulang saat end ditemukan
+        parent = {start: None}
+        queue = deque([start])
         
         while queue:
-            vertex, path = queue.popleft()
-            if vertex not in visited:
-                visited.add(vertex)
-                
-                # Urutkan neighbors untuk konsistensi
-                neighbors = sorted(self.graph[vertex])
-                for neighbor in neighbors:
-                    if neighbor not in visited:
-                        new_path = path + [neighbor]
-                        if neighbor == end:
-                            return new_path, len(new_path) - 1
-                        queue.append((neighbor, new_path))
+            vertex = queue.popleft()
+            
+            # Urutkan neighbors untuk konsistensi
+            neighbors = sorted(self.graph[vertex])
+            for neighbor in neighbors:
+                if neighbor not in parent:
+                    parent[neighbor] = vertex
+                    if neighbor == end:
+                        path = self._build_path(parent, end)
+                        return path, len(path) - 1
+                    queue.append(neighbor)
+        
+        return None, float('inf')  # Tidak ada path
+    
+    def shortest_path_bidirectional(self, start, end):
+        """Shortest path point-to-point dengan BFS dua arah (dari start dan dari end)"""
+        if start not in self.vertices or end not in self.vertices:
+            return None, float('inf')
+        
+        if start == end:
+            return [start], 0
+        
+        reverse = self.reverse_adjacency()
+        forward_parent, backward_parent = {start: None}, {end: None}
+        forward_dist, backward_dist = {start: 0}, {end: 0}
+        forward_frontier, backward_frontier = [start], [end]
+        
+        while forward_frontier and backward_frontier:
+            # Perluas satu level penuh pada sisi dengan frontier lebih kecil
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier, meet = self._expand_level(
+                    forward_frontier, self.graph, forward_parent, forward_dist, backward_dist)
+            else:
+                backward_frontier, meet = self._expand_level(
+                    backward_frontier, reverse, backward_parent, backward_dist, forward_dist)
+            
+            if meet is not None:
+                # Gabungkan path start -> meet dengan path meet -> end
+                path = self._build_path(forward_parent, meet)
+                vertex = backward_parent[meet]
+                while vertex is not None:
+                    path.append(vertex)
+                    vertex = backward_parent[vertex]
+                return path, len(path) - 1
         
         return None, float('inf')  # Tidak ada path
     
+    def _expand_level(self, frontier, adjacency, parent, dist, other_dist):
+        """Memperluas satu level BFS; mengembalikan (frontier baru, titik temu terbaik)"""
+        next_frontier = []
+        meet = None
+        best = float('inf')
+        
+        for vertex in frontier:
+            for neighbor in sorted(adjacency.get(vertex, ())):
+                if neighbor not in dist:
+                    parent[neighbor] = vertex
+                    dist[neighbor] = dist[vertex] + 1
+                    next_frontier.append(neighbor)
+                    
+                    # Level diselesaikan penuh agar titik temu terpendek yang dipilih
+                    if neighbor in other_dist and dist[neighbor] + other_dist[neighbor] < best:
+                        best = dist[neighbor] + other_dist[neighbor]
+                        meet = neighbor
+        
+        return next_frontier, meet
+    
+    def _build_path(self, parent, vertex):
+        """Membangun path dari root sampai vertex dengan mengikuti parent pointer"""
+        path = []
+        while vertex is not None:
+            path.append(vertex)
+            vertex = parent[vertex]
+        return path[::-1]
+    
     def connected_components_bfs(self):
         """Mencari connected components menggunakan BFS"""
         visited = set()
@@ -126,9 +426,86 @@ class BFSGraph:
         
         return components
 
+    def weak_components(self):
+        """Union-find komponen terhubung lemah (arah edge diabaikan)"""
+        if self.components is None:
+            self.components = DisjointSet()
+            for vertex in self.vertices:
+                self.components.add(vertex)
+            for u, neighbors in self.graph.items():
+                for v in neighbors:
+                    self.components.union(u, v)
+        return self.components
+    
+    def weakly_connected_components(self):
+        """Komponen terhubung lemah; diperbarui inkremental oleh add_edge"""
+        return self.weak_components().groups()
+    
+    def same_component(self, u, v):
+        """Apakah u dan v berada pada komponen terhubung lemah yang sama"""
+        return self.weak_components().connected(u, v)
+    
+    def strongly_connected_components(self):
+        """Strongly connected components dengan algoritma Tarjan iteratif (O(V+E)).
+
+        Komponen dikembalikan dalam urutan topologis terbalik dari graf
+        kondensasinya, anggota tiap komponen diurutkan.
+        """
+        index = {}
+        low = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+        
+        for root in sorted(self.vertices):
+            if root in index:
+                continue
+            
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.graph.get(root, ())))]
+            
+            while work:
+                vertex, neighbors = work[-1]
+                for neighbor in neighbors:
+                    if neighbor not in index:
+                        index[neighbor] = low[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(self.graph.get(neighbor, ()))))
+                        break
+                    elif neighbor in on_stack:
+                        low[vertex] = min(low[vertex], index[neighbor])
+                else:
+                    work.pop()
+                    if work:
+                        caller = work[-1][0]
+                        low[caller] = min(low[caller], low[vertex])
+                    
+                    # vertex adalah root dari sebuah SCC
+                    if low[vertex] == index[vertex]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.remove(member)
+                            component.append(member)
+                            if member == vertex:
+                                break
+                        components.append(sorted(component))
+        
+        return components
+
     def visualize_graph(self, title="Graf", highlight_edges=None, highlight_color='red', highlight_levels=None):
         """Visualisasi graf menggunakan NetworkX dan Matplotlib"""
         try:
+            import networkx as nx
+            import matplotlib.pyplot as plt
+            from graph_renderer import LARGE_GRAPH_EDGES, render_graph
+
             # Membuat graf NetworkX
             G = nx.DiGraph()
             
@@ -148,6 +525,28 @@ class BFSGraph:
             # Definisi posisi manual untuk graf yang lebih mudah dipahami
             pos = self._get_better_layout(G)
             
+            # Warna node berdasarkan level, atau endpoint edge highlight (dikumpulkan sekali ke set)
+            color_map = ['lightblue', 'lightgreen', 'lightyellow', 'lightcoral', 'lightpink', 'lightgray']
+            highlighted_nodes = {node for edge in highlight_edges or () for node in edge}
+            node_colors = []
+            for node in G.nodes():
+                if highlight_levels:
+                    node_colors.append(color_map[highlight_levels.get(node, 0) % len(color_map)])
+                elif node in highlighted_nodes:
+                    node_colors.append('lightcoral')
+                else:
+                    node_colors.append('lightblue')
+            
+            if G.number_of_edges() >= LARGE_GRAPH_EDGES:
+                # Graf besar: semua edge dalam satu LineCollection, semua node dalam satu scatter
+                render_graph(plt.gca(), pos, list(G.nodes()), list(G.edges()),
+                             highlight_edges=highlight_edges, highlight_color=highlight_color,
+                             node_colors=dict(zip(G.nodes(), node_colors)))
+                plt.title(title, fontsize=16, fontweight='bold', pad=20)
+                plt.tight_layout()
+                plt.show()
+                return
+            
             # Menggambar semua edges dengan warna abu-abu
             nx.draw_networkx_edges(G, pos, edge_color='lightgray', arrows=True, 
                                  arrowsize=20, arrowstyle='->', width=1.5, alpha=0.6,
@@ -163,19 +562,6 @@ class BFSGraph:
                                          connectionstyle="arc3,rad=0.1")
             
             # Menggambar nodes dengan warna berdasarkan level (jika ada)
-            node_colors = []
-            if highlight_levels:
-                color_map = ['lightblue', 'lightgreen', 'lightyellow', 'lightcoral', 'lightpink', 'lightgray']
-                for node in G.nodes():
-                    level = highlight_levels.get(node, 0)
-                    node_colors.append(color_map[level % len(color_map)])
-            else:
-                for node in G.nodes():
-                    if highlight_edges and any(node in edge for edge in highlight_edges):
-                        node_colors.append('lightcoral')
-                    else:
-                        node_colors.append('lightblue')
-            
             nx.draw_networkx_nodes(G, pos, node_color=node_colors, 
                                  node_size=1200, alpha=0.9, 
                                  edgecolors='black', linewidths=1.5)
@@ -198,6 +584,8 @@ class BFSGraph:
     
     def _get_better_layout(self, G):
         """Membuat layout yang lebih mudah dipahami untuk graf"""
+        from layout_cache import default_cache
+
         # Jika graf kosong, gunakan layout default
         if len(G.nodes()) == 0:
             return {}
@@ -222,12 +610,12 @@ class BFSGraph:
         
         # Untuk graf custom, gunakan hierarchical layout
         try:
-            # Coba gunakan hierarchical layout
-            pos = self._hierarchical_layout(G)
+            # Coba gunakan hierarchical layout (di-cache per struktur graf)
+            pos = default_cache.layout(G, self._hierarchical_layout)
             return pos
         except:
             # Fallback ke spring layout yang lebih stabil
-            return nx.spring_layout(G, k=3, iterations=100, seed=42)
+            return default_cache.spring_layout(G, k=3, iterations=100, seed=42)
     
     def _hierarchical_layout(self, G):
         """Membuat layout hierarkis berdasarkan level dari root"""
@@ -244,24 +632,34 @@ class BFSGraph:
         levels = {}
         visited = set()
         
-        def assign_level(node, level):
-            if node in visited:
+        def assign_level(root, level):
+            # DFS iteratif (urutan sama dengan versi rekursif) agar graf dalam tidak kena batas rekursi
+            if root in visited:
                 return
-            visited.add(node)
-            levels[node] = level
-            
-            for neighbor in G.neighbors(node):
-                if neighbor not in levels:
-                    assign_level(neighbor, level + 1)
+            visited.add(root)
+            levels[root] = level
+            stack = [(root, iter(G.neighbors(root)))]
+            while stack:
+                node, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if neighbor not in levels:
+                        visited.add(neighbor)
+                        levels[neighbor] = levels[node] + 1
+                        stack.append((neighbor, iter(G.neighbors(neighbor))))
+                        break
+                else:
+                    stack.pop()
         
         # Mulai dari semua root nodes
         for root in roots:
             assign_level(root, 0)
         
-        # Assign level untuk isolated nodes
+        # Assign level untuk isolated nodes (level maksimum dihitung sekali, bukan per node)
+        next_level = max(levels.values()) + 1 if levels else 0
         for node in G.nodes():
             if node not in levels:
-                levels[node] = max(levels.values()) + 1 if levels else 0
+                levels[node] = next_level
+                next_level += 1
         
         # Buat posisi berdasarkan level
         level_counts = {}
@@ -353,10 +751,15 @@ def print_bfs_results(g, start_vertex='a'):
     
     # Connected Components
     print("4. CONNECTED COMPONENTS:")
-    components = g.connected_components_bfs()
-    print(f"   Jumlah komponen: {len(components)}")
+    components = g.weakly_connected_components()
+    print(f"   Jumlah komponen (terhubung lemah): {len(components)}")
     for i, component in enumerate(components, 1):
         print(f"   Komponen {i}: {', '.join(component)}")
+    
+    strong_components = g.strongly_connected_components()
+    print(f"   Jumlah komponen (terhubung kuat): {len(strong_components)}")
+    for i, component in enumerate(strong_components, 1):
+        print(f"   Komponen {i}: {', '.join(component)}")
     print()
     
     # Visualisasi Graf Asli
@@ -390,6 +793,27 @@ def input_custom_graph():
     
     return g
 
+def load_graph_from_file():
+    """Memuat graf dari file edge list (u v per baris) atau snapshot biner tanpa input per edge"""
+    from edge_loader import build_graph, load_edge_list
+    from graph_snapshot import is_snapshot, load_graph
+
+    path = input("Path file edge list atau snapshot: ").strip()
+    try:
+        if is_snapshot(path):
+            g = load_graph(path, BFSGraph)  # mmap, tanpa parsing teks maupun adjacency list Python
+            num_edges = g.csr.num_edges()
+        else:
+            edges = load_edge_list(path)
+            g = build_graph(BFSGraph, edges)
+            num_edges = len(edges)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return BFSGraph()
+
+    print(f"✓ {num_edges} edge dan {len(g.vertices)} vertex berhasil dimuat")
+    return g
+
 def main():
     print("="*60)
     print("PROGRAM BFS (BREADTH-FIRST SEARCH)")
@@ -398,31 +822,20 @@ def main():
     print("pip install networkx matplotlib")
     print("="*60)
     
-    # Graf default dari soal
-    default_edges = [
-        ('a', 'b'), ('a', 'd'), ('a', 'e'),
-        ('b', 'c'), ('b', 'd'),
-        ('c', 'h'), ('c', 'g'),
-        ('d', 'f'),
-        ('e', 'd'), ('e', 'f'),
-        ('f', 'j'),
-        ('h', 'g'),
-        ('i', 'g'), ('i', 'h')
-    ]
-    
     while True:
         print("\nMenu:")
         print("1. Gunakan graf default dari soal")
         print("2. Masukkan graf baru")
-        print("3. Keluar")
+        print("3. Muat graf dari file edge list / snapshot")
+        print("4. Keluar")
         
         try:
-            choice = int(input("Masukkan pilihan (1-3): "))
+            choice = int(input("Masukkan pilihan (1-4): "))
         except ValueError:
-            print("Input tidak valid! Masukkan angka 1, 2, atau 3.")
+            print("Input tidak valid! Masukkan angka 1, 2, 3, atau 4.")
             continue
         
-        if choice == 3:
+        if choice == 4:
             print("Terima kasih telah menggunakan program BFS ini!")
             break
         
@@ -433,7 +846,7 @@ def main():
             print("MENGGUNAKAN GRAF DEFAULT DARI SOAL")
             print("="*40)
             
-            for u, v in default_edges:
+            for u, v in DEFAULT_EDGES:
                 g.add_edge(u, v)
             
             print("Graf default berhasil dimuat!")
@@ -459,8 +872,26 @@ def main():
             
             print_bfs_results(g, start_vertex)
         
+        elif choice == 3:
+            # Muat graf dari file
+            print("\n" + "="*40)
+            print("MUAT GRAF DARI FILE")
+            print("="*40)
+            
+            g = load_graph_from_file()
+            
+            if not g.vertices:
+                print("Graf kosong! Kembali ke menu utama.")
+                continue
+            
+            start_vertex = input("Masukkan vertex start untuk BFS Tree (default: vertex terkecil): ").strip()
+            if not start_vertex:
+                start_vertex = min(g.vertices)
+            
+            print_bfs_results(g, start_vertex)
+        
         else:
-            print("Pilihan tidak valid! Masukkan angka 1, 2, atau 3.")
+            print("Pilihan tidak valid! Masukkan angka 1, 2, 3, atau 4.")
 
 if __name__ == "__main__":
     main()
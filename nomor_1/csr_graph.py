@@ -0,0 +1,198 @@
+from array import array
+from bisect import bisect_left
+from collections import deque
+from kahn import collect_order, kahn_order
+
+class CSRGraph:
+    """Representasi graf beku dalam format compressed sparse row (CSR).
+
+    Label vertex di-intern menjadi ID integer padat sesuai urutan terurut
+    label, sehingga mengurutkan ID tetangga sama dengan mengurutkan label.
+    Tetangga tiap vertex u berada di neighbors[offsets[u]:offsets[u + 1]].
+    labels, offsets, neighbors dan weights cukup berupa sequence yang bisa
+    di-index (list, array, memoryview), sehingga bisa langsung memakai
+    data dari snapshot yang di-memory-map (lihat graph_snapshot.py).
+    """
+
+    def __init__(self, labels, offsets, neighbors, weights=None):
+        self.labels = labels  # Label terurut, index = ID vertex
+        self.offsets = offsets  # Panjang len(labels) + 1
+        self.neighbors = neighbors  # Tetangga terurut per vertex
+        self.weights = weights  # Bobot sejajar dengan neighbors (opsional)
+        self.snapshot = None  # (path, posisi bagian) jika dimuat dari graph_snapshot
+
+    @classmethod
+    def from_adjacency(cls, graph, vertices):
+        """Membangun CSR dari adjacency list berlabel (dict vertex -> list)"""
+        labels = sorted(vertices)
+        index = {label: i for i, label in enumerate(labels)}
+        offsets = array('q', [0])
+        neighbors = array('q')
+
+        for label in labels:
+            targets = [index[v] for v in graph.get(label, ())]
+            targets.sort()  # Diurutkan sekali saja saat graf dibekukan
+            neighbors.extend(targets)
+            offsets.append(len(neighbors))
+
+        return cls(labels, offsets, neighbors)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return self.vertex_id(label) >= 0
+
+    def num_edges(self):
+        return len(self.neighbors)
+
+    def vertex_id(self, label):
+        """ID integer dari label, atau -1 jika tidak ada"""
+        i = bisect_left(self.labels, label)
+        if i < len(self.labels) and self.labels[i] == label:
+            return i
+        return -1
+
+    def successors(self, u):
+        """Tetangga terurut dari vertex dengan ID u"""
+        return self.neighbors[self.offsets[u]:self.offsets[u + 1]]
+
+    def out_degree(self, label):
+        """Jumlah edge keluar dari vertex berlabel label (0 jika tidak ada)"""
+        u = self.vertex_id(label)
+        return self.offsets[u + 1] - self.offsets[u] if u >= 0 else 0
+
+    def bfs_tree(self, start):
+        """Breadth-First Search Tree dari vertex start (urutan sama dengan Graph.bfs_tree)"""
+        s = self.vertex_id(start)
+        if s < 0:
+            return None, []
+
+        labels, offsets, neighbors = self.labels, self.offsets, self.neighbors
+        visited = bytearray(len(labels))
+        queue = deque([s])
+        tree_edges = []
+        traversal_order = []
+
+        while queue:
+            u = queue.popleft()
+            if not visited[u]:
+                visited[u] = 1
+                traversal_order.append(labels[u])
+
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = neighbors[i]
+                    if not visited[v]:
+                        tree_edges.append((labels[u], labels[v]))
+                        queue.append(v)
+
+        return tree_edges, traversal_order
+
+    def bfs_layers(self, start):
+        """BFS per level yang menandai vertex saat ditemukan (urutan sama dengan BFSGraph.bfs_tree).
+
+        Mengembalikan (tree_edges, traversal_order, levels), levels: label -> kedalaman.
+        """
+        s = self.vertex_id(start)
+        if s < 0:
+            return None, [], {}
+
+        labels, offsets, neighbors = self.labels, self.offsets, self.neighbors
+        seen = bytearray(len(labels))
+        seen[s] = 1
+        frontier = [s]
+        tree_edges = []
+        traversal_order = []
+        levels = {labels[s]: 0}
+        depth = 0
+
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for u in frontier:
+                label = labels[u]
+                traversal_order.append(label)
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = neighbors[i]
+                    if not seen[v]:
+                        seen[v] = 1
+                        neighbor = labels[v]
+                        tree_edges.append((label, neighbor))
+                        levels[neighbor] = depth
+                        next_frontier.append(v)
+            frontier = next_frontier
+
+        return tree_edges, traversal_order, levels
+
+    def _dfs_visit(self, root, visited, tree_edges, traversal_order):
+        """DFS iteratif dari root dengan urutan kunjungan yang sama seperti versi rekursif"""
+        labels, offsets, neighbors = self.labels, self.offsets, self.neighbors
+        visited[root] = 1
+        traversal_order.append(labels[root])
+        stack = [[root, offsets[root]]]  # [vertex, posisi tetangga berikutnya]
+
+        while stack:
+            frame = stack[-1]
+            u, i = frame
+            end = offsets[u + 1]
+            while i < end and visited[neighbors[i]]:
+                i += 1
+            if i == end:
+                stack.pop()
+                continue
+
+            v = neighbors[i]
+            frame[1] = i + 1
+            visited[v] = 1
+            tree_edges.append((labels[u], labels[v]))
+            traversal_order.append(labels[v])
+            stack.append([v, offsets[v]])
+
+    def dfs_tree(self, start):
+        """Depth-First Search Tree dari vertex start"""
+        s = self.vertex_id(start)
+        if s < 0:
+            return None, []
+
+        visited = bytearray(len(self.labels))
+        tree_edges = []
+        traversal_order = []
+        self._dfs_visit(s, visited, tree_edges, traversal_order)
+        return tree_edges, traversal_order
+
+    def dfs_forest(self):
+        """Depth-First Search Forest untuk seluruh graf"""
+        visited = bytearray(len(self.labels))
+        forest_edges = []
+        forest_order = []
+        trees = []
+
+        # ID vertex sudah mengikuti urutan label terurut
+        for root in range(len(self.labels)):
+            if not visited[root]:
+                current_tree_edges = []
+                current_tree_order = []
+                self._dfs_visit(root, visited, current_tree_edges, current_tree_order)
+                trees.append({
+                    'root': self.labels[root],
+                    'edges': current_tree_edges,
+                    'order': current_tree_order
+                })
+                forest_edges.extend(current_tree_edges)
+                forest_order.extend(current_tree_order)
+
+        return forest_edges, forest_order, trees
+
+    def topological_order_stream(self):
+        """Generator topological sort Kahn; nilai return-nya adalah cycle (jika ada)"""
+        return kahn_order(range(len(self.labels)), self.successors, self.labels)
+
+    def has_cycle(self):
+        """Mengecek apakah graf memiliki cycle"""
+        _, cycle = collect_order(kahn_order(range(len(self.labels)), self.successors))
+        return bool(cycle)
+
+    def topological_sort(self):
+        """Topological Sort menggunakan algoritma Kahn"""
+        order, cycle = collect_order(self.topological_order_stream())
+        return None if cycle else order
@@ -1,6 +1,4 @@
 from collections import defaultdict
-import networkx as nx
-import matplotlib.pyplot as plt
 
 time = 0
 
@@ -48,6 +46,9 @@ def input_graph():
     return graph
 
 def draw_graph(graph, T, B, F, C):
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
     G = nx.DiGraph()
     for u in graph:
         for v in graph[u]:
@@ -1,6 +1,8 @@
 from collections import defaultdict
-import networkx as nx
-import matplotlib.pyplot as plt
+from kahn import collect_order, kahn_order
+from tracing import ConsoleSink
+
+CONSOLE_TRACE_LIMIT = 100  # Batas jumlah vertex untuk mencetak jejak DFS di menu
 
 class DFSGraph:
     def __init__(self):
@@ -11,9 +13,14 @@ class DFSGraph:
         self.colors = {}  # Untuk menyimpan warna vertex
         self.parent = {}  # Untuk menyimpan parent/predecessor
         self.edge_types = {}  # Untuk menyimpan jenis edge (T, B, F, C)
+        self.csr = None  # CSRGraph dari snapshot (graph_snapshot.load_graph), dipakai traversal
     
     def add_edge(self, u, v):
         """Menambahkan edge dari vertex u ke vertex v"""
+        if self.csr is not None:
+            from graph_snapshot import thaw
+            thaw(self)  # View snapshot read-only disalin sekali sebelum graf diubah
+            self.csr = None
         self.graph[u].append(v)
         self.vertices.add(u)
         self.vertices.add(v)
@@ -41,71 +48,93 @@ class DFSGraph:
             self.colors[vertex] = 'white'
             self.parent[vertex] = None
     
-    def dfs_with_timestamps(self, start_vertex=None):
-        """DFS dengan timestamp seperti algoritma pada buku"""
+    def dfs_with_timestamps(self, start_vertex=None, tracer=None, stats=None):
+        """DFS dengan timestamp seperti algoritma pada buku.
+
+        tracer: sink dari tracing.py (mis. ConsoleSink) yang menerima event
+        discover/finish/classify_edge; None = tanpa output.
+        stats: RunStats (instrumentation.py) untuk counter expanded dan edges_scanned.
+        """
         self.reset_dfs_data()
         
         visited_order = []
         tree_edges = []
         
-        def dfs_visit(u):
-            nonlocal visited_order, tree_edges
-            
+        def discover(u, parent=None):
             # Vertex u ditemukan (discovery time)
             self.time += 1
             self.timestamps[u] = [self.time, 0]  # [d[u], f[u]]
             self.colors[u] = 'gray'  # Sedang diproses
             visited_order.append(u)
             
-            print(f"Menemukan vertex {u} pada waktu {self.time}")
+            if tracer:
+                tracer.discover(u, self.time, parent)
+        
+        def dfs_visit(root):
+            # DFS dengan stack eksplisit (tanpa rekursi) agar path panjang
+            # tidak terkena batas rekursi Python
+            discover(root)
+            stack = [(root, iter(sorted(self.graph[root])))]  # Sort untuk konsistensi
             
-            # Eksplorasi semua tetangga u
-            neighbors = sorted(self.graph[u])  # Sort untuk konsistensi
-            for v in neighbors:
-                edge = (u, v)
+            while stack:
+                u, neighbors = stack[-1]
                 
-                if self.colors[v] == 'white':
-                    # Tree edge
-                    self.edge_types[edge] = 'T'
-                    self.parent[v] = u
-                    tree_edges.append(edge)
-                    print(f"  Edge {u} -> {v}: Tree edge (T)")
-                    dfs_visit(v)
+                # Eksplorasi tetangga u yang tersisa
+                for v in neighbors:
+                    edge = (u, v)
                     
-                elif self.colors[v] == 'gray':
-                    # Back edge
-                    self.edge_types[edge] = 'B'
-                    print(f"  Edge {u} -> {v}: Back edge (B)")
-                    
-                elif self.colors[v] == 'black':
-                    # Forward atau Cross edge
-                    if self.timestamps[u][0] < self.timestamps[v][0]:
-                        # Forward edge
-                        self.edge_types[edge] = 'F'
-                        print(f"  Edge {u} -> {v}: Forward edge (F)")
-                    else:
-                        # Cross edge
-                        self.edge_types[edge] = 'C'
-                        print(f"  Edge {u} -> {v}: Cross edge (C)")
-            
-            # Selesai memproses vertex u (finish time)
-            self.colors[u] = 'black'
-            self.time += 1
-            self.timestamps[u][1] = self.time
-            print(f"Selesai memproses vertex {u} pada waktu {self.time}")
+                    if self.colors[v] == 'white':
+                        # Tree edge
+                        self.edge_types[edge] = 'T'
+                        self.parent[v] = u
+                        tree_edges.append(edge)
+                        if tracer:
+                            tracer.classify_edge(u, v, 'T')
+                        discover(v, u)
+                        stack.append((v, iter(sorted(self.graph[v]))))
+                        break
+                        
+                    elif self.colors[v] == 'gray':
+                        # Back edge
+                        self.edge_types[edge] = 'B'
+                        if tracer:
+                            tracer.classify_edge(u, v, 'B')
+                        
+                    elif self.colors[v] == 'black':
+                        # Forward atau Cross edge
+                        if self.timestamps[u][0] < self.timestamps[v][0]:
+                            # Forward edge
+                            self.edge_types[edge] = 'F'
+                            if tracer:
+                                tracer.classify_edge(u, v, 'F')
+                        else:
+                            # Cross edge
+                            self.edge_types[edge] = 'C'
+                            if tracer:
+                                tracer.classify_edge(u, v, 'C')
+                else:
+                    # Selesai memproses vertex u (finish time)
+                    self.colors[u] = 'black'
+                    self.time += 1
+                    self.timestamps[u][1] = self.time
+                    if tracer:
+                        tracer.finish(u, self.time)
+                    stack.pop()
         
         # Mulai DFS dari vertex yang dipilih
         if start_vertex and start_vertex in self.vertices:
             if self.colors[start_vertex] == 'white':
-                print(f"\n=== Memulai DFS dari vertex {start_vertex} ===")
                 dfs_visit(start_vertex)
         
         # Lanjutkan untuk vertex lain yang belum dikunjungi
         for vertex in sorted(self.vertices):
             if self.colors[vertex] == 'white':
-                print(f"\n=== Memulai DFS dari vertex {vertex} (komponen baru) ===")
                 dfs_visit(vertex)
         
+        if stats:
+            # Semua vertex dikunjungi, sehingga setiap edge keluar diperiksa tepat sekali
+            stats.add(expanded=len(visited_order),
+                      edges_scanned=sum(len(self.graph.get(v, ())) for v in visited_order))
         return visited_order, tree_edges
     
     def print_dfs_summary(self):
@@ -135,21 +164,28 @@ class DFSGraph:
         """Mengecek apakah graf memiliki cycle berdasarkan back edges"""
         return any(edge_type == 'B' for edge_type in self.edge_types.values())
     
+    def topological_order_stream(self):
+        """Topological sort Kahn sebagai generator; nilai return-nya adalah cycle (jika ada)"""
+        if self.csr is not None:
+            return self.csr.topological_order_stream()
+        # Urutkan vertices dan neighbors untuk konsistensi
+        return kahn_order(sorted(self.vertices), lambda vertex: sorted(self.graph.get(vertex, ())))
+    
     def topological_sort(self):
-        """Topological Sort berdasarkan finish time"""
-        if self.has_cycle():
+        """Topological Sort (algoritma Kahn); tidak membutuhkan hasil DFS sebelumnya"""
+        order, cycle = collect_order(self.topological_order_stream())
+        if cycle:
             return None
-        
-        # Urutkan vertex berdasarkan finish time secara descending
-        sorted_vertices = sorted(self.vertices, 
-                               key=lambda x: self.timestamps[x][1], 
-                               reverse=True)
-        return sorted_vertices
+        return order
     
     def visualize_graph_with_timestamps(self, title="Graf dengan Timestamps", 
                                       highlight_edges=None, highlight_colors=None):
         """Visualisasi graf dengan timestamps seperti contoh"""
         try:
+            import networkx as nx
+            import matplotlib.pyplot as plt
+            from graph_renderer import LARGE_GRAPH_EDGES, render_graph
+
             # Membuat graf NetworkX
             G = nx.DiGraph()
             
@@ -171,6 +207,7 @@ class DFSGraph:
             # Warna nodes berdasarkan tipe edge atau default
             node_colors = []
             node_labels = {}
+            back_edge_nodes = {node for edge, etype in self.edge_types.items() if etype == 'B' for node in edge}
             
             for node in G.nodes():
                 # Buat label dengan timestamp jika ada
@@ -185,52 +222,57 @@ class DFSGraph:
                     node_colors.append(highlight_colors[node])
                 else:
                     # Warna berdasarkan jenis edges yang terlibat
-                    has_back_edge = any(
-                        (edge[0] == node or edge[1] == node) and self.edge_types.get(edge) == 'B'
-                        for edge in self.edge_types
-                    )
-                    if has_back_edge:
+                    if node in back_edge_nodes:
                         node_colors.append('lightcoral')  # Merah muda untuk nodes dengan back edge
                     else:
                         node_colors.append('lightblue')   # Biru muda untuk nodes biasa
             
-            # Gambar semua edges dengan warna abu-abu terlebih dahulu
-            nx.draw_networkx_edges(G, pos, edge_color='lightgray', arrows=True, 
-                                 arrowsize=20, arrowstyle='->', width=1.5, alpha=0.6,
-                                 connectionstyle="arc3,rad=0.1")
+            edge_colors = {
+                'T': 'blue',    # Tree edges - biru
+                'B': 'red',     # Back edges - merah
+                'F': 'green',   # Forward edges - hijau
+                'C': 'purple'   # Cross edges - ungu
+            }
+            highlight_set = set(highlight_edges or ())
             
-            # Highlight edges berdasarkan tipe
-            if highlight_edges:
-                edge_colors = {
-                    'T': 'blue',    # Tree edges - biru
-                    'B': 'red',     # Back edges - merah
-                    'F': 'green',   # Forward edges - hijau
-                    'C': 'purple'   # Cross edges - ungu
-                }
-                
-                for edge_type, color in edge_colors.items():
-                    edges_of_type = [edge for edge, etype in self.edge_types.items() 
-                                   if etype == edge_type and edge in highlight_edges]
+            if G.number_of_edges() >= LARGE_GRAPH_EDGES:
+                # Graf besar: semua edge dalam satu LineCollection, semua node dalam satu scatter
+                typed = {edge: edge_colors[etype] for edge, etype in self.edge_types.items()
+                         if edge in highlight_set and etype in edge_colors}
+                render_graph(plt.gca(), pos, list(G.nodes()), list(G.edges()), highlight_edges=typed,
+                             node_colors=dict(zip(G.nodes(), node_colors)), labels=node_labels)
+            else:
+                # Gambar semua edges dengan warna abu-abu terlebih dahulu
+                nx.draw_networkx_edges(G, pos, edge_color='lightgray', arrows=True, 
+                                     arrowsize=20, arrowstyle='->', width=1.5, alpha=0.6,
+                                     connectionstyle="arc3,rad=0.1")
+            
+                # Highlight edges berdasarkan tipe
+                if highlight_edges:
+                    for edge_type, color in edge_colors.items():
+                        edges_of_type = [edge for edge, etype in self.edge_types.items() 
+                                       if etype == edge_type and edge in highlight_set]
                     
-                    if edges_of_type:
-                        nx.draw_networkx_edges(G, pos, edgelist=edges_of_type, 
-                                             edge_color=color, arrows=True, 
-                                             arrowsize=20, arrowstyle='->', width=3,
-                                             connectionstyle="arc3,rad=0.1", alpha=0.8)
+                        if edges_of_type:
+                            nx.draw_networkx_edges(G, pos, edgelist=edges_of_type, 
+                                                 edge_color=color, arrows=True, 
+                                                 arrowsize=20, arrowstyle='->', width=3,
+                                                 connectionstyle="arc3,rad=0.1", alpha=0.8)
             
-            # Gambar nodes
-            nx.draw_networkx_nodes(G, pos, node_color=node_colors, 
-                                 node_size=2000, alpha=0.9, 
-                                 edgecolors='black', linewidths=2)
+                # Gambar nodes
+                nx.draw_networkx_nodes(G, pos, node_color=node_colors, 
+                                     node_size=2000, alpha=0.9, 
+                                     edgecolors='black', linewidths=2)
             
-            # Gambar labels dengan timestamps
-            nx.draw_networkx_labels(G, pos, labels=node_labels, 
-                                  font_size=10, font_weight='bold', 
-                                  font_color='black')
+                # Gambar labels dengan timestamps
+                nx.draw_networkx_labels(G, pos, labels=node_labels, 
+                                      font_size=10, font_weight='bold', 
+                                      font_color='black')
             
             # Tambahkan legend untuk jenis edges
             if self.edge_types:
                 legend_elements = []
+                present_types = set(self.edge_types.values())
                 edge_colors = {
                     'T': ('blue', 'Tree edges'),
                     'B': ('red', 'Back edges'), 
@@ -239,7 +281,7 @@ class DFSGraph:
                 }
                 
                 for edge_type, (color, label) in edge_colors.items():
-                    if any(etype == edge_type for etype in self.edge_types.values()):
+                    if edge_type in present_types:
                         legend_elements.append(plt.Line2D([0], [0], color=color, lw=3, label=label))
                 
                 if legend_elements:
@@ -258,6 +300,8 @@ class DFSGraph:
     
     def _get_better_layout(self, G):
         """Layout yang lebih baik untuk visualisasi"""
+        from layout_cache import default_cache
+
         if len(G.nodes()) == 0:
             return {}
         
@@ -281,8 +325,8 @@ class DFSGraph:
             if node_set.issubset(layout_nodes):
                 return {node: positions[node] for node in G.nodes()}
         
-        # Fallback ke spring layout
-        return nx.spring_layout(G, k=3, iterations=100, seed=42)
+        # Fallback ke spring layout (di-cache per struktur graf)
+        return default_cache.spring_layout(G, k=3, iterations=100, seed=42)
 
 def create_default_graph():
     """Membuat graf default dari soal asli"""
@@ -321,6 +365,27 @@ def input_custom_graph():
     
     return g
 
+def load_graph_from_file():
+    """Memuat graf dari file edge list (u v per baris) atau snapshot biner tanpa input per edge"""
+    from edge_loader import build_graph, load_edge_list
+    from graph_snapshot import is_snapshot, load_graph
+
+    path = input("Path file edge list atau snapshot: ").strip()
+    try:
+        if is_snapshot(path):
+            g = load_graph(path, DFSGraph)  # mmap, tanpa parsing teks maupun adjacency list Python
+            num_edges = g.csr.num_edges()
+        else:
+            edges = load_edge_list(path)
+            g = build_graph(DFSGraph, edges)
+            num_edges = len(edges)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return DFSGraph()
+
+    print(f"✓ {num_edges} edge dan {len(g.vertices)} vertex berhasil dimuat")
+    return g
+
 def main():
     print("="*70)
     print("PROGRAM DFS DENGAN TIMESTAMPS DAN KLASIFIKASI EDGES")
@@ -332,15 +397,16 @@ def main():
         print("\nMenu:")
         print("1. Gunakan graf default dari soal")
         print("2. Masukkan graf baru")
-        print("3. Keluar")
+        print("3. Muat graf dari file edge list / snapshot")
+        print("4. Keluar")
         
         try:
-            choice = int(input("Masukkan pilihan (1-3): "))
+            choice = int(input("Masukkan pilihan (1-4): "))
         except ValueError:
             print("Input tidak valid!")
             continue
         
-        if choice == 3:
+        if choice == 4:
             print("Terima kasih!")
             break
         
@@ -367,6 +433,15 @@ def main():
             print(f"GRAF CUSTOM BERHASIL DIBUAT")
             print("="*50)
         
+        elif choice == 3:
+            # Muat graf dari file edge list
+            selected_graph = load_graph_from_file()
+            graph_name = "Graf dari File"
+            
+            if not selected_graph.vertices:
+                print("Graf kosong!")
+                continue
+        
         else:
             print("Pilihan tidak valid!")
             continue
@@ -386,8 +461,9 @@ def main():
         
         print(f"\nMemulai DFS dari vertex: {start_vertex}")
         
-        # Jalankan DFS
-        visited_order, tree_edges = selected_graph.dfs_with_timestamps(start_vertex)
+        # Jalankan DFS; jejak per vertex/edge hanya dicetak untuk graf kecil
+        tracer = ConsoleSink() if len(selected_graph.vertices) <= CONSOLE_TRACE_LIMIT else None
+        visited_order, tree_edges = selected_graph.dfs_with_timestamps(start_vertex, tracer)
         
         # Tampilkan hasil
         selected_graph.print_dfs_summary()
@@ -397,9 +473,10 @@ def main():
         print("TOPOLOGICAL SORT")
         print("="*50)
         
-        topo_result = selected_graph.topological_sort()
-        if topo_result is None:
+        topo_result, cycle = collect_order(selected_graph.topological_order_stream())
+        if cycle:
             print("TIDAK DAPAT DILAKUKAN (Graf memiliki cycle - ada back edges)")
+            print(f"Cycle: {' -> '.join(cycle + cycle[:1])}")
         else:
             print(f"Hasil topological sort: {' -> '.join(topo_result)}")
         
@@ -0,0 +1,290 @@
+"""Loader edge list berukuran besar (jutaan baris) tanpa input() per edge.
+
+File di-memory-map lalu diproses per chunk: setiap chunk dipecah menjadi
+token sekaligus, label di-intern dengan np.unique, dan bobot dikonversi
+secara vektor. Format yang didukung: satu edge per baris "u v" atau
+"u v w", dipisah spasi, tab, koma atau titik koma. Baris kosong dan baris
+yang diawali '#' diabaikan.
+"""
+import mmap
+import re
+import warnings
+from array import array
+
+import numpy as np
+
+from csr_graph import CSRGraph
+
+CHUNK_SIZE = 16 * 1024 * 1024  # Byte per chunk
+_SEPARATORS = bytes.maketrans(b',;\t\r', b'    ')
+_NUMERIC_CHUNK = re.compile(rb'[0-9 \n.eE+\-]*')
+_WHITESPACE = np.frombuffer(b' \n\x0b\x0c', dtype=np.uint8)  # Pemisah bytes.split() setelah _SEPARATORS
+
+class EdgeList:
+    """Edge list hasil parsing: label terurut dan array ID integer"""
+    def __init__(self, labels, src, dst, weights=None):
+        self.labels = labels  # list label (str), terurut; index = ID
+        self.src = src  # np.int64, panjang E
+        self.dst = dst
+        self.weights = weights  # None untuk graf tanpa bobot
+
+    def __len__(self):
+        return len(self.src)
+
+def _chunks(mm, chunk_size):
+    """Memotong isi file per chunk pada batas baris"""
+    start = 0
+    size = len(mm)
+    while start < size:
+        end = min(start + chunk_size, size)
+        if end < size:
+            newline = mm.rfind(b'\n', start, end)
+            end = newline + 1 if newline >= start else mm.find(b'\n', end) + 1 or size
+        yield mm[start:end]
+        start = end
+
+def _tokenize(chunk, columns):
+    """Token semua baris data di satu chunk; baris kosong/spasi saja dan komentar dilewati.
+
+    ValueError jika ada baris data yang jumlah kolomnya bukan columns.
+    """
+    if b'#' in chunk:
+        # Jalur lambat hanya untuk chunk yang berisi komentar
+        rows = [fields for fields in map(bytes.split, chunk.split(b'\n'))
+                if fields and not fields[0].startswith(b'#')]
+        for fields in rows:
+            if len(fields) != columns:
+                raise ValueError(f"Format salah! Setiap baris harus berisi {columns} kolom: {b' '.join(fields)!r}")
+        return [token for fields in rows for token in fields]
+
+    # Jumlah token per baris dihitung dengan NumPy: awal token = byte non-spasi setelah spasi
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    blank = np.isin(data, _WHITESPACE)
+    starts = ~blank
+    starts[1:] &= blank[:-1]
+    per_line = np.bincount(np.cumsum(data == ord('\n'))[starts])
+    bad = np.flatnonzero((per_line != 0) & (per_line != columns))
+    if len(bad):
+        line = chunk.split(b'\n')[bad[0]]
+        raise ValueError(f"Format salah! Setiap baris harus berisi {columns} kolom: {line.strip()!r}")
+    return chunk.split()
+
+def _parse_numeric(chunk, columns):
+    """Jalur cepat untuk chunk yang hanya berisi angka, tanpa memecah token di Python.
+
+    Mengembalikan (label integer per endpoint, bobot) atau None jika chunk
+    harus diproses sebagai teks biasa (label non-angka, label seperti "007"
+    yang harus tetap teks, atau jumlah kolom yang tidak konsisten).
+    """
+    if not _NUMERIC_CHUNK.fullmatch(chunk):
+        return None
+
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    blank = (data == ord(' ')) | (data == ord('\n'))
+    starts = np.flatnonzero(~blank & np.concatenate(([True], blank[:-1])))
+    if len(starts) == 0:
+        return None
+    following = data[np.minimum(starts + 1, len(data) - 1)]
+    if np.any((data[starts] == ord('0')) & (following >= ord('0')) & (following <= ord('9'))
+              & (starts + 1 < len(data))):
+        return None
+
+    # Jumlah token per baris; baris kosong (0 token) diizinkan
+    line_ends = np.append(np.flatnonzero(data == ord('\n')), len(data))
+    per_line = np.diff(np.searchsorted(starts, line_ends), prepend=0)
+    if np.any((per_line != 0) & (per_line != columns)):
+        return None
+
+    # Token label hanya boleh berisi digit; tanda, titik dan eksponen hanya untuk bobot
+    signs = np.flatnonzero(~blank & ((data < ord('0')) | (data > ord('9'))))
+    token_column = (np.searchsorted(starts, signs, side='right') - 1) % columns
+    if np.any(token_column < 2):
+        return None
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        try:
+            values = np.fromstring(chunk, dtype=np.float64, sep=' ')
+        except (ValueError, DeprecationWarning):
+            return None
+    if len(values) != len(starts):
+        return None
+
+    table = values.reshape(-1, columns)
+    endpoints = table[:, :2].ravel()
+    ints = endpoints.astype(np.int64)
+    if not np.array_equal(ints, endpoints) or np.abs(ints).max() >= 2 ** 53:
+        return None
+    weights = None
+    if columns == 3:
+        weights = table[:, 2]
+        if not (b'.' in chunk or b'e' in chunk or b'E' in chunk):
+            weights = weights.astype(np.int64)
+    return ints, weights
+
+def _detect_columns(mm):
+    """Jumlah kolom dari baris data pertama (bukan kosong/komentar)"""
+    for line in iter(mm.readline, b''):
+        fields = line.translate(_SEPARATORS).split()
+        if fields and not fields[0].startswith(b'#'):
+            if len(fields) not in (2, 3):
+                raise ValueError(f"Format salah! Baris harus 'u v' atau 'u v w': {line!r}")
+            return len(fields)
+    return None
+
+def load_edge_list(path, weighted=None, chunk_size=CHUNK_SIZE):
+    """Memuat file edge list; weighted=None berarti dideteksi dari baris pertama"""
+    numeric_parts = []  # Endpoint integer dari chunk jalur cepat
+    text_parts = []  # (label unik bytes, inverse) dari chunk jalur teks
+    parts = []  # (jenis, index) sesuai urutan chunk di file
+    weight_parts = []
+
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # File kosong tidak bisa di-mmap
+            mm = None
+        columns = None if weighted is None else (3 if weighted else 2)
+        if mm is not None and columns is None:
+            columns = _detect_columns(mm)
+        if mm is None or columns is None:
+            return EdgeList([], np.empty(0, np.int64), np.empty(0, np.int64),
+                            np.empty(0, np.int64) if columns == 3 else None)
+
+        with mm:
+            for chunk in _chunks(mm, chunk_size):
+                chunk = chunk.translate(_SEPARATORS)
+                numeric = None if b'#' in chunk else _parse_numeric(chunk, columns)
+                if numeric is not None:
+                    endpoints, weights = numeric
+                    parts.append((numeric_parts, len(numeric_parts)))
+                    numeric_parts.append(endpoints)
+                else:
+                    tokens = _tokenize(chunk, columns)
+                    if not tokens:
+                        continue
+                    table = np.array(tokens, dtype=bytes).reshape(-1, columns)
+                    parts.append((text_parts, len(text_parts)))
+                    text_parts.append(np.unique(table[:, :2].ravel(), return_inverse=True))
+                    weights = None
+                    if columns == 3:
+                        try:
+                            weights = table[:, 2].astype(np.int64)
+                        except ValueError:
+                            weights = table[:, 2].astype(np.float64)
+                if columns == 3:
+                    weight_parts.append(weights)
+
+    if not parts:
+        return EdgeList([], np.empty(0, np.int64), np.empty(0, np.int64),
+                        np.empty(0, np.int64) if columns == 3 else None)
+
+    if not text_parts:
+        # Semua chunk numerik: intern sekaligus dengan np.unique atas integer
+        unique, inverse = np.unique(np.concatenate(numeric_parts), return_inverse=True)
+        raw_labels = [str(label) for label in unique.tolist()]
+        ids = inverse
+    else:
+        # Campuran: intern per chunk lewat dict; Python hanya menyentuh label unik
+        index = {}
+        chunk_ids = []
+        for kind, i in parts:
+            if kind is numeric_parts:
+                unique, inverse = np.unique(numeric_parts[i], return_inverse=True)
+                keys = [str(label).encode() for label in unique.tolist()]
+            else:
+                unique, inverse = text_parts[i]
+                keys = unique.tolist()
+            mapping = np.fromiter((index.setdefault(key, len(index)) for key in keys),
+                                  dtype=np.int64, count=len(keys))
+            chunk_ids.append(mapping[inverse])
+        raw_labels = [label.decode('utf-8') for label in index]
+        ids = np.concatenate(chunk_ids)
+
+    # Urutkan label agar ID mengikuti urutan label (sama seperti CSRGraph)
+    order = sorted(range(len(raw_labels)), key=raw_labels.__getitem__)
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+
+    labels = [raw_labels[i] for i in order]
+    pairs = rank[ids].reshape(-1, 2)
+    weights = np.concatenate(weight_parts) if columns == 3 else None
+    return EdgeList(labels, pairs[:, 0], pairs[:, 1], weights)
+
+def to_csr(edges):
+    """CSRGraph langsung dari edge list (tanpa adjacency list Python)"""
+    n = len(edges.labels)
+    # Tetangga terurut per vertex: urutkan menurut (src, dst)
+    if n * n < 2 ** 63:
+        order = np.argsort(edges.src * n + edges.dst, kind='stable')
+    else:
+        order = np.lexsort((edges.dst, edges.src))
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(edges.src, minlength=n), out=offsets[1:])
+
+    offsets_array, neighbors_array = array('q'), array('q')
+    offsets_array.frombytes(offsets.tobytes())
+    neighbors_array.frombytes(edges.dst[order].astype(np.int64).tobytes())
+
+    weights_array = None
+    if edges.weights is not None:
+        weights = edges.weights[order]
+        weights_array = array('d' if weights.dtype.kind == 'f' else 'q')
+        weights_array.frombytes(weights.astype(weights_array.typecode).tobytes())
+    return CSRGraph(edges.labels, offsets_array, neighbors_array, weights_array)
+
+def build_graph(graph_cls, edges):
+    """Mengisi Graph/BFSGraph/DFSGraph dari edge list; urutan edge per vertex sesuai file"""
+    g = graph_cls()
+    labels = np.array(edges.labels, dtype=object)
+    order = np.argsort(edges.src, kind='stable')
+    counts = np.bincount(edges.src, minlength=len(labels))
+    targets = np.split(labels[edges.dst[order]], np.cumsum(counts)[:-1])
+
+    for label, count, group in zip(edges.labels, counts.tolist(), targets):
+        if count:
+            g.graph[label] = group.tolist()
+    g.vertices.update(edges.labels)
+    return g
+
+def build_weighted_graph(graph_cls, edges):
+    """Mengisi Graph berbobot nomor_2 ([u, v, w] per edge); bobot default 1"""
+    g = graph_cls(len(edges.labels))
+    labels = edges.labels
+    weights = edges.weights.tolist() if edges.weights is not None else [1] * len(edges)
+    g.graph = [[labels[u], labels[v], w]
+               for u, v, w in zip(edges.src.tolist(), edges.dst.tolist(), weights)]
+    if hasattr(g, 'interned'):
+        # Array ID loader dipakai langsung oleh kruskal_engine, tanpa intern ulang label
+        ids_weights = edges.weights if edges.weights is not None else np.ones(len(edges), dtype=np.int64)
+        g.interned.assign(labels, edges.src, edges.dst, ids_weights)
+    if hasattr(g, 'vertices_set'):
+        g.vertices_set.update(labels)
+        g.V = len(g.vertices_set)
+    return g
+
+def create_graph_from_file(graph_cls):
+    """Menu nomor_2: meminta path file edge list berbobot lalu membangun graph_cls.
+
+    Label diubah ke huruf besar seperti input manual; Graph kosong jika file
+    tidak bisa dibaca.
+    """
+    path = input("\nPath file edge list (format per baris: u v w): ").strip()
+    try:
+        edges = load_edge_list(path, weighted=True)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return graph_cls(0)
+    edges.labels = [label.upper() for label in edges.labels]
+    g = build_weighted_graph(graph_cls, edges)
+    print(f"{len(edges)} edges dan {len(edges.labels)} vertices dimuat dari {path}")
+    return g
+
+def to_dijkstra_input(edges):
+    """node_map dan edges_huruf untuk dijkstra_and_plot (nomor_3)"""
+    node_map = {label: i for i, label in enumerate(edges.labels)}
+    labels = edges.labels
+    weights = edges.weights.tolist() if edges.weights is not None else [1] * len(edges)
+    edges_huruf = [[labels[u], labels[v], w]
+                   for u, v, w in zip(edges.src.tolist(), edges.dst.tolist(), weights)]
+    return node_map, edges_huruf
@@ -0,0 +1,161 @@
+"""Pipeline streaming edge: baca per chunk -> terapkan per batch -> delta.
+
+Edge dibaca dari stdin atau file secara bertahap (teks mentah tidak pernah
+disimpan utuh di memori), lalu diterapkan ke BFSGraph per batch. Selama
+edge masuk, StreamingGraph memperbarui secara online:
+  - jarak BFS dari root (vertex yang baru tercapai atau jaraknya mengecil);
+  - komponen terhubung lemah melalui union-find BFSGraph.
+Setiap batch menghasilkan satu delta berisi perubahan tersebut.
+
+Contoh:
+    cat edges.txt | python edge_stream.py --root a
+"""
+import sys
+from collections import deque
+
+from bfs_graph import BFSGraph
+
+CHUNK_SIZE = 1 << 20  # Byte per pembacaan
+BATCH_SIZE = 10000  # Edge per batch (maksimum)
+_SEPARATORS = bytes.maketrans(b',;\t\r', b'    ')
+
+def _parse_line(line):
+    """(u, v) dari satu baris, atau None untuk baris kosong/komentar"""
+    fields = line.translate(_SEPARATORS).split()
+    if not fields or fields[0].startswith(b'#'):
+        return None
+    if len(fields) not in (2, 3):
+        raise ValueError(f"Format salah! Baris harus 'u v' atau 'u v w': {line!r}")
+    return fields[0].decode('utf-8'), fields[1].decode('utf-8')
+
+def read_edge_batches(stream, batch_size=BATCH_SIZE, chunk_size=CHUNK_SIZE):
+    """Generator batch edge [(u, v), ...] dari stream biner.
+
+    Batch dikirim saat penuh atau saat data yang tersedia sudah habis
+    dibaca, sehingga stream yang lambat (mis. pipe) tidak menunggu batch
+    penuh. Hanya satu chunk dan sisa baris terakhir yang disimpan.
+    """
+    read = getattr(stream, 'read1', stream.read)  # read1: kembali segera dengan data yang ada
+    pending = b''
+    batch = []
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()  # Baris terakhir mungkin belum lengkap
+        for line in lines:
+            edge = _parse_line(line)
+            if edge is not None:
+                batch.append(edge)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+            batch = []
+
+    edge = _parse_line(pending)
+    if edge is not None:
+        yield [edge]
+
+class StreamingGraph:
+    """BFSGraph dengan jarak BFS dari root dan komponen lemah yang diperbarui per edge"""
+    def __init__(self, root=None, graph=None):
+        self.graph = graph if graph is not None else BFSGraph()
+        self.root = root
+        self.depth = {}  # Vertex tercapai dari root -> jarak BFS
+        self.components = self.graph.weak_components()  # Diperbarui oleh add_edge
+        self.num_components = len(self.components.groups())
+        self.batches = 0
+
+        if root is not None:
+            self.depth[root] = 0
+            self._relax([(1, v) for v in self.graph.graph.get(root, ())], {})
+
+    def _relax(self, seeds, changed):
+        """Menurunkan jarak vertex dari daftar (jarak kandidat, vertex) dan meneruskannya.
+
+        Seed diproses terurut bersama antrian BFS (keduanya tidak menurun),
+        sehingga setiap vertex diperbarui paling banyak sekali per batch.
+        """
+        depth = self.depth
+        adjacency = self.graph.graph
+        seeds.sort(key=lambda seed: seed[0])
+        queue = deque()
+        i = 0
+        while i < len(seeds) or queue:
+            if queue and (i == len(seeds) or queue[0][0] <= seeds[i][0]):
+                d, x = queue.popleft()
+            else:
+                d, x = seeds[i]
+                i += 1
+            if depth.get(x, d + 1) <= d:
+                continue
+            depth[x] = d
+            changed[x] = d
+            for y in adjacency.get(x, ()):
+                if depth.get(y, d + 2) > d + 1:
+                    queue.append((d + 1, y))
+
+    def apply(self, edges):
+        """Menerapkan satu batch edge; mengembalikan delta perubahan"""
+        graph, components, depth = self.graph, self.components, self.depth
+        new_vertices = []
+        seen = set()
+        merged = []  # (representatif lama, representatif baru) sesuai urutan kejadian
+        reached = {}  # Vertex -> jarak baru dari root
+
+        for u, v in edges:
+            for x in (u, v):
+                if x not in graph.vertices and x not in seen:
+                    seen.add(x)
+                    new_vertices.append(x)
+                    self.num_components += 1
+            ru, rv = components.find(u), components.find(v)
+
+            graph.add_edge(u, v)
+
+            if ru != rv:
+                root = components.find(u)
+                merged.append((rv if root == ru else ru, root))
+                self.num_components -= 1
+
+        # Jarak BFS diperbarui sekali untuk seluruh batch
+        seeds = [(depth[u] + 1, v) for u, v in edges if u in depth]
+        self._relax(seeds, reached)
+
+        self.batches += 1
+        return {
+            'batch': self.batches,
+            'edges': len(edges),
+            'new_vertices': new_vertices,
+            'reached': reached,
+            'merged': merged,
+            'num_reached': len(depth),
+            'num_components': self.num_components,
+        }
+
+def stream_deltas(batches, root=None, graph=None):
+    """Tahap pipeline: batch edge -> delta per batch"""
+    state = StreamingGraph(root, graph)
+    for batch in batches:
+        yield state.apply(batch)
+
+def main():
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="BFS dan komponen online dari stream edge (output JSON lines)")
+    parser.add_argument('input', nargs='?', help="File edge list (default: stdin)")
+    parser.add_argument('--root', help="Root untuk jarak BFS")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    stream = open(args.input, 'rb') if args.input else sys.stdin.buffer
+    with stream:
+        for delta in stream_deltas(read_edge_batches(stream, args.batch_size), args.root):
+            print(json.dumps(delta, ensure_ascii=False), flush=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Renderer graf besar untuk Matplotlib.
+
+nx.draw_networkx_edges membuat satu patch per edge, sehingga graf dengan
+ribuan edge butuh waktu sangat lama untuk digambar. Renderer ini:
+  - menggabungkan semua edge ke satu LineCollection (ditambah satu
+    LineCollection untuk edge yang di-highlight);
+  - menggambar semua node dengan satu scatter;
+  - menghitung keanggotaan highlight dengan set (O(V + E));
+  - pada mode level-of-detail (LOD) untuk graf >= LOD_EDGES edge, edge
+    di-rasterize sendiri dengan NumPy menjadi citra kepadatan (satu imshow
+    per warna), node di-rasterize, serta panah dan label dihilangkan.
+    Agg menggambar garis sebanding dengan jumlah piksel yang dilewati,
+    sehingga ratusan ribu garis panjang tetap lambat walau dalam satu
+    LineCollection; citra kepadatan tidak bergantung pada panjang edge.
+"""
+import numpy as np
+
+LARGE_GRAPH_EDGES = 2000  # visualize_graph memakai renderer ini mulai dari jumlah edge ini
+LOD_EDGES = 100000  # Mode level-of-detail mulai dari jumlah edge ini
+LABEL_LIMIT = 200  # Label node hanya digambar jika jumlah node tidak lebih dari ini
+ARROW_LIMIT = 3000  # Panah (satu quiver) hanya digambar jika jumlah edge tidak lebih dari ini
+LOD_RESOLUTION = 768  # Ukuran citra kepadatan edge (piksel per sisi)
+_SAMPLE_BATCH = 1 << 22  # Titik sampel per batch saat rasterisasi
+
+def _segments(coords, src, dst):
+    """Array (E, 2, 2) berisi titik awal dan akhir setiap edge"""
+    return np.stack((coords[src], coords[dst]), axis=1)
+
+def _density(start, end, extent, resolution):
+    """Jumlah edge yang melewati setiap piksel, dari titik sampel di sepanjang edge"""
+    x0, x1, y0, y1 = extent
+    sx, sy = (resolution - 1) / (x1 - x0), (resolution - 1) / (y1 - y0)
+    ax = ((start[:, 0] - x0) * sx).astype(np.float32)
+    ay = ((start[:, 1] - y0) * sy).astype(np.float32)
+    dx = ((end[:, 0] - x0) * sx).astype(np.float32) - ax
+    dy = ((end[:, 1] - y0) * sy).astype(np.float32) - ay
+    # Satu sampel per piksel sepanjang sumbu terpanjang edge
+    samples = np.ceil(np.maximum(np.abs(dx), np.abs(dy))).astype(np.int64) + 1
+    ends = np.cumsum(samples)
+    counts = np.zeros(resolution * resolution, dtype=np.int64)
+    lo = 0
+    while lo < len(samples):
+        # Batch edge dengan total sampel sekitar _SAMPLE_BATCH
+        base = ends[lo - 1] if lo else 0
+        hi = max(lo + 1, int(np.searchsorted(ends, base + _SAMPLE_BATCH, side='right')))
+        k = samples[lo:hi]
+        n = int(ends[hi - 1] - base)
+        offset = np.arange(n, dtype=np.float32) - np.repeat((ends[lo:hi] - k - base).astype(np.float32), k)
+        t = offset * np.repeat((1 / np.maximum(k - 1, 1)).astype(np.float32), k)
+        x = np.repeat(ax[lo:hi], k)
+        x += t * np.repeat(dx[lo:hi], k)
+        y = np.repeat(ay[lo:hi], k)
+        y += t * np.repeat(dy[lo:hi], k)
+        cells = np.rint(y).astype(np.int32)
+        cells *= resolution
+        cells += np.rint(x).astype(np.int32)
+        # Satu edge dihitung sekali per piksel; sampel segaris yang sepiksel selalu berurutan
+        keep = np.empty(n, dtype=bool)
+        keep[0] = True
+        np.not_equal(cells[1:], cells[:-1], out=keep[1:])
+        keep[1:] |= offset[1:] == 0
+        counts += np.bincount(cells[keep], minlength=counts.size)
+        lo = hi
+    return counts.reshape(resolution, resolution)
+
+def _density_layer(ax, start, end, extent, color, alpha, resolution, zorder):
+    """Citra RGBA satu warna; transparansi mengikuti log kepadatan edge"""
+    from matplotlib.colors import to_rgb
+
+    counts = _density(start, end, extent, resolution)
+    image = np.zeros(counts.shape + (4,))
+    image[..., :3] = to_rgb(color)
+    level = np.log1p(counts)
+    if level.max() > 0:
+        image[..., 3] = alpha * (0.25 + 0.75 * level / level.max()) * (counts > 0)
+    return ax.imshow(image, origin='lower', extent=extent, interpolation='nearest',
+                     aspect='auto', zorder=zorder)
+
+def render_graph(ax, pos, nodes, edges, highlight_edges=None, highlight_color='red',
+                 node_colors=None, highlight_node_color='lightcoral', node_color='lightblue',
+                 labels=None, lod=None, directed=True, resolution=LOD_RESOLUTION):
+    """Menggambar graf ke ax; mengembalikan dict artist yang dibuat.
+
+    nodes           : list node
+    edges           : list (u, v)
+    highlight_edges : iterable (u, v) (warna highlight_color) atau dict (u, v) -> warna
+    node_colors     : dict node -> warna; default: node_color, atau
+                      highlight_node_color untuk node yang menyentuh edge highlight
+    labels          : dict node -> teks label (default: nama node)
+    lod             : paksa/matikan mode level-of-detail (default: otomatis)
+    resolution      : ukuran citra kepadatan edge pada mode LOD
+    """
+    from matplotlib.collections import LineCollection
+
+    if lod is None:
+        lod = len(edges) >= LOD_EDGES
+
+    index = {node: i for i, node in enumerate(nodes)}
+    coords = np.array([pos[node] for node in nodes], dtype=float).reshape(-1, 2)
+    src = np.fromiter((index[u] for u, _ in edges), dtype=np.int64, count=len(edges))
+    dst = np.fromiter((index[v] for _, v in edges), dtype=np.int64, count=len(edges))
+
+    # Keanggotaan highlight: satu lookup set/dict per edge
+    if highlight_edges is None:
+        highlight_edges = {}
+    elif not isinstance(highlight_edges, dict):
+        highlight_edges = dict.fromkeys(highlight_edges, highlight_color)
+    mask = np.fromiter((edge in highlight_edges for edge in edges), dtype=bool, count=len(edges))
+
+    artists = {}
+    plain = np.flatnonzero(~mask)
+    marked = np.flatnonzero(mask)
+    if lod and len(coords):
+        # Satu citra untuk edge biasa dan satu per warna highlight
+        low, high = coords.min(axis=0), coords.max(axis=0)
+        pad = np.maximum((high - low) * 0.02, 1e-9)
+        extent = (low[0] - pad[0], high[0] + pad[0], low[1] - pad[1], high[1] + pad[1])
+        artists['edges'] = _density_layer(ax, coords[src[plain]], coords[dst[plain]], extent,
+                                          'gray', 0.8, resolution, zorder=1)
+        by_color = {}
+        for i in marked:
+            by_color.setdefault(highlight_edges[edges[i]], []).append(i)
+        artists['highlight_edges'] = [
+            _density_layer(ax, coords[src[group]], coords[dst[group]], extent, color, 1.0, resolution, zorder=2)
+            for color, group in by_color.items()
+        ]
+    else:
+        base = LineCollection(_segments(coords, src[plain], dst[plain]),
+                              colors='lightgray', linewidths=1.0, alpha=0.6, zorder=1)
+        artists['edges'] = ax.add_collection(base)
+        if len(marked):
+            colors = [highlight_edges[edges[i]] for i in marked]
+            top = LineCollection(_segments(coords, src[marked], dst[marked]),
+                                 colors=colors, linewidths=2.5, zorder=2)
+            artists['highlight_edges'] = ax.add_collection(top)
+
+    # Arah edge: satu quiver di tengah setiap edge
+    if directed and not lod and 0 < len(edges) <= ARROW_LIMIT:
+        start, end = coords[src], coords[dst]
+        middle = (start + end) / 2
+        # Panjang panah tetap (1% diagonal graf), hanya arahnya yang mengikuti edge
+        delta = end - start
+        length = np.hypot(delta[:, 0], delta[:, 1])
+        delta *= (0.01 * np.hypot(*np.ptp(coords, axis=0)) / np.where(length > 0, length, 1))[:, None]
+        arrow_colors = ['gray'] * len(edges)
+        for i in marked:
+            arrow_colors[i] = highlight_edges[edges[i]]
+        artists['arrows'] = ax.quiver(middle[:, 0], middle[:, 1], delta[:, 0], delta[:, 1],
+                                      color=arrow_colors, angles='xy', scale_units='xy', scale=1,
+                                      width=0.002, headwidth=6, zorder=2)
+
+    # Warna node: endpoint edge highlight dikumpulkan sekali ke dalam set
+    if node_colors is None:
+        touched = {x for edge in highlight_edges for x in edge}
+        colors = [highlight_node_color if node in touched else node_color for node in nodes]
+    else:
+        colors = [node_colors.get(node, node_color) for node in nodes]
+    size = max(4.0, min(300.0, 30000.0 / max(len(nodes), 1)))
+    artists['nodes'] = ax.scatter(coords[:, 0], coords[:, 1], s=size, c=colors,
+                                  edgecolors='none' if lod else 'black',
+                                  linewidths=0 if lod else 0.8, rasterized=lod, zorder=3)
+
+    if not lod and len(nodes) <= LABEL_LIMIT:
+        labels = labels or {}
+        artists['labels'] = [ax.text(x, y, str(labels.get(node, node)), ha='center', va='center',
+                                     fontsize=9, fontweight='bold', zorder=4)
+                             for node, (x, y) in zip(nodes, coords)]
+
+    if len(coords):
+        ax.update_datalim(coords)
+        ax.autoscale_view()
+    ax.set_axis_off()
+    return artists
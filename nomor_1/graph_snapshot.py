@@ -0,0 +1,260 @@
+"""Snapshot biner graf (format CSR) yang dimuat dengan mmap tanpa menyalin data.
+
+Tata letak file (little-endian, setiap bagian dimulai pada kelipatan 8 byte):
+
+    header         : magic, versi, flag, jumlah vertex n, jumlah edge m,
+                     panjang blob label (lihat _HEADER)
+    offsets        : int64[n + 1]
+    neighbors      : int64[m]
+    weights        : int64[m] atau float64[m] (hanya jika FLAG_WEIGHTED)
+    label_offsets  : int64[n + 1], posisi label i di blob = [lo[i], lo[i + 1])
+    label_blob     : label UTF-8 disambung, terurut
+
+Saat dimuat, offsets/neighbors/weights adalah memoryview di atas mmap
+sehingga startup tidak bergantung pada ukuran graf dan beberapa proses
+yang memuat file yang sama berbagi halaman memori (page cache) yang sama.
+Label di-decode satu per satu hanya ketika diakses.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Mapping, Sequence, Set
+
+from csr_graph import CSRGraph
+
+MAGIC = b'KLPGRAF\0'
+VERSION = 1
+FLAG_WEIGHTED = 1
+FLAG_FLOAT_WEIGHTS = 2
+
+# magic, versi, flag, cadangan, n, m, panjang blob label
+_HEADER = struct.Struct('<8sHHIqqq')
+_HEADER_SIZE = 64  # Header diberi padding agar array berikutnya sejajar 8 byte
+
+def _padding(size):
+    return -size % 8
+
+class SnapshotLabels(Sequence):
+    """Label terurut yang dibaca langsung dari blob di mmap (decode saat diakses)"""
+    def __init__(self, offsets, blob):
+        self.offsets = offsets  # memoryview int64[n + 1]
+        self.blob = blob  # memoryview bytes
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("index label di luar jangkauan")
+        return str(self.blob[self.offsets[i]:self.offsets[i + 1]], 'utf-8')
+
+    def index(self, label, start=0, stop=None):
+        """Pencarian biner (label sudah terurut), bukan pencarian linear"""
+        stop = len(self) if stop is None else stop
+        i = bisect_left(self, label, start, stop)
+        if i < stop and self[i] == label:
+            return i
+        raise ValueError(f"{label!r} tidak ada di snapshot")
+
+    def __contains__(self, label):
+        try:
+            self.index(label)
+        except ValueError:
+            return False
+        return True
+
+def _as_csr(graph):
+    """CSRGraph dari CSRGraph, Graph/BFSGraph/DFSGraph atau EdgeList (edge_loader)"""
+    if isinstance(graph, CSRGraph):
+        return graph
+    if getattr(graph, 'csr', None) is not None:
+        return graph.csr
+    if hasattr(graph, 'src'):
+        from edge_loader import to_csr
+        return to_csr(graph)
+    return CSRGraph.from_adjacency(graph.graph, graph.vertices)
+
+def _little_endian(values, typecode):
+    data = array(typecode, values)
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return data
+
+def save_snapshot(path, graph):
+    """Menyimpan graf ke file snapshot biner"""
+    csr = _as_csr(graph)
+    labels = list(csr.labels)
+    if not all(isinstance(label, str) for label in labels):
+        raise TypeError("Snapshot hanya mendukung label bertipe str")
+
+    encoded = [label.encode('utf-8') for label in labels]
+    label_offsets = [0]
+    for label in encoded:
+        label_offsets.append(label_offsets[-1] + len(label))
+    blob = b''.join(encoded)
+
+    flags = 0
+    sections = [_little_endian(csr.offsets, 'q'), _little_endian(csr.neighbors, 'q')]
+    if csr.weights is not None:
+        is_float = any(isinstance(w, float) for w in csr.weights)
+        flags |= FLAG_WEIGHTED | (FLAG_FLOAT_WEIGHTS if is_float else 0)
+        sections.append(_little_endian(csr.weights, 'd' if is_float else 'q'))
+    sections.append(_little_endian(label_offsets, 'q'))
+
+    header = _HEADER.pack(MAGIC, VERSION, flags, 0, len(labels), len(csr.neighbors), len(blob))
+    with open(path, 'wb') as f:
+        f.write(header.ljust(_HEADER_SIZE, b'\0'))
+        for section in sections:
+            section.tofile(f)  # Panjang setiap array int64/float64 kelipatan 8 byte
+        f.write(blob)
+
+def is_snapshot(path):
+    """True jika path adalah file snapshot graf (dicek dari magic di header)"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+def load_snapshot(path):
+    """Memuat snapshot sebagai CSRGraph berbasis mmap (zero-copy)"""
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(mm) < _HEADER_SIZE:
+        raise ValueError(f"{path} bukan snapshot graf (file terlalu pendek)")
+    magic, version, flags, _, n, m, blob_size = _HEADER.unpack_from(mm)
+    if magic != MAGIC:
+        raise ValueError(f"{path} bukan snapshot graf")
+    if version != VERSION:
+        raise ValueError(f"Versi snapshot {version} tidak didukung (didukung: {VERSION})")
+
+    view = memoryview(mm)
+    position = _HEADER_SIZE
+    sections = {}  # Nama bagian -> posisi byte di file (dipakai parallel_bfs)
+
+    def take(name, typecode, count):
+        nonlocal position
+        size = count * 8
+        sections[name] = position
+        part = view[position:position + size]
+        position += size + _padding(size)
+        if len(part) != size:
+            raise ValueError(f"Snapshot {path} terpotong")
+        if sys.byteorder != 'little':
+            data = array(typecode, part.tobytes())  # Host big-endian: terpaksa menyalin
+            data.byteswap()
+            return data
+        return part.cast(typecode)
+
+    offsets = take('offsets', 'q', n + 1)
+    neighbors = take('neighbors', 'q', m)
+    weights = None
+    if flags & FLAG_WEIGHTED:
+        weights = take('weights', 'd' if flags & FLAG_FLOAT_WEIGHTS else 'q', m)
+    label_offsets = take('label_offsets', 'q', n + 1)
+    blob = view[position:position + blob_size]
+    if len(blob) != blob_size:
+        raise ValueError(f"Snapshot {path} terpotong")
+
+    csr = CSRGraph(SnapshotLabels(label_offsets, blob), offsets, neighbors, weights)
+    if sys.byteorder == 'little':
+        csr.snapshot = (path, sections)
+    return csr
+
+class SnapshotAdjacency(Mapping):
+    """Adjacency list label -> list tetangga yang diturunkan dari offsets/neighbors saat diakses.
+
+    Seperti defaultdict(list), vertex tanpa edge keluar menghasilkan list
+    kosong tetapi tidak ikut dalam iterasi maupun operator in.
+    """
+    def __init__(self, csr):
+        self.csr = csr
+
+    def _targets(self, u):
+        labels = self.csr.labels
+        return [labels[v] for v in self.csr.successors(u)]
+
+    def __getitem__(self, label):
+        u = self.csr.vertex_id(label)
+        return self._targets(u) if u >= 0 else []
+
+    def __contains__(self, label):
+        u = self.csr.vertex_id(label)
+        return u >= 0 and self.csr.offsets[u] != self.csr.offsets[u + 1]
+
+    def __iter__(self):
+        offsets, labels = self.csr.offsets, self.csr.labels
+        for u in range(len(labels)):
+            if offsets[u] != offsets[u + 1]:
+                yield labels[u]
+
+    def __len__(self):
+        offsets = self.csr.offsets
+        return sum(1 for u in range(len(offsets) - 1) if offsets[u] != offsets[u + 1])
+
+    def items(self):
+        """(label, tetangga) per vertex berdasarkan ID, tanpa pencarian biner per label"""
+        offsets, labels = self.csr.offsets, self.csr.labels
+        for u in range(len(labels)):
+            if offsets[u] != offsets[u + 1]:
+                yield labels[u], self._targets(u)
+
+    def values(self):
+        return (targets for _, targets in self.items())
+
+class SnapshotVertices(Set):
+    """Himpunan vertex read-only di atas label snapshot (keanggotaan dengan pencarian biner)"""
+    def __init__(self, labels):
+        self.labels = labels
+
+    def __contains__(self, label):
+        return isinstance(label, str) and label in self.labels  # Label snapshot selalu str
+
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __len__(self):
+        return len(self.labels)
+
+def thaw(g):
+    """Menyalin view snapshot milik g ke adjacency list dan set biasa agar graf bisa diubah"""
+    g.graph = defaultdict(list, g.graph.items())
+    g.vertices = set(g.vertices)
+
+def load_graph(path, graph_cls):
+    """Graph/BFSGraph/DFSGraph yang berjalan langsung di atas snapshot.
+
+    graph dan vertices hanya view di atas array mmap (label di-decode saat
+    diakses), sedangkan traversal yang punya jalur CSR memakai g.csr.
+    add_edge pertama menyalin view menjadi struktur Python biasa (thaw).
+    """
+    csr = load_snapshot(path)
+    g = graph_cls()
+    g.graph = SnapshotAdjacency(csr)
+    g.vertices = SnapshotVertices(csr.labels)
+    g.csr = csr
+    return g
+
+def main():
+    import argparse
+    from edge_loader import load_edge_list
+
+    parser = argparse.ArgumentParser(description="Konversi file edge list teks menjadi snapshot biner")
+    parser.add_argument('edges', help="File edge list (u v atau u v w)")
+    parser.add_argument('output', help="File snapshot tujuan")
+    args = parser.parse_args()
+
+    edges = load_edge_list(args.edges)
+    save_snapshot(args.output, edges)
+    print(f"{len(edges)} edge dan {len(edges.labels)} vertex disimpan ke {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,122 @@
 from collections import defaultdict, deque
-import networkx as nx
-import matplotlib.pyplot as plt
+from csr_graph import CSRGraph
+from kahn import collect_order, kahn_order
+
+# Graf default dari soal
+DEFAULT_EDGES = [
+    ('a', 'b'), ('a', 'd'), ('a', 'e'),
+    ('b', 'c'), ('b', 'd'),
+    ('c', 'h'), ('c', 'g'),
+    ('d', 'f'),
+    ('e', 'd'), ('e', 'f'),
+    ('f', 'j'),
+    ('h', 'g'),
+    ('i', 'g'), ('i', 'h')
+]
 
 class Graph:
     def __init__(self):
         self.graph = defaultdict(list)
         self.vertices = set()
+        self.csr = None  # Representasi CSR beku (opsional), lihat freeze()
+        # Mode topological order online (opsional), lihat enable_online_topological_order()
+        self.topo_rank = None  # vertex -> rank; u sebelum v jika rank[u] < rank[v]
+        self.predecessors = None
+        self.rank_bounds = None  # [rank terkecil, rank terbesar]
     
     def add_edge(self, u, v):
         """Menambahkan edge dari vertex u ke vertex v"""
+        if self.topo_rank is not None:
+            # Ditolak (ValueError) sebelum graf diubah jika edge membentuk cycle
+            self._update_topological_order(u, v)
+            self.predecessors[v].append(u)
+        
+        if not isinstance(self.graph, defaultdict):
+            from graph_snapshot import thaw
+            thaw(self)  # View snapshot read-only disalin sekali sebelum graf diubah
         self.graph[u].append(v)
         self.vertices.add(u)
         self.vertices.add(v)
+        self.csr = None  # Graf berubah, representasi beku tidak berlaku lagi
+    
+    def enable_online_topological_order(self):
+        """Mengaktifkan topological order yang diperbarui setiap add_edge (Pearce-Kelly)"""
+        order = self.topological_sort()
+        if order is None:
+            raise ValueError("Graf memiliki cycle, topological order tidak dapat dibuat")
+        
+        self.topo_rank = {vertex: rank for rank, vertex in enumerate(order)}
+        self.rank_bounds = [0, len(order) - 1]
+        self.predecessors = defaultdict(list)
+        for u in self.graph:
+            for v in self.graph[u]:
+                self.predecessors[v].append(u)
+    
+    def comes_before(self, u, v):
+        """O(1): apakah u berada sebelum v dalam topological order online"""
+        return self.topo_rank[u] < self.topo_rank[v]
+    
+    def _update_topological_order(self, u, v):
+        """Memperbarui rank hanya pada wilayah yang terpengaruh oleh edge u -> v"""
+        if u == v:
+            raise ValueError(f"Edge {u} -> {v} membentuk cycle: {u} -> {v}")
+        
+        rank = self.topo_rank
+        # Vertex baru belum punya edge: u ditaruh paling depan, v paling belakang
+        if u not in rank:
+            self.rank_bounds[0] -= 1
+            rank[u] = self.rank_bounds[0]
+        if v not in rank:
+            self.rank_bounds[1] += 1
+            rank[v] = self.rank_bounds[1]
+        
+        lower, upper = rank[v], rank[u]
+        if lower > upper:
+            return  # Urutan sudah benar
+        
+        # Forward search dari v, dibatasi pada rank < rank[u]
+        forward_parent = {v: None}
+        stack = [v]
+        delta_forward = []
+        while stack:
+            x = stack.pop()
+            delta_forward.append(x)
+            for y in self.graph.get(x, ()):
+                if y == u:
+                    path = []  # x, parent(x), ..., v
+                    while x is not None:
+                        path.append(x)
+                        x = forward_parent[x]
+                    cycle = [u] + path[::-1] + [u]
+                    raise ValueError(f"Edge {u} -> {v} membentuk cycle: {' -> '.join(map(str, cycle))}")
+                if y not in forward_parent and rank[y] < upper:
+                    forward_parent[y] = x
+                    stack.append(y)
+        
+        # Backward search dari u, dibatasi pada rank > rank[v]
+        seen = {u}
+        stack = [u]
+        delta_backward = []
+        while stack:
+            x = stack.pop()
+            delta_backward.append(x)
+            for y in self.predecessors.get(x, ()):
+                if y not in seen and rank[y] > lower:
+                    seen.add(y)
+                    stack.append(y)
+        
+        # Pakai ulang rank yang sama: semua delta_backward sebelum delta_forward
+        delta_backward.sort(key=rank.__getitem__)
+        delta_forward.sort(key=rank.__getitem__)
+        affected = delta_backward + delta_forward
+        for vertex, new_rank in zip(affected, sorted(rank[x] for x in affected)):
+            rank[vertex] = new_rank
+    
+    def freeze(self):
+        """Membekukan graf ke representasi CSR agar traversal tidak mengurutkan ulang tetangga"""
+        if self.csr is None:  # CSR yang ada (freeze sebelumnya, loader, snapshot) masih berlaku
+            self.csr = CSRGraph.from_adjacency(self.graph, self.vertices)
+        return self.csr
     
     def display_graph(self):
         """Menampilkan representasi graf"""
@@ -23,8 +128,19 @@ class Graph:
                 print(f"{vertex} -> (tidak ada edge keluar)")
         print()
     
-    def bfs_tree(self, start):
-        """Breadth-First Search Tree dari vertex start"""
+    def _add_stats(self, stats, order):
+        """Counter traversal: vertex yang diproses dan edge keluarnya yang diperiksa"""
+        if stats:
+            degree = self.csr.out_degree if self.csr is not None else lambda v: len(self.graph.get(v, ()))
+            stats.add(expanded=len(order), edges_scanned=sum(map(degree, order)))
+
+    def bfs_tree(self, start, stats=None):
+        """Breadth-First Search Tree dari vertex start (stats: RunStats opsional)"""
+        if self.csr is not None:
+            tree_edges, traversal_order = self.csr.bfs_tree(start)
+            self._add_stats(stats, traversal_order)
+            return tree_edges, traversal_order
+        
         if start not in self.vertices:
             return None, []
         
@@ -46,10 +162,16 @@ class Graph:
                         tree_edges.append((vertex, neighbor))
                         queue.append(neighbor)
         
+        self._add_stats(stats, traversal_order)
         return tree_edges, traversal_order
     
-    def dfs_tree(self, start):
-        """Depth-First Search Tree dari vertex start"""
+    def dfs_tree(self, start, stats=None):
+        """Depth-First Search Tree dari vertex start (stats: RunStats opsional)"""
+        if self.csr is not None:
+            tree_edges, traversal_order = self.csr.dfs_tree(start)
+            self._add_stats(stats, traversal_order)
+            return tree_edges, traversal_order
+        
         if start not in self.vertices:
             return None, []
         
@@ -69,10 +191,16 @@ class Graph:
                     dfs_visit(neighbor)
         
         dfs_visit(start)
+        self._add_stats(stats, traversal_order)
         return tree_edges, traversal_order
     
-    def dfs_forest(self):
-        """Depth-First Search Forest untuk seluruh graf"""
+    def dfs_forest(self, stats=None):
+        """Depth-First Search Forest untuk seluruh graf (stats: RunStats opsional)"""
+        if self.csr is not None:
+            forest_edges, forest_order, trees = self.csr.dfs_forest()
+            self._add_stats(stats, forest_order)
+            return forest_edges, forest_order, trees
+        
         visited = set()
         forest_edges = []
         forest_order = []
@@ -104,10 +232,14 @@ class Graph:
                 })
                 forest_order.extend(current_tree_order)
         
+        self._add_stats(stats, forest_order)
         return forest_edges, forest_order, trees
     
     def has_cycle(self):
         """Mengecek apakah graf memiliki cycle (untuk topological sort)"""
+        if self.csr is not None:
+            return self.csr.has_cycle()
+        
         color = {}  # 0: white, 1: gray, 2: black
         
         for vertex in self.vertices:
@@ -131,33 +263,39 @@ class Graph:
                     return True
         return False
     
-    def topological_sort(self):
-        """Topological Sort menggunakan DFS"""
-        if self.has_cycle():
-            return None  # Graf memiliki cycle, topological sort tidak mungkin
-        
-        visited = set()
-        stack = []
-        
-        def dfs_topo(vertex):
-            visited.add(vertex)
-            
-            for neighbor in self.graph[vertex]:
-                if neighbor not in visited:
-                    dfs_topo(neighbor)
-            
-            stack.append(vertex)
+    def topological_order_stream(self):
+        """Topological sort Kahn sebagai generator: vertex di-yield begitu siap.
+
+        Nilai return generator adalah daftar vertex pada sebuah cycle
+        (kosong jika graf acyclic), lihat kahn.collect_order.
+        """
+        if self.topo_rank is not None:
+            return self._online_order_stream()
         
-        # Kunjungi semua vertex
-        for vertex in sorted(self.vertices):
-            if vertex not in visited:
-                dfs_topo(vertex)
+        if self.csr is not None:
+            return self.csr.topological_order_stream()
         
-        return stack[::-1]  # Reverse stack untuk mendapatkan topological order
+        # Urutkan vertices dan neighbors untuk konsistensi
+        return kahn_order(sorted(self.vertices), lambda vertex: sorted(self.graph.get(vertex, ())))
+    
+    def _online_order_stream(self):
+        yield from sorted(self.vertices, key=self.topo_rank.__getitem__)
+        return []
+    
+    def topological_sort(self):
+        """Topological Sort (algoritma Kahn); None jika graf memiliki cycle"""
+        order, cycle = collect_order(self.topological_order_stream())
+        if cycle:
+            return None  # Graf memiliki cycle, topological sort tidak mungkin
+        return order
 
     def visualize_graph(self, title="Graf", highlight_edges=None, highlight_color='red'):
         """Visualisasi graf menggunakan NetworkX dan Matplotlib"""
         try:
+            import networkx as nx
+            import matplotlib.pyplot as plt
+            from graph_renderer import LARGE_GRAPH_EDGES, render_graph
+
             # Membuat graf NetworkX
             G = nx.DiGraph()
             
@@ -177,6 +315,15 @@ class Graph:
             # Definisi posisi manual untuk graf yang lebih mudah dipahami
             pos = self._get_better_layout(G)
             
+            if G.number_of_edges() >= LARGE_GRAPH_EDGES:
+                # Graf besar: semua edge dalam satu LineCollection, semua node dalam satu scatter
+                render_graph(plt.gca(), pos, list(G.nodes()), list(G.edges()),
+                             highlight_edges=highlight_edges, highlight_color=highlight_color)
+                plt.title(title, fontsize=16, fontweight='bold', pad=20)
+                plt.tight_layout()
+                plt.show()
+                return
+            
             # Menggambar semua edges dengan warna abu-abu
             nx.draw_networkx_edges(G, pos, edge_color='lightgray', arrows=True, 
                                  arrowsize=20, arrowstyle='->', width=2, alpha=0.6,
@@ -192,9 +339,10 @@ class Graph:
                                          connectionstyle="arc3,rad=0.1")
             
             # Menggambar nodes dengan warna yang berbeda
+            highlighted_nodes = {node for edge in highlight_edges or () for node in edge}
             node_colors = []
             for node in G.nodes():
-                if highlight_edges and any(node in edge for edge in highlight_edges):
+                if node in highlighted_nodes:
                     node_colors.append('lightcoral')
                 else:
                     node_colors.append('lightblue')
@@ -226,6 +374,8 @@ class Graph:
     
     def _get_better_layout(self, G):
         """Membuat layout yang lebih mudah dipahami untuk graf"""
+        from layout_cache import default_cache
+
         # Jika graf kosong, gunakan layout default
         if len(G.nodes()) == 0:
             return {}
@@ -250,12 +400,12 @@ class Graph:
         
         # Untuk graf custom, gunakan hierarchical layout
         try:
-            # Coba gunakan hierarchical layout
-            pos = self._hierarchical_layout(G)
+            # Coba gunakan hierarchical layout (di-cache per struktur graf)
+            pos = default_cache.layout(G, self._hierarchical_layout)
             return pos
         except:
             # Fallback ke spring layout yang lebih stabil
-            return nx.spring_layout(G, k=3, iterations=100, seed=42)
+            return default_cache.spring_layout(G, k=3, iterations=100, seed=42)
     
     def _hierarchical_layout(self, G):
         """Membuat layout hierarkis berdasarkan level dari root"""
@@ -272,24 +422,34 @@ class Graph:
         levels = {}
         visited = set()
         
-        def assign_level(node, level):
-            if node in visited:
+        def assign_level(root, level):
+            # DFS iteratif (urutan sama dengan versi rekursif) agar graf dalam tidak kena batas rekursi
+            if root in visited:
                 return
-            visited.add(node)
-            levels[node] = level
-            
-            for neighbor in G.neighbors(node):
-                if neighbor not in levels:
-                    assign_level(neighbor, level + 1)
+            visited.add(root)
+            levels[root] = level
+            stack = [(root, iter(G.neighbors(root)))]
+            while stack:
+                node, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if neighbor not in levels:
+                        visited.add(neighbor)
+                        levels[neighbor] = levels[node] + 1
+                        stack.append((neighbor, iter(G.neighbors(neighbor))))
+                        break
+                else:
+                    stack.pop()
         
         # Mulai dari semua root nodes
         for root in roots:
             assign_level(root, 0)
         
-        # Assign level untuk isolated nodes
+        # Assign level untuk isolated nodes (level maksimum dihitung sekali, bukan per node)
+        next_level = max(levels.values()) + 1 if levels else 0
         for node in G.nodes():
             if node not in levels:
-                levels[node] = max(levels.values()) + 1 if levels else 0
+                levels[node] = next_level
+                next_level += 1
         
         # Buat posisi berdasarkan level
         level_counts = {}
@@ -390,9 +550,10 @@ def print_results(g, start_vertex='a'):
     
     # Topological Sort
     print("4. TOPOLOGICAL SORT:")
-    topo_result = g.topological_sort()
-    if topo_result is None:
+    topo_result, cycle = collect_order(g.topological_order_stream())
+    if cycle:
         print("   TIDAK MUNGKIN (Graf memiliki cycle)")
+        print(f"   Cycle: {' -> '.join(cycle + cycle[:1])}")
     else:
         print(f"   Hasil: {' -> '.join(topo_result)}")
     print()
@@ -428,6 +589,28 @@ def input_custom_graph():
     
     return g
 
+def load_graph_from_file():
+    """Memuat graf dari file edge list (u v per baris) atau snapshot biner tanpa input per edge"""
+    from edge_loader import build_graph, load_edge_list, to_csr
+    from graph_snapshot import is_snapshot, load_graph
+
+    path = input("Path file edge list atau snapshot: ").strip()
+    try:
+        if is_snapshot(path):
+            g = load_graph(path, Graph)  # mmap, tanpa parsing teks maupun adjacency list Python
+            num_edges = g.csr.num_edges()
+        else:
+            edges = load_edge_list(path)
+            g = build_graph(Graph, edges)
+            g.csr = to_csr(edges)  # CSR langsung dari array, tanpa freeze()
+            num_edges = len(edges)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return Graph()
+
+    print(f"✓ {num_edges} edge dan {len(g.vertices)} vertex berhasil dimuat")
+    return g
+
 def main():
     print("="*60)
     print("PROGRAM GRAPH TRAVERSAL DAN TOPOLOGICAL SORT")
@@ -436,31 +619,20 @@ def main():
     print("pip install networkx matplotlib")
     print("="*60)
     
-    # Graf default dari soal
-    default_edges = [
-        ('a', 'b'), ('a', 'd'), ('a', 'e'),
-        ('b', 'c'), ('b', 'd'),
-        ('c', 'h'), ('c', 'g'),
-        ('d', 'f'),
-        ('e', 'd'), ('e', 'f'),
-        ('f', 'j'),
-        ('h', 'g'),
-        ('i', 'g'), ('i', 'h')
-    ]
-    
     while True:
         print("\nMenu:")
         print("1. Gunakan graf default dari soal")
         print("2. Masukkan graf baru")
-        print("3. Keluar")
+        print("3. Muat graf dari file edge list / snapshot")
+        print("4. Keluar")
         
         try:
-            choice = int(input("Masukkan pilihan (1-3): "))
+            choice = int(input("Masukkan pilihan (1-4): "))
         except ValueError:
-            print("Input tidak valid! Masukkan angka 1, 2, atau 3.")
+            print("Input tidak valid! Masukkan angka 1, 2, 3, atau 4.")
             continue
         
-        if choice == 3:
+        if choice == 4:
             print("Terima kasih telah menggunakan program ini!")
             break
         
@@ -471,10 +643,11 @@ def main():
             print("MENGGUNAKAN GRAF DEFAULT DARI SOAL")
             print("="*40)
             
-            for u, v in default_edges:
+            for u, v in DEFAULT_EDGES:
                 g.add_edge(u, v)
             
             print("Graf default berhasil dimuat!")
+            g.freeze()
             print_results(g, 'a')
         
         elif choice == 2:
@@ -495,10 +668,29 @@ def main():
             if not start_vertex:
                 start_vertex = 'a'
             
+            g.freeze()
+            print_results(g, start_vertex)
+        
+        elif choice == 3:
+            # Muat graf dari file
+            print("\n" + "="*40)
+            print("MUAT GRAF DARI FILE")
+            print("="*40)
+            
+            g = load_graph_from_file()
+            
+            if not g.vertices:
+                print("Graf kosong! Kembali ke menu utama.")
+                continue
+            
+            start_vertex = input("Masukkan vertex start untuk BFS/DFS Tree (default: vertex terkecil): ").strip()
+            if not start_vertex:
+                start_vertex = g.csr.labels[0]
+            
             print_results(g, start_vertex)
         
         else:
-            print("Pilihan tidak valid! Masukkan angka 1, 2, atau 3.")
+            print("Pilihan tidak valid! Masukkan angka 1, 2, 3, atau 4.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
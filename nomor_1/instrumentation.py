@@ -0,0 +1,142 @@
+"""Penghitung operasi dan waktu per fase yang dipakai bersama semua algoritma.
+
+Algoritma menerima parameter stats (default None). Jika diberikan,
+algoritma menambahkan jumlah operasinya ke RunStats setelah (atau di
+akhir) loop utama; penghitungan di dalam loop memakai variabel lokal
+sehingga tanpa stats biayanya hampir nol. Nama counter yang dipakai:
+    heap_push, heap_pop   operasi heap (Dijkstra, Prim)
+    relaxations           dist[v] diperbaiki (Dijkstra)
+    edges_scanned         edge yang diperiksa
+    finds, unions         operasi union-find (Kruskal)
+    expanded              vertex/node yang diproses
+    backtracks            langkah yang dibatalkan (knight's tour)
+
+Waktu diukur per fase dengan `with stats.phase(nama):` (wall time dari
+perf_counter, CPU time dari process_time, dan puncak memori dari
+tracemalloc di atas memori saat fase dimulai). Hasil diekspor dengan
+to_dict()/to_json()/save(), dan beberapa run dibandingkan dengan
+`python instrumentation.py run1.json run2.json`.
+
+Contoh:
+    stats = RunStats('dijkstra')
+    with stats.phase('search'):
+        dijkstra(node_map, edges, 's', stats=stats)
+    stats.save('dijkstra.json')
+"""
+import contextlib
+import json
+import time
+import tracemalloc
+from collections import Counter
+
+FORMAT_VERSION = 1
+
+class RunStats:
+    """Counter operasi dan pengukuran per fase untuk satu run"""
+    def __init__(self, label=None, memory=True):
+        self.label = label
+        self.memory = memory  # False: tanpa tracemalloc (tracemalloc memperlambat alokasi)
+        self.counters = Counter()
+        self.phases = {}  # nama -> {'calls', 'wall_s', 'cpu_s', 'peak_bytes'}
+        self._stack = []  # [memori awal, puncak] fase yang sedang berjalan
+        self._started_tracing = False
+
+    def add(self, **counts):
+        """Menambahkan beberapa counter sekaligus, mis. add(heap_push=3, heap_pop=3)"""
+        self.counters.update(counts)
+
+    def _fold_peak(self):
+        """Puncak tracemalloc sejak reset terakhir dicatat ke semua fase yang berjalan"""
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in self._stack:
+            frame[1] = max(frame[1], peak)
+        tracemalloc.reset_peak()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Mengukur wall time, CPU time dan puncak memori blok; nama yang sama diakumulasi"""
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self.memory:
+            self._fold_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            frame = [current, current]
+            self._stack.append(frame)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield self
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            entry = self.phases.setdefault(name, {'calls': 0, 'wall_s': 0.0, 'cpu_s': 0.0, 'peak_bytes': None})
+            entry['calls'] += 1
+            entry['wall_s'] += wall
+            entry['cpu_s'] += cpu
+            if self.memory:
+                self._fold_peak()
+                self._stack.pop()
+                peak = frame[1] - frame[0]
+                entry['peak_bytes'] = max(entry['peak_bytes'] or 0, peak)
+                if not self._stack and self._started_tracing:
+                    tracemalloc.stop()
+                    self._started_tracing = False
+
+    def to_dict(self):
+        return {
+            'version': FORMAT_VERSION,
+            'label': self.label,
+            'counters': dict(sorted(self.counters.items())),
+            'phases': self.phases,
+        }
+
+    def to_json(self, indent=2):
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_json() + '\n')
+
+    def report(self):
+        """Ringkasan teks untuk dicetak di menu interaktif"""
+        lines = [f"Statistik run{f' {self.label}' if self.label else ''}:"]
+        for name, count in sorted(self.counters.items()):
+            lines.append(f"  {name:<14} {count:>12,}")
+        for name, entry in self.phases.items():
+            memory = f", puncak memori {entry['peak_bytes'] / 1024:,.1f} KiB" if entry['peak_bytes'] is not None else ""
+            lines.append(f"  fase {name}: wall {entry['wall_s'] * 1000:.2f} ms, "
+                         f"CPU {entry['cpu_s'] * 1000:.2f} ms{memory}")
+        return "\n".join(lines)
+
+def compare(runs):
+    """Tabel counter dan wall time beberapa hasil to_dict() berdampingan"""
+    names = [run.get('label') or f"run{i + 1}" for i, run in enumerate(runs)]
+    counters = sorted({key for run in runs for key in run['counters']})
+    phases = list(dict.fromkeys(key for run in runs for key in run['phases']))
+    width = max([14] + [len(name) for name in names])
+    lines = [f"{'':<22}" + "".join(f"{name:>{width + 2}}" for name in names)]
+    for key in counters:
+        lines.append(f"{key:<22}" + "".join(f"{run['counters'].get(key, 0):>{width + 2},}" for run in runs))
+    for key in phases:
+        cells = []
+        for run in runs:
+            entry = run['phases'].get(key)
+            cells.append(f"{entry['wall_s'] * 1000:>{width}.2f}ms" if entry else f"{'-':>{width + 2}}")
+        lines.append(f"{'wall ' + key:<22}" + "".join(cells))
+    return "\n".join(lines)
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bandingkan file statistik run (JSON)")
+    parser.add_argument('files', nargs='+')
+    args = parser.parse_args()
+
+    runs = []
+    for path in args.files:
+        with open(path, encoding='utf-8') as f:
+            runs.append(json.load(f))
+    print(compare(runs))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+from collections import deque
+
+def kahn_order(vertices, successors, labels=None):
+    """Topological sort Kahn sebagai generator.
+
+    vertices   : urutan vertex (menentukan urutan vertex siap di awal);
+                 range(n) dipakai untuk ID integer padat sehingga in-degree
+                 disimpan dalam list biasa
+    successors : fungsi vertex -> iterable tetangga keluar
+    labels     : (opsional) pemetaan ID -> label untuk vertex yang di-yield
+
+    Setiap vertex di-yield begitu in-degree-nya menjadi nol. Nilai return
+    generator (StopIteration.value) adalah daftar vertex yang membentuk
+    sebuah cycle, atau list kosong jika graf acyclic.
+    """
+    if isinstance(vertices, range):
+        in_degree = [0] * len(vertices)
+    else:
+        vertices = list(vertices)
+        in_degree = dict.fromkeys(vertices, 0)
+
+    for u in vertices:
+        for v in successors(u):
+            in_degree[v] += 1
+
+    ready = deque(u for u in vertices if in_degree[u] == 0)
+    emitted = 0
+    while ready:
+        u = ready.popleft()
+        yield u if labels is None else labels[u]
+        emitted += 1
+        for v in successors(u):
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                ready.append(v)
+
+    if emitted == len(vertices):
+        return []
+
+    cycle = _cycle_witness(vertices, successors, in_degree)
+    return cycle if labels is None else [labels[u] for u in cycle]
+
+def _cycle_witness(vertices, successors, in_degree):
+    """Mencari satu cycle di antara vertex yang tidak pernah siap.
+
+    Setiap vertex sisa masih memiliki predecessor sisa, sehingga menelusuri
+    predecessor mundur pasti kembali ke vertex yang sudah dilewati.
+    """
+    predecessor = {}
+    for u in vertices:
+        if in_degree[u] > 0:
+            for v in successors(u):
+                if in_degree[v] > 0:
+                    predecessor[v] = u
+
+    vertex = next(u for u in vertices if in_degree[u] > 0)
+    position = {}
+    walk = []
+    while vertex not in position:
+        position[vertex] = len(walk)
+        walk.append(vertex)
+        vertex = predecessor[vertex]
+
+    cycle = walk[position[vertex]:]
+    cycle.reverse()  # Urutan searah edge: cycle[i] -> cycle[i + 1] -> ... -> cycle[0]
+    return cycle
+
+def collect_order(stream):
+    """Menjalankan generator kahn_order sampai habis; mengembalikan (urutan, cycle)"""
+    order = []
+    while True:
+        try:
+            order.append(next(stream))
+        except StopIteration as stop:
+            return order, stop.value
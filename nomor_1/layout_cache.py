@@ -0,0 +1,175 @@
+"""Cache posisi layout graf yang dipakai bersama oleh semua visualisasi.
+
+Kunci cache = hash struktural graf (blake2b dari node dan tetangganya) +
+nama fungsi layout + parameternya, sehingga graf yang sama tidak di-layout
+ulang untuk setiap plot. Fitur:
+  - LRU di memori (maksimum maxsize layout);
+  - opsional disimpan ke disk (satu file JSON per kunci) agar dipakai
+    ulang antar proses;
+  - spring layout inkremental: jika graf hanya berubah sedikit dari layout
+    yang sudah ada di cache, node lama tetap di posisinya dan hanya node
+    yang berubah yang disimulasikan (dengan iterasi lebih sedikit).
+
+Contoh:
+    from layout_cache import default_cache
+    pos = default_cache.spring_layout(G, seed=42)
+"""
+import hashlib
+import json
+import os
+import random
+from collections import OrderedDict
+
+CACHE_SIZE = 32  # Jumlah layout yang disimpan di memori
+FORMAT_VERSION = 1
+INCREMENTAL_RATIO = 0.1  # Update inkremental jika node yang berubah <= 10% node
+INCREMENTAL_MIN = 10  # ... atau <= 10 node untuk graf kecil
+INCREMENTAL_ITERATIONS = 20  # Iterasi spring layout pada update inkremental
+
+def _digest(parts):
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+def _neighbors(adjacency):
+    # Bobot ikut di-hash karena spring_layout memakai atribut 'weight'
+    return sorted(f"{x!r}/{data.get('weight')!r}" for x, data in adjacency.items())
+
+def node_signatures(G):
+    """Node -> hash dari daftar tetangga dan bobotnya (arah edge ikut diperhitungkan)"""
+    if G.is_directed():
+        return {node: _digest(['>'] + _neighbors(G.succ[node]) + ['<'] + _neighbors(G.pred[node]))
+                for node in G.nodes()}
+    return {node: _digest(_neighbors(G.adj[node])) for node in G.nodes()}
+
+def graph_key(G, signatures=None):
+    """Hash struktural graf: sama untuk graf dengan node dan edge yang sama"""
+    if signatures is None:
+        signatures = node_signatures(G)
+    lines = sorted(f"{node!r}:{sig}" for node, sig in signatures.items())
+    return _digest(['directed' if G.is_directed() else 'undirected'] + lines)
+
+def _method_key(name, params):
+    return _digest([name] + [f"{key}={params[key]!r}" for key in sorted(params)])
+
+class LayoutCache:
+    """LRU cache posisi layout, opsional dengan penyimpanan di folder path"""
+    def __init__(self, maxsize=CACHE_SIZE, path=None):
+        self.maxsize = maxsize
+        self.path = path
+        self.entries = OrderedDict()  # kunci -> (method key, posisi, signatures)
+        self.hits = 0
+        self.misses = 0
+        self.incremental = 0
+
+    def clear(self):
+        self.entries.clear()
+
+    def _file(self, key):
+        return os.path.join(self.path, f"{key}.json")
+
+    def _load(self, key, method):
+        """Entry dari disk, atau None"""
+        if not self.path:
+            return None
+        try:
+            with open(self._file(key), encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != FORMAT_VERSION:
+            return None
+        pos = {node: (x, y) for node, x, y, _ in data['nodes']}
+        signatures = {node: sig for node, _, _, sig in data['nodes']}
+        return method, pos, signatures
+
+    def _store(self, key, method, pos, signatures):
+        self.entries[key] = (method, pos, signatures)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        if self.path:
+            os.makedirs(self.path, exist_ok=True)
+            data = {'version': FORMAT_VERSION,
+                    'nodes': [[node, x, y, signatures[node]] for node, (x, y) in pos.items()]}
+            tmp = self._file(key) + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp, self._file(key))  # Tidak ada file setengah jadi jika proses terhenti
+
+    def _lookup(self, key, method):
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self._load(key, method)
+            if entry is None:
+                return None
+            self.entries[key] = entry
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return dict(entry[1])
+
+    def layout(self, G, func, name=None, **params):
+        """Posisi dari func(G, **params), dihitung sekali per struktur graf dan parameter"""
+        signatures = node_signatures(G)
+        method = _method_key(name or func.__qualname__, params)
+        key = _digest([graph_key(G, signatures), method])
+        pos = self._lookup(key, method)
+        if pos is not None:
+            return pos
+
+        self.misses += 1
+        pos = {node: tuple(float(c) for c in xy) for node, xy in func(G, **params).items()}
+        self._store(key, method, pos, signatures)
+        return dict(pos)
+
+    def _nearest(self, method, signatures):
+        """Entry dengan method yang sama dan node berubah paling sedikit: (posisi, node berubah)"""
+        best = None
+        for entry_method, pos, old in self.entries.values():
+            if entry_method != method:
+                continue
+            moved = [node for node, sig in signatures.items() if old.get(node) != sig]
+            if best is None or len(moved) < len(best[1]):
+                best = (pos, moved)
+        return best
+
+    def spring_layout(self, G, **params):
+        """nx.spring_layout dengan cache; graf yang sedikit berubah di-layout secara inkremental"""
+        import networkx as nx
+
+        signatures = node_signatures(G)
+        method = _method_key('spring_layout', params)
+        key = _digest([graph_key(G, signatures), method])
+        pos = self._lookup(key, method)
+        if pos is not None:
+            return pos
+
+        self.misses += 1
+        nearest = self._nearest(method, signatures) if len(G) else None
+        limit = max(INCREMENTAL_MIN, INCREMENTAL_RATIO * len(G))
+        if nearest is not None and len(nearest[1]) <= limit and len(nearest[1]) < len(G):
+            self.incremental += 1
+            old, moved = nearest
+            moved = set(moved)
+            fixed = [node for node in G if node in old and node not in moved]
+            initial = {node: old[node] for node in G if node in old}
+            jitter = random.Random(params.get('seed'))
+            for node in G:
+                if node not in initial:
+                    # Node baru mulai di sekitar rata-rata posisi tetangganya yang sudah punya posisi
+                    placed = [initial[x] for x in nx.all_neighbors(G, node) if x in initial]
+                    if placed:
+                        initial[node] = (sum(p[0] for p in placed) / len(placed) + jitter.uniform(-0.05, 0.05),
+                                         sum(p[1] for p in placed) / len(placed) + jitter.uniform(-0.05, 0.05))
+            incremental = dict(params, iterations=min(params.get('iterations', 50), INCREMENTAL_ITERATIONS))
+            result = nx.spring_layout(G, pos=initial, fixed=fixed or None, **incremental)
+        else:
+            result = nx.spring_layout(G, **params)
+
+        pos = {node: tuple(float(c) for c in xy) for node, xy in result.items()}
+        self._store(key, method, pos, signatures)
+        return dict(pos)
+
+default_cache = LayoutCache()  # Dipakai bersama oleh semua visualisasi dalam satu proses
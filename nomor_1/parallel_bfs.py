@@ -0,0 +1,164 @@
+"""BFS paralel level-synchronous dengan multiprocessing.shared_memory.
+
+Adjacency CSR, array level, array claim dan frontier disimpan di shared
+memory sehingga semua worker membaca/menulis halaman memori yang sama.
+Setiap level, frontier dibagi menjadi beberapa chunk untuk process pool;
+worker menulis level dan claim tanpa operasi atomic:
+  - semua worker menulis nilai level yang sama (depth), jadi race aman;
+  - claim[v] diisi ID chunk, chunk yang masih melihat ID-nya sendiri
+    setelah menulis menjadi pemilik v di frontier berikutnya.
+Duplikat yang tersisa akibat race dibuang saat frontier digabung.
+Jika CSR berasal dari snapshot (graph_snapshot.py), offsets dan targets
+tidak disalin: setiap worker memetakan file snapshot yang sama.
+"""
+import os
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+
+from csr_graph import CSRGraph
+
+SERIAL_FRONTIER = 4096  # Frontier lebih kecil dari ini diproses di proses utama
+CHUNKS_PER_WORKER = 4
+
+_arrays = {}  # Di dalam worker: nama array -> ndarray di atas shared memory
+_segments = []  # Referensi SharedMemory agar tidak di-garbage collect
+
+def _create_shared(array):
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    view[:] = array
+    return shm, view
+
+def _attach(specs):
+    """Initializer worker: memetakan shared memory milik proses utama atau file snapshot"""
+    for key, (kind, name, offset, shape, dtype) in specs.items():
+        if kind == 'file':
+            _arrays[key] = np.memmap(name, dtype=dtype, mode='r', offset=offset, shape=shape)
+            continue
+        shm = shared_memory.SharedMemory(name=name)
+        _segments.append(shm)
+        _arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+def _expand(lo, hi, depth, claim_id, arrays=None):
+    """Memperluas frontier[lo:hi]; mengembalikan vertex baru yang diklaim chunk ini"""
+    arrays = _arrays if arrays is None else arrays
+    offsets, targets = arrays['offsets'], arrays['targets']
+    level, claim = arrays['level'], arrays['claim']
+
+    vertices = arrays['frontier'][lo:hi]
+    starts = offsets[vertices]
+    counts = offsets[vertices + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+
+    # Indeks semua edge keluar dari vertices dalam satu array (tanpa loop Python)
+    shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    neighbors = targets[shift + np.arange(total)]
+    neighbors = np.unique(neighbors[level[neighbors] < 0])
+
+    level[neighbors] = depth
+    claim[neighbors] = claim_id
+    return neighbors[claim[neighbors] == claim_id]
+
+class ParallelBFS:
+    """Mesin BFS paralel; shared memory dan pool dibuat sekali untuk banyak query"""
+
+    def __init__(self, graph, workers=None):
+        if isinstance(graph, CSRGraph):
+            csr = graph
+        else:
+            csr = CSRGraph.from_adjacency(graph.graph, graph.vertices)
+        self.csr = csr
+        self.workers = workers or os.cpu_count() or 1
+
+        n = len(csr.labels)
+        initial = {
+            'level': np.full(n, -1, dtype=np.int32),
+            'claim': np.full(n, -1, dtype=np.int32),
+            'frontier': np.zeros(n, dtype=np.int64),
+        }
+        self._shm = []
+        self.arrays = {}
+        specs = {}
+
+        snapshot = csr.snapshot
+        for key, source in (('offsets', csr.offsets), ('targets', csr.neighbors)):
+            if snapshot is not None:
+                # Zero-copy: proses utama memakai memoryview mmap, worker memetakan file
+                path, sections = snapshot
+                self.arrays[key] = np.frombuffer(source, dtype=np.int64)
+                offset = sections['offsets' if key == 'offsets' else 'neighbors']
+                specs[key] = ('file', path, offset, self.arrays[key].shape, np.int64)
+            else:
+                initial[key] = np.asarray(source, dtype=np.int64)
+
+        for key, array in initial.items():
+            shm, view = _create_shared(array)
+            self._shm.append(shm)
+            self.arrays[key] = view
+            specs[key] = ('shm', shm.name, 0, array.shape, array.dtype)
+
+        self.pool = None
+        if self.workers > 1:
+            self.pool = get_context().Pool(self.workers, initializer=_attach, initargs=(specs,))
+
+    def levels(self, start):
+        """Level BFS dari start; hasil sama dengan BFSGraph.bfs_levels (tiap level terurut)"""
+        s = self.csr.vertex_id(start)
+        if s < 0:
+            return None
+
+        level, claim, frontier = self.arrays['level'], self.arrays['claim'], self.arrays['frontier']
+        level[:] = -1
+        claim[:] = -1
+        level[s] = 0
+        frontier[0] = s
+        size = 1
+        depth = 0
+
+        while size:
+            depth += 1
+            if self.pool is None or size < SERIAL_FRONTIER:
+                new = _expand(0, size, depth, 0, self.arrays)
+            else:
+                chunk = -(-size // (self.workers * CHUNKS_PER_WORKER))
+                tasks = [(lo, min(lo + chunk, size), depth, i)
+                         for i, lo in enumerate(range(0, size, chunk))]
+                parts = self.pool.starmap(_expand, tasks)
+                new = np.unique(np.concatenate(parts))
+            size = len(new)
+            frontier[:size] = new
+
+        # Kelompokkan vertex per level; ID terurut = label terurut
+        reached = np.flatnonzero(level >= 0)
+        depths = level[reached]
+        order = np.argsort(depths, kind='stable')
+        reached, depths = reached[order], depths[order]
+        bounds = np.flatnonzero(np.diff(depths)) + 1
+        labels = self.csr.labels
+        return {int(group_depths[0]): [labels[i] for i in group.tolist()]
+                for group, group_depths in zip(np.split(reached, bounds), np.split(depths, bounds))}
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+        self.arrays = {}
+        for shm in self._shm:
+            shm.close()
+            shm.unlink()
+        self._shm = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def parallel_bfs_levels(graph, start, workers=None):
+    """BFS paralel sekali jalan (untuk banyak query, gunakan ParallelBFS langsung)"""
+    with ParallelBFS(graph, workers) as engine:
+        return engine.levels(start)
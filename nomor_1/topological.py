@@ -1,14 +1,8 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+from kahn import collect_order, kahn_order
 
-node_map = {'a': 0, 'b': 1, 'c': 2, 'd': 3, 'e': 4, 'f': 5, 'g': 6, 'h': 7, 'i': 8, 'j': 9}
-reverse_map = {v: k for k, v in node_map.items()}
+NODE_MAP = {'a': 0, 'b': 1, 'c': 2, 'd': 3, 'e': 4, 'f': 5, 'g': 6, 'h': 7, 'i': 8, 'j': 9}
 
-
-edges_huruf = [['a', 'b'], ['a', 'd'], ['a', 'e'], ['b', 'c'], ['c', 'h'], ['c', 'g'], ['h', 'g'], ['i', 'h'], ['i', 'g'], ['b', 'd'], ['e', 'd'], ['d', 'f'], ['e', 'f'], ['f', 'j']]
-
-edges = [[node_map[u], node_map[v]] for u, v in edges_huruf]
-v = len(node_map)
+EDGES_HURUF = [['a', 'b'], ['a', 'd'], ['a', 'e'], ['b', 'c'], ['c', 'h'], ['c', 'g'], ['h', 'g'], ['i', 'h'], ['i', 'g'], ['b', 'd'], ['e', 'd'], ['d', 'f'], ['e', 'f'], ['f', 'j']]
 
 def constructadj(x, edges):
     adj = [[] for _ in range(x)]
@@ -18,30 +12,41 @@ def constructadj(x, edges):
 
     return adj
 
-def topologicalSort(v, adj, visited, stack):
-    visited[v] = True
+def topological_sort(node_map, edges_huruf):
+    """Topological sort Kahn; mengembalikan (urutan label, cycle label atau list kosong)"""
+    reverse_map = {v: k for k, v in node_map.items()}
+    edges = [[node_map[u], node_map[v]] for u, v in edges_huruf]
+    v = len(node_map)
+    adj = constructadj(v, edges)
+
+    # Kahn: urutan dan cycle (jika ada) didapat dalam satu kali proses
+    order, cycle = collect_order(kahn_order(range(v), lambda u: adj[u]))
+    return [reverse_map[i] for i in order], [reverse_map[i] for i in cycle]
 
-    for i in adj[v]:
-        if not visited[i]:
-            topologicalSort(i, adj, visited, stack)
+def draw_graph(edges_huruf):
+    import networkx as nx
+    import matplotlib.pyplot as plt
 
-    stack.append(v)
+    G = nx.DiGraph()
+    for u, v in edges_huruf:
+        G.add_edge(u, v)
 
-adj = constructadj(v, edges)
-stack = []
-visited = [False] * v
+    pos = nx.spring_layout(G)
+    nx.draw(G, pos, with_labels=True, node_color='lightblue', node_size=500, font_weight='bold')
+    plt.title("Graf Topological ")
+    plt.show()
 
-start_node = node_map['a']
-topologicalSort(start_node, adj, visited, stack)
+def main():
+    order, cycle = topological_sort(NODE_MAP, EDGES_HURUF)
 
-print("Urutan Topological Sort:")
-print(" -> ".join(reverse_map[i] for i in stack[::-1]))
+    if cycle:
+        print("Graf memiliki cycle:")
+        print(" -> ".join(cycle + cycle[:1]))
+    else:
+        print("Urutan Topological Sort:")
+        print(" -> ".join(order))
 
-G = nx.DiGraph()
-for u, v in edges_huruf:
-    G.add_edge(u, v)
+    draw_graph(EDGES_HURUF)
 
-pos = nx.spring_layout(G)
-nx.draw(G, pos, with_labels=True, node_color='lightblue', node_size=500, font_weight='bold')
-plt.title("Graf Topological ")
-plt.show()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Hook event untuk traversal dan pencarian, pengganti print() di loop utama.
+
+Algoritma menerima parameter tracer (default None) dan hanya memanggilnya
+jika ada, sehingga tanpa sink biaya tambahannya hanya satu pengecekan
+`if tracer`. Event:
+    discover(vertex, time, parent)  vertex ditemukan (parent None = root)
+    finish(vertex, time)            vertex selesai diproses
+    classify_edge(u, v, kind)       jenis edge DFS: 'T', 'B', 'F' atau 'C'
+    expand(node, depth)             node pencarian dikunjungi
+    backtrack(node, depth)          langkah ke node dibatalkan
+
+Sink yang tersedia:
+    ConsoleSink  teks seperti print() lama
+    CounterSink  jumlah event per jenis
+    BinarySink   file trace biner ringkas (baca kembali dengan read_trace)
+    Tee          meneruskan event ke beberapa sink
+"""
+import struct
+import sys
+from collections import Counter
+
+class TraceSink:
+    """Sink dasar: semua event diabaikan"""
+    def discover(self, vertex, time, parent=None):
+        pass
+
+    def finish(self, vertex, time):
+        pass
+
+    def classify_edge(self, u, v, kind):
+        pass
+
+    def expand(self, node, depth):
+        pass
+
+    def backtrack(self, node, depth):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+EDGE_NAMES = {'T': 'Tree', 'B': 'Back', 'F': 'Forward', 'C': 'Cross'}
+
+class ConsoleSink(TraceSink):
+    """Mencetak event dengan format print() lama"""
+    def __init__(self, stream=None):
+        self.stream = stream  # None: sys.stdout saat event terjadi (ikut redirect_stdout)
+        self.roots = 0
+
+    def _print(self, text):
+        print(text, file=self.stream or sys.stdout)
+
+    def discover(self, vertex, time, parent=None):
+        if parent is None:
+            suffix = " (komponen baru)" if self.roots else ""
+            self._print(f"\n=== Memulai DFS dari vertex {vertex}{suffix} ===")
+            self.roots += 1
+        self._print(f"Menemukan vertex {vertex} pada waktu {time}")
+
+    def finish(self, vertex, time):
+        self._print(f"Selesai memproses vertex {vertex} pada waktu {time}")
+
+    def classify_edge(self, u, v, kind):
+        self._print(f"  Edge {u} -> {v}: {EDGE_NAMES[kind]} edge ({kind})")
+
+    def expand(self, node, depth):
+        self._print(f"Visiting step [{depth}] at position {node}")
+
+    def backtrack(self, node, depth):
+        self._print(f"Backtrack dari step [{depth}] di posisi {node}")
+
+class CounterSink(TraceSink):
+    """Menghitung event; jenis edge dihitung terpisah ('classify_edge:T', ...)"""
+    def __init__(self):
+        self.counts = Counter()
+
+    def discover(self, vertex, time, parent=None):
+        self.counts['discover'] += 1
+
+    def finish(self, vertex, time):
+        self.counts['finish'] += 1
+
+    def classify_edge(self, u, v, kind):
+        self.counts['classify_edge:' + kind] += 1
+
+    def expand(self, node, depth):
+        self.counts['expand'] += 1
+
+    def backtrack(self, node, depth):
+        self.counts['backtrack'] += 1
+
+class Tee(TraceSink):
+    """Meneruskan setiap event ke semua sink"""
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+    def discover(self, vertex, time, parent=None):
+        for sink in self.sinks:
+            sink.discover(vertex, time, parent)
+
+    def finish(self, vertex, time):
+        for sink in self.sinks:
+            sink.finish(vertex, time)
+
+    def classify_edge(self, u, v, kind):
+        for sink in self.sinks:
+            sink.classify_edge(u, v, kind)
+
+    def expand(self, node, depth):
+        for sink in self.sinks:
+            sink.expand(node, depth)
+
+    def backtrack(self, node, depth):
+        for sink in self.sinks:
+            sink.backtrack(node, depth)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+# Format file trace biner (little-endian):
+#   header : MAGIC, versi (uint16)
+#   record : jenis (uint8), info (uint8), a (uint32), b (uint32)
+#   LABEL  : jenis 0, info 0, id (uint32), panjang (uint32), diikuti label UTF-8
+# Vertex/node ditulis sebagai id; label setiap id ditulis sekali sebelum
+# pertama kali dipakai. info pada CLASSIFY berisi kode ASCII jenis edge.
+MAGIC = b'KLPTRACE'
+VERSION = 1
+LABEL, DISCOVER, FINISH, CLASSIFY, EXPAND, BACKTRACK = range(6)
+EVENT_NAMES = {DISCOVER: 'discover', FINISH: 'finish', CLASSIFY: 'classify_edge',
+               EXPAND: 'expand', BACKTRACK: 'backtrack'}
+_RECORD = struct.Struct('<BBII')
+_HEADER = struct.Struct('<8sH')
+FLUSH_SIZE = 1 << 20  # Buffer ditulis ke file setiap 1 MB
+
+class BinarySink(TraceSink):
+    """Menulis event ke file trace biner (10 byte per event)"""
+    def __init__(self, path):
+        self.file = open(path, 'wb')
+        self.buffer = bytearray(_HEADER.pack(MAGIC, VERSION))
+        self.ids = {}
+        self.events = 0
+
+    def _id(self, node):
+        node_id = self.ids.get(node)
+        if node_id is None:
+            node_id = self.ids[node] = len(self.ids)
+            label = str(node).encode('utf-8')
+            self.buffer += _RECORD.pack(LABEL, 0, node_id, len(label))
+            self.buffer += label
+        return node_id
+
+    def _write(self, kind, info, a, b):
+        self.buffer += _RECORD.pack(kind, info, a, b)
+        self.events += 1
+        if len(self.buffer) >= FLUSH_SIZE:
+            self.file.write(self.buffer)
+            self.buffer.clear()
+
+    def discover(self, vertex, time, parent=None):
+        self._write(DISCOVER, 0, self._id(vertex), time)
+
+    def finish(self, vertex, time):
+        self._write(FINISH, 0, self._id(vertex), time)
+
+    def classify_edge(self, u, v, kind):
+        self._write(CLASSIFY, ord(kind), self._id(u), self._id(v))
+
+    def expand(self, node, depth):
+        self._write(EXPAND, 0, self._id(node), depth)
+
+    def backtrack(self, node, depth):
+        self._write(BACKTRACK, 0, self._id(node), depth)
+
+    def close(self):
+        if not self.file.closed:
+            self.file.write(self.buffer)
+            self.buffer.clear()
+            self.file.close()
+
+def read_trace(path):
+    """Generator (nama event, argumen) dari file trace biner; label dikembalikan sebagai string"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Bukan file trace yang didukung: {path}")
+    labels = {}
+    offset = _HEADER.size
+    while offset < len(data):
+        kind, info, a, b = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        if kind == LABEL:
+            labels[a] = data[offset:offset + b].decode('utf-8')
+            offset += b
+        elif kind == CLASSIFY:
+            yield 'classify_edge', (labels[a], labels[b], chr(info))
+        else:
+            yield EVENT_NAMES[kind], (labels[a], b)
+
+def main():
+    """Ringkasan file trace: jumlah event per jenis"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ringkasan file trace biner")
+    parser.add_argument('trace')
+    parser.add_argument('--dump', action='store_true', help="Cetak setiap event")
+    args = parser.parse_args()
+
+    counts = Counter()
+    for name, event_args in read_trace(args.trace):
+        counts[name if name != 'classify_edge' else 'classify_edge:' + event_args[2]] += 1
+        if args.dump:
+            print(name, *event_args)
+    for name, count in sorted(counts.items()):
+        print(f"{name}: {count}")
+
+if __name__ == "__main__":
+    main()
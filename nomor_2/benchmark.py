@@ -0,0 +1,309 @@
+"""Benchmark untuk algoritma MST pada nomor_2.
+
+Contoh pemakaian:
+    python benchmark.py kruskal
+    python benchmark.py kruskal --edges 1000000 10000000 --degree 10
+    python benchmark.py boruvka --edges 10000000 --workers 1 2 4 8 16 32
+    python benchmark.py prim --vertices 2000 --densities 0.01 0.1 0.25 0.5 1
+    python benchmark.py filter --edges 10000000 --ratios 2 10 100 1000
+    python benchmark.py dynamic --check 2000 --vertices 100000 --updates 10000
+"""
+import argparse
+import contextlib
+import heapq
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from kruskal_engine import filter_kruskal_indices, intern_edges, kruskal_indices
+
+# instrumentation berada di folder nomor_1
+_NOMOR_1 = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'nomor_1'))
+if _NOMOR_1 not in sys.path:
+    sys.path.append(_NOMOR_1)
+
+
+def timed(fn, *args):
+    """Menjalankan fn dengan output print dibuang; mengembalikan (hasil, detik)"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        result = fn(*args)
+        return result, time.perf_counter() - start
+
+
+def random_edges(n, m, seed=42):
+    """m edge acak [u, v, w] antar n vertex berlabel string, bobot 1..999"""
+    rng = np.random.default_rng(seed)
+    src, dst, weights = rng.integers(0, n, m), rng.integers(0, n, m), rng.integers(1, 1000, m)
+    labels = [f"V{i}" for i in range(n)]
+    return [[labels[u], labels[v], w] for u, v, w in zip(src.tolist(), dst.tolist(), weights.tolist())]
+
+
+def kruskal_baseline(edges):
+    """Kruskal versi lama: sorted() dengan key lambda, parent/rank dict, find rekursif"""
+    def find(parent, i):
+        if parent[i] != i:
+            parent[i] = find(parent, parent[i])
+        return parent[i]
+
+    graph = sorted(edges, key=lambda item: item[2])
+    parent, rank = {}, {}
+    for u, v, w in graph:
+        parent[u] = u
+        parent[v] = v
+        rank[u] = 0
+        rank[v] = 0
+    result = []
+    for u, v, w in graph:
+        x, y = find(parent, u), find(parent, v)
+        if x != y:
+            result.append([u, v, w])
+            if rank[x] < rank[y]:
+                parent[x] = y
+            elif rank[x] > rank[y]:
+                parent[y] = x
+            else:
+                parent[y] = x
+                rank[x] += 1
+    return result
+
+
+def prim_baseline(edges, start_vertex):
+    """Prim versi lama: heapq lazy dengan satu entri per edge kandidat"""
+    adj = {}
+    for u, v, w in edges:
+        adj.setdefault(u, []).append((v, w))
+        adj.setdefault(v, []).append((u, w))
+    mst_set = {start_vertex}
+    min_heap = [(w, start_vertex, v) for v, w in adj[start_vertex]]
+    heapq.heapify(min_heap)
+    mst_edges = []
+    while min_heap and len(mst_set) < len(adj):
+        w, u, v = heapq.heappop(min_heap)
+        if v not in mst_set:
+            mst_set.add(v)
+            mst_edges.append((u, v, w))
+            for to, weight in adj[v]:
+                if to not in mst_set:
+                    heapq.heappush(min_heap, (weight, v, to))
+    return mst_edges
+
+
+def recomputed_mst(edges):
+    """ID edge MST hasil Kruskal ulang atas dict ID edge -> (u, v, w), sesuai urutan ID"""
+    ids = sorted(edges)
+    if not ids:
+        return set()
+    labels, src, dst, weights = intern_edges([edges[e] for e in ids])
+    return {ids[i] for i in kruskal_indices(len(labels), src, dst, weights).tolist()}
+
+
+def check_dynamic(steps, seed=0):
+    """Operasi acak insert/delete pada DynamicMST, dibandingkan dengan Kruskal ulang setiap langkah.
+
+    Percobaan bergantian memakai bobot integer dan bobot float (0.1, 0.2,
+    0.3, 0.7 dan float acak) agar galat pembulatan total_weight terdeteksi.
+    """
+    from dynamic_mst import DynamicMST
+
+    rng = np.random.default_rng(seed)
+    float_weights = [0.1, 0.2, 0.3, 0.7]
+    for trial in range(steps // 200 or 1):
+        if trial % 2:
+            weight = lambda: float(rng.choice(float_weights)) if rng.random() < 0.8 else float(rng.random())
+        else:
+            weight = lambda: int(rng.integers(1, 6))
+        n = int(rng.integers(2, 30))
+        initial = rng.integers(0, n, (int(rng.integers(0, 3 * n)), 2)).tolist()
+        mst = DynamicMST.from_edges([[u, v, weight()] for u, v in initial])
+        for _ in range(200):
+            if mst.edges and rng.random() < 0.4:
+                u, v, _ = mst.edges[int(rng.choice(list(mst.edges)))]
+                mst.delete_edge(u, v)
+            else:
+                mst.insert_edge(int(rng.integers(n)), int(rng.integers(n)), weight())
+            expected = recomputed_mst(mst.edges)
+            if set(mst.edge_node) != expected:
+                raise AssertionError(f"MST dinamis berbeda dari Kruskal ulang (percobaan {trial})")
+            forest_weights = [mst.edges[e][2] for e in expected]
+            total = math.fsum(forest_weights) if trial % 2 else sum(forest_weights)
+            if mst.total_weight() != total:
+                raise AssertionError(f"total_weight {mst.total_weight()!r} != {total!r} (percobaan {trial})")
+    print(f"{(steps // 200 or 1) * 200:,} operasi acak: hasil sama dengan Kruskal ulang")
+
+
+def bench_dynamic(args):
+    from dynamic_mst import DynamicMST
+
+    if args.check:
+        check_dynamic(args.check)
+    n, m = args.vertices, args.vertices * args.degree
+    edges = random_edges(n, m, seed=19)
+    mst, build_time = timed(DynamicMST.from_edges, edges)
+    _, recompute_time = timed(recomputed_mst, mst.edges)
+
+    rng = np.random.default_rng(23)
+    start = time.perf_counter()
+    for _ in range(args.updates // 2):
+        u, v, _ = mst.edges[int(rng.choice(list(mst.edge_node)))]  # Edge forest: kasus terburuk
+        mst.delete_edge(u, v)
+        mst.insert_edge(f"V{rng.integers(n)}", f"V{rng.integers(n)}", int(rng.integers(1, 1000)))
+    update_time = (time.perf_counter() - start) / (args.updates // 2 * 2)
+
+    if set(mst.edge_node) != recomputed_mst(mst.edges):
+        raise AssertionError("MST dinamis berbeda dari Kruskal ulang")
+    print(f"vertex: {n:,}  edge: {m:,}  bangun DynamicMST: {build_time:.2f} s")
+    print(f"Kruskal ulang per perubahan: {recompute_time * 1000:.1f} ms")
+    print(f"DynamicMST per perubahan:    {update_time * 1000:.3f} ms ({recompute_time / update_time:,.0f}x)")
+
+
+def bench_filter(args):
+    from instrumentation import RunStats
+
+    print("Kruskal full sort vs Filter-Kruskal menurut rasio edge per vertex")
+    rng = np.random.default_rng(17)
+    for m in args.edges:
+        print(f"\nedge: {m:,}")
+        print(f"{'E/V':>6}{'vertex':>12}{'full (s)':>10}{'filter (s)':>12}{'speedup':>9}{'diurutkan':>11}{'difilter':>10}")
+        for ratio in args.ratios:
+            n = max(m // ratio, 2)
+            # Path 0-1-...-(n-1) agar graf terhubung, sisanya edge acak
+            src = np.concatenate((np.arange(n - 1), rng.integers(0, n, m - n + 1)))
+            dst = np.concatenate((np.arange(1, n), rng.integers(0, n, m - n + 1)))
+            weights = rng.integers(1, 1 << 20, m)
+            full, full_time = timed(kruskal_indices, n, src, dst, weights)
+            stats = RunStats(memory=False)
+            filtered, filter_time = timed(filter_kruskal_indices, n, src, dst, weights, stats)
+            if not np.array_equal(full, filtered):
+                raise AssertionError("Hasil Filter-Kruskal berbeda dari Kruskal full sort")
+            print(f"{ratio:>6}{n:>12,}{full_time:>10.2f}{filter_time:>12.2f}{full_time / filter_time:>8.2f}x"
+                  f"{stats.counters['edges_sorted'] / m:>11.1%}{stats.counters['edges_filtered'] / m:>10.1%}")
+
+
+def bench_prim(args):
+    from prim_engine import choose_method, prim_edges
+
+    print("Prim: heapq lazy (lama) vs IndexedMinHeap vs dense O(V^2), menurut kepadatan edge")
+    rng = np.random.default_rng(13)
+    for n in args.vertices:
+        print(f"\nvertex: {n:,}")
+        print(f"{'kepadatan':>10}{'edge':>12}{'lama (s)':>10}{'heap (s)':>10}{'dense (s)':>11}{'otomatis':>10}")
+        upper_u, upper_v = np.triu_indices(n, 1)
+        for density in args.densities:
+            # Pasangan vertex acak tanpa edge ganda; selalu terhubung lewat path 0-1-...-(n-1)
+            m = max(int(density * len(upper_u)), n - 1)
+            pick = rng.choice(len(upper_u), size=m, replace=False)
+            src = np.concatenate((np.arange(n - 1), upper_u[pick]))[:m]
+            dst = np.concatenate((np.arange(1, n), upper_v[pick]))[:m]
+            weights = rng.integers(1, 1000, m)
+            labels = [f"V{i:05d}" for i in range(n)]
+            edges = [[labels[u], labels[v], w] for u, v, w in zip(src.tolist(), dst.tolist(), weights.tolist())]
+
+            old, old_time = timed(prim_baseline, edges, labels[0])
+            expected = sum(w for _, _, w in old)
+            times = {}
+            for method in ('heap', 'dense'):
+                (ids, _, _), times[method] = timed(prim_edges, n, src, dst, weights, 0, method)
+                if weights[ids].sum() != expected:
+                    raise AssertionError(f"Total bobot Prim mode {method} berbeda dari versi lama")
+            print(f"{m / len(upper_u):>10.3f}{m:>12,}{old_time:>10.3f}{times['heap']:>10.3f}"
+                  f"{times['dense']:>11.3f}{choose_method(n, m):>10}")
+
+
+def bench_boruvka(args):
+    from boruvka import ParallelBoruvka
+    from instrumentation import RunStats
+
+    print("Strong scaling Borůvka paralel (shared memory) vs kruskal_engine pada graf acak")
+    rng = np.random.default_rng(11)
+    for m in args.edges:
+        n = max(m // args.degree, 2)
+        src, dst, weights = rng.integers(0, n, m), rng.integers(0, n, m), rng.integers(1, 1000, m)
+        mst, kruskal_time = timed(kruskal_indices, n, src, dst, weights)
+        expected = weights[mst].sum()
+        print(f"\nvertex: {n:,}  edge: {m:,}  kruskal_engine: {kruskal_time:.2f} s")
+        print(f"{'worker':>8}{'waktu (s)':>12}{'speedup':>10}{'efisiensi':>12}{'ronde':>8}")
+
+        baseline = None
+        for workers in args.workers:
+            stats = RunStats(memory=False)
+            with ParallelBoruvka(n, src, dst, weights, workers) as engine:
+                engine.run()  # Pemanasan: worker sudah terpasang ke shared memory
+                result, seconds = timed(engine.run, stats)
+            if weights[result].sum() != expected:
+                raise AssertionError("Total bobot Borůvka berbeda dari Kruskal")
+            baseline = baseline or seconds
+            speedup = baseline / seconds
+            print(f"{workers:>8}{seconds:>12.3f}{speedup:>9.2f}x{speedup / workers:>11.0%}"
+                  f"{stats.counters['rounds']:>8}")
+
+
+def bench_kruskal(args):
+    from edge_loader import EdgeList, build_weighted_graph
+    from kruskal_engine import InternedEdges
+    from main import Graph
+
+    print("Kruskal end-to-end: Graph.kruskal_mst lama vs Graph.kruskal_edges (tanpa print hasil)")
+    print("  EdgeList: graf dari edge_loader, array ID loader dipakai langsung")
+    print("  add_edge: panggilan pertama pada graf dari add_edge (intern sekali); ulang: panggilan berikutnya")
+    print(f"{'edge':>12}{'vertex':>10}{'lama (s)':>10}{'EdgeList (s)':>14}{'add_edge (s)':>14}{'ulang (s)':>11}"
+          f"{'x EdgeList':>12}{'x add_edge':>12}{'x ulang':>9}")
+    for m in args.edges:
+        n = max(m // args.degree, 2)
+        rng = np.random.default_rng(42)
+        src, dst, weights = rng.integers(0, n, m), rng.integers(0, n, m), rng.integers(1, 1000, m)
+        g = build_weighted_graph(Graph, EdgeList([f"V{i}" for i in range(n)], src, dst, weights))
+        old, old_time = timed(kruskal_baseline, g.graph)
+        from_loader, loader_time = timed(g.kruskal_edges)
+        g.interned = InternedEdges()  # Keadaan graf yang diisi add_edge: belum ada ID
+        first, first_time = timed(g.kruskal_edges)
+        repeat, repeat_time = timed(g.kruskal_edges)
+        if not old == from_loader == first == repeat:
+            raise AssertionError("Hasil MST berbeda dari versi lama")
+        del g, old, from_loader, first, repeat
+        print(f"{m:>12,}{n:>10,}{old_time:>10.2f}{loader_time:>14.2f}{first_time:>14.2f}{repeat_time:>11.2f}"
+              f"{old_time / loader_time:>11.1f}x{old_time / first_time:>11.1f}x{old_time / repeat_time:>8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark algoritma MST nomor_2")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    kruskal = sub.add_parser('kruskal', help="Kruskal lama vs kruskal_engine")
+    kruskal.add_argument('--edges', type=int, nargs='+', default=[100000, 1000000])
+    kruskal.add_argument('--degree', type=int, default=10, help="Rasio edge per vertex")
+    kruskal.set_defaults(func=bench_kruskal)
+
+    boruvka = sub.add_parser('boruvka', help="Strong scaling Borůvka paralel")
+    boruvka.add_argument('--edges', type=int, nargs='+', default=[1000000])
+    boruvka.add_argument('--degree', type=int, default=10, help="Rasio edge per vertex")
+    boruvka.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32])
+    boruvka.set_defaults(func=bench_boruvka)
+
+    prim = sub.add_parser('prim', help="Prim heap vs dense menurut kepadatan edge")
+    prim.add_argument('--vertices', type=int, nargs='+', default=[500, 2000])
+    prim.add_argument('--densities', type=float, nargs='+', default=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0])
+    prim.set_defaults(func=bench_prim)
+
+    filter_kruskal = sub.add_parser('filter', help="Kruskal full sort vs Filter-Kruskal")
+    filter_kruskal.add_argument('--edges', type=int, nargs='+', default=[1000000])
+    filter_kruskal.add_argument('--ratios', type=int, nargs='+', default=[2, 5, 10, 50, 100, 500, 1000],
+                                help="Rasio edge per vertex")
+    filter_kruskal.set_defaults(func=bench_filter)
+
+    dynamic = sub.add_parser('dynamic', help="DynamicMST vs Kruskal ulang per perubahan edge")
+    dynamic.add_argument('--check', type=int, default=2000, help="Jumlah operasi acak yang dicek (0 = lewati)")
+    dynamic.add_argument('--vertices', type=int, default=100000)
+    dynamic.add_argument('--degree', type=int, default=10, help="Rasio edge per vertex")
+    dynamic.add_argument('--updates', type=int, default=2000, help="Jumlah delete + insert yang diukur")
+    dynamic.set_defaults(func=bench_dynamic)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""MST Borůvka paralel dengan multiprocessing.shared_memory.
+
+Array edge (src, dst, bobot, ID edge asli) dan array komponen per vertex
+disimpan di shared memory. Setiap ronde:
+  - edge dibagi menjadi chunk tetap untuk process pool; setiap worker
+    mencari edge termurah yang keluar dari setiap komponen di chunk-nya
+    (np.minimum.at, tanpa loop Python) dan sekaligus memadatkan chunk-nya
+    di tempat dengan membuang edge yang kedua ujungnya sudah satu komponen;
+  - proses utama menggabungkan kandidat semua chunk, memilih satu edge
+    termurah per komponen, lalu mengontraksi komponen dengan union-find
+    berbentuk array (hooking + pointer jumping, tanpa loop Python).
+Edge berbobot sama dibandingkan menurut ID edge asli, sehingga urutan
+edge total dan tidak ada siklus di antara edge terpilih. Hasilnya adalah
+MST yang sama persis dengan kruskal_engine (sorted stable), dan jumlah
+komponen minimal berkurang setengah per ronde (paling banyak log2(V)
+ronde).
+"""
+import os
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+
+NO_EDGE = np.iinfo(np.int64).max
+CHUNKS_PER_WORKER = 1  # Edge acak terbagi rata; chunk lebih banyak hanya menambah array O(V) per chunk
+
+_arrays = {}  # Di dalam worker: nama array -> ndarray di atas shared memory
+_segments = []  # Referensi SharedMemory agar tidak di-garbage collect
+
+def _create_shared(array):
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    view[:] = array
+    return shm, view
+
+def _attach(specs):
+    """Initializer worker: memetakan shared memory milik proses utama"""
+    for key, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _segments.append(shm)
+        _arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+def _limit(dtype):
+    return np.inf if dtype.kind == 'f' else np.iinfo(dtype).max
+
+def _cheapest(lo, size, arrays=None):
+    """Edge termurah per komponen di chunk [lo, lo + size).
+
+    Mengembalikan (jumlah edge yang masih hidup, ID edge kandidat). Edge
+    hidup dipindahkan ke awal chunk sehingga ronde berikutnya lebih kecil.
+    """
+    arrays = _arrays if arrays is None else arrays
+    comp = arrays['comp']
+    src, dst = arrays['src'][lo:lo + size], arrays['dst'][lo:lo + size]
+    weights, ids = arrays['weights'][lo:lo + size], arrays['ids'][lo:lo + size]
+
+    comp_u, comp_v = comp[src], comp[dst]
+    live = np.flatnonzero(comp_u != comp_v)
+    alive = len(live)
+    if alive < size:
+        src[:alive], dst[:alive] = src[live], dst[live]
+        weights[:alive], ids[:alive] = weights[live], ids[live]
+        comp_u, comp_v = comp_u[live], comp_v[live]
+    if alive == 0:
+        return 0, np.empty(0, dtype=np.int64)
+    best_id = _cheapest_per_component(len(comp), comp_u, comp_v, weights[:alive], ids[:alive])
+    return alive, np.unique(best_id[best_id != NO_EDGE])  # Edge yang sama bisa terpilih dari kedua ujungnya
+
+def _cheapest_per_component(n, comp_u, comp_v, weights, edge_ids):
+    """Array panjang n: ID edge termurah (bobot, lalu ID terkecil) per komponen, atau NO_EDGE"""
+    best = np.full(n, _limit(weights.dtype), dtype=weights.dtype)
+    np.minimum.at(best, comp_u, weights)
+    np.minimum.at(best, comp_v, weights)
+    best_id = np.full(n, NO_EDGE, dtype=np.int64)
+    hit = weights == best[comp_u]
+    np.minimum.at(best_id, comp_u[hit], edge_ids[hit])
+    hit = weights == best[comp_v]
+    np.minimum.at(best_id, comp_v[hit], edge_ids[hit])
+    return best_id
+
+class ParallelBoruvka:
+    """Mesin Borůvka paralel; shared memory dan pool dibuat sekali per graf"""
+
+    def __init__(self, num_vertices, src, dst, weights, workers=None):
+        self.n = num_vertices
+        self.src = np.asarray(src, dtype=np.int64)
+        self.dst = np.asarray(dst, dtype=np.int64)
+        self.weights = np.asarray(weights)
+        self.workers = workers or os.cpu_count() or 1
+
+        initial = {
+            'src': self.src,
+            'dst': self.dst,
+            'weights': self.weights,
+            'ids': np.arange(len(self.src), dtype=np.int64),
+            'comp': np.arange(num_vertices, dtype=np.int64),
+        }
+        self._shm = []
+        self.arrays = {}
+        specs = {}
+        for key, array in initial.items():
+            shm, view = _create_shared(array)
+            self._shm.append(shm)
+            self.arrays[key] = view
+            specs[key] = (shm.name, array.shape, array.dtype)
+
+        # Chunk tetap; setiap chunk dipadatkan di tempat oleh worker-nya
+        chunks = self.workers * CHUNKS_PER_WORKER if self.workers > 1 else 1
+        step = max(-(-len(self.src) // chunks), 1)
+        self.starts = list(range(0, len(self.src), step))
+        self.full_sizes = [min(step, len(self.src) - lo) for lo in self.starts]
+
+        self.pool = None
+        if self.workers > 1:
+            self.pool = get_context().Pool(self.workers, initializer=_attach, initargs=(specs,))
+
+    def run(self, stats=None):
+        """Index edge MST (minimum spanning forest) sesuai ronde ditemukan (np.int64).
+
+        stats: RunStats (nomor_1/instrumentation.py) untuk counter rounds,
+        edges_scanned dan unions.
+        """
+        # Kembalikan array shared ke keadaan awal (run sebelumnya memadatkannya)
+        arrays = self.arrays
+        arrays['src'][:], arrays['dst'][:], arrays['weights'][:] = self.src, self.dst, self.weights
+        arrays['ids'][:] = np.arange(len(self.src))
+        comp = arrays['comp']
+        comp[:] = np.arange(self.n)
+        sizes = list(self.full_sizes)
+
+        mst = []
+        rounds = scanned = 0
+
+        while True:
+            tasks = [(lo, size) for lo, size in zip(self.starts, sizes) if size]
+            if not tasks:
+                break
+            scanned += sum(size for _, size in tasks)
+            if self.pool is None:
+                results = [_cheapest(lo, size, self.arrays) for lo, size in tasks]
+            else:
+                results = self.pool.starmap(_cheapest, tasks)
+            alive = dict(zip((lo for lo, _ in tasks), (count for count, _ in results)))
+            sizes = [alive.get(lo, 0) for lo in self.starts]
+
+            candidates = np.concatenate([ids for _, ids in results])
+            if len(candidates) == 0:
+                break
+            rounds += 1
+
+            # Satu edge termurah per komponen dari kandidat semua chunk
+            best_id = _cheapest_per_component(self.n, comp[self.src[candidates]], comp[self.dst[candidates]],
+                                              self.weights[candidates], candidates)
+            components = np.flatnonzero(best_id != NO_EDGE)
+            chosen = best_id[components]
+            mst.append(np.unique(chosen))
+
+            # Kontraksi dengan union-find berbentuk array: setiap komponen menunjuk
+            # komponen di ujung lain edge pilihannya. Karena urutan edge total,
+            # satu-satunya siklus adalah pasangan yang memilih edge yang sama;
+            # komponen dengan ID terkecil di pasangan itu menjadi root.
+            comp_u, comp_v = comp[self.src[chosen]], comp[self.dst[chosen]]
+            parent = np.arange(self.n, dtype=np.int64)
+            parent[components] = np.where(comp_u == components, comp_v, comp_u)
+            mutual = (parent[parent[components]] == components) & (components < parent[components])
+            parent[components[mutual]] = components[mutual]
+            while True:  # Pointer jumping sampai setiap komponen menunjuk root
+                jumped = parent[parent]
+                if np.array_equal(jumped, parent):
+                    break
+                parent = jumped
+            comp[:] = parent[comp]
+
+        mst = np.concatenate(mst) if mst else np.empty(0, dtype=np.int64)
+        if stats:
+            stats.add(rounds=rounds, edges_scanned=scanned, unions=len(mst))
+        return mst
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+        self.arrays = {}
+        for shm in self._shm:
+            shm.close()
+            shm.unlink()
+        self._shm = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def boruvka_indices(num_vertices, src, dst, weights, workers=None, stats=None):
+    """Borůvka paralel sekali jalan; index edge MST seperti kruskal_engine.kruskal_indices"""
+    with ParallelBoruvka(num_vertices, src, dst, weights, workers) as engine:
+        return engine.run(stats)
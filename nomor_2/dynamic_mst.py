@@ -0,0 +1,364 @@
+"""MST dinamis: edge bisa ditambah dan dihapus tanpa menghitung ulang Kruskal.
+
+Graph.kruskal_mst mengurutkan dan memindai ulang semua edge setiap kali
+topologi berubah. DynamicMST menyimpan minimum spanning forest dan
+memperbaruinya per perubahan:
+  - insert_edge: link-cut tree (splay tree, edge disimpan sebagai node
+    sendiri) memberi edge terberat di path u..v dalam O(log V) amortized.
+    Jika u dan v belum terhubung, edge langsung masuk forest; jika edge
+    baru lebih ringan dari edge terberat di path itu, keduanya ditukar.
+  - delete_edge: edge non-forest cukup dibuang, O(1). Jika edge forest
+    yang dihapus, forest terbelah dua; BFS bergantian dari kedua ujung
+    berhenti setelah komponen yang lebih kecil habis, lalu edge pengganti
+    termurah dicari di antara edge non-forest yang keluar dari komponen
+    kecil itu. Biayanya sebanding dengan ukuran dan derajat sisi yang
+    lebih kecil, bukan E.
+Bobot sama dibandingkan menurut urutan insert (ID edge), sama seperti sort
+stable di kruskal_engine, sehingga forest selalu sama persis dengan
+menghitung ulang Kruskal atas edge yang tersisa sesuai urutan insert
+(`python benchmark.py dynamic`).
+
+Contoh:
+    mst = DynamicMST.from_edges(g.graph)
+    mst.insert_edge('A', 'V5', 2)
+    mst.delete_edge('V2', 'V3')
+    print(mst.total_weight())
+"""
+from collections import deque
+from fractions import Fraction
+from itertools import count
+from numbers import Integral
+
+from kruskal_engine import filter_kruskal_indices, intern_edges
+
+class LinkCutTree:
+    """Forest berakar dinamis atas node 0..n-1 dengan agregat node berkey terbesar per path.
+
+    key[x] None untuk node tanpa key (vertex); node berkey adalah edge.
+    """
+
+    def __init__(self):
+        self.left, self.right, self.parent = [], [], []
+        self.flip = []  # Lazy reversal (make_root)
+        self.key = []
+        self.top = []  # Node dengan key terbesar di subtree splay, -1 jika tidak ada
+
+    def add_node(self, key=None):
+        x = len(self.key)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flip.append(False)
+        self.key.append(key)
+        self.top.append(x if key is not None else -1)
+        return x
+
+    def reset_node(self, x, key=None):
+        """Memakai ulang node x yang sudah terlepas dari semua tree"""
+        self.left[x] = self.right[x] = self.parent[x] = -1
+        self.flip[x] = False
+        self.key[x] = key
+        self.top[x] = x if key is not None else -1
+
+    def _is_splay_root(self, x):
+        p = self.parent[x]
+        return p < 0 or (self.left[p] != x and self.right[p] != x)
+
+    def _push(self, x):
+        if self.flip[x]:
+            left, right = self.left[x], self.right[x]
+            self.left[x], self.right[x] = right, left
+            if left >= 0:
+                self.flip[left] = not self.flip[left]
+            if right >= 0:
+                self.flip[right] = not self.flip[right]
+            self.flip[x] = False
+
+    def _pull(self, x):
+        key, top = self.key, self.top
+        best = x if key[x] is not None else -1
+        for child in (self.left[x], self.right[x]):
+            if child >= 0:
+                candidate = top[child]
+                if candidate >= 0 and (best < 0 or key[candidate] > key[best]):
+                    best = candidate
+        top[x] = best
+
+    def _rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if not self._is_splay_root(p):
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        parent[x] = g
+        if left[p] == x:
+            left[p] = right[x]
+            if right[x] >= 0:
+                parent[right[x]] = p
+            right[x] = p
+        else:
+            right[p] = left[x]
+            if left[x] >= 0:
+                parent[left[x]] = p
+            left[x] = p
+        parent[p] = x
+        self._pull(p)
+        self._pull(x)
+
+    def _splay(self, x):
+        # Turunkan lazy reversal dari root splay ke x sebelum rotasi
+        path = [x]
+        y = x
+        while not self._is_splay_root(y):
+            y = self.parent[y]
+            path.append(y)
+        for y in reversed(path):
+            self._push(y)
+
+        parent = self.parent
+        while not self._is_splay_root(x):
+            p = parent[x]
+            if not self._is_splay_root(p):
+                g = parent[p]
+                # zig-zig memutar parent dulu, zig-zag memutar x dua kali
+                if (self.left[g] == p) == (self.left[p] == x):
+                    self._rotate(p)
+                else:
+                    self._rotate(x)
+            self._rotate(x)
+
+    def _access(self, x):
+        """Menjadikan path root..x satu splay tree dengan x sebagai root-nya"""
+        last = -1
+        y = x
+        while y >= 0:
+            self._splay(y)
+            self.right[y] = last
+            self._pull(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def make_root(self, x):
+        self._access(x)
+        self.flip[x] = not self.flip[x]
+
+    def find_root(self, x):
+        self._access(x)
+        while True:
+            self._push(x)
+            if self.left[x] < 0:
+                break
+            x = self.left[x]
+        self._splay(x)
+        return x
+
+    def connected(self, x, y):
+        return x == y or self.find_root(x) == self.find_root(y)
+
+    def link(self, x, y):
+        """Menghubungkan x dan y yang berada di tree berbeda"""
+        self.make_root(x)
+        self.parent[x] = y
+
+    def cut(self, x, y):
+        """Memutus edge tree x-y"""
+        self.make_root(x)
+        self._access(y)
+        # x sekarang anak kiri y dan tidak punya anak kanan
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._pull(y)
+
+    def path_max(self, x, y):
+        """Node berkey terbesar di path x..y (x dan y harus terhubung), -1 jika tidak ada"""
+        self.make_root(x)
+        self._access(y)
+        return self.top[y]
+
+class DynamicMST:
+    """Minimum spanning forest yang diperbarui per insert_edge/delete_edge"""
+
+    def __init__(self):
+        self.tree = LinkCutTree()
+        self.index = {}  # Label vertex -> node di tree
+        self.edges = {}  # ID edge -> (u, v, w)
+        self.pairs = {}  # frozenset({u, v}) -> ID edge u-v sesuai urutan insert
+        self.edge_node = {}  # ID edge forest -> node di tree
+        self.free_nodes = []
+        self.tree_adj = {}  # Node vertex -> ID edge forest yang menyentuhnya
+        self.other_adj = {}  # Node vertex -> ID edge non-forest yang menyentuhnya
+        self.weight = 0  # Total bobot forest secara eksak (int, atau Fraction jika ada bobot pecahan)
+        self.float_edges = 0  # Jumlah edge forest berbobot non-integer
+        self._ids = count()
+
+    @classmethod
+    def from_edges(cls, edges):
+        """DynamicMST dari list [u, v, w] (mis. Graph.graph); ID edge sesuai urutan list.
+
+        Forest awal dihitung sekali dengan Filter-Kruskal, bukan dengan
+        insert_edge satu per satu.
+        """
+        mst = cls()
+        if not edges:
+            return mst
+        labels, src, dst, weights = intern_edges(edges)
+        forest = set(filter_kruskal_indices(len(labels), src, dst, weights).tolist())
+        for e, (u, v, w) in enumerate(edges):
+            x, y = mst._vertex(u), mst._vertex(v)
+            mst.edges[e] = (u, v, w)
+            mst.pairs.setdefault(frozenset((u, v)), []).append(e)
+            if e in forest:
+                mst._link(e, x, y)
+            else:
+                mst.other_adj[x].add(e)
+                mst.other_adj[y].add(e)
+        mst._ids = count(len(edges))
+        return mst
+
+    def _vertex(self, label):
+        x = self.index.get(label)
+        if x is None:
+            x = self.tree.add_node()
+            self.index[label] = x
+            self.tree_adj[x] = set()
+            self.other_adj[x] = set()
+        return x
+
+    def _link(self, e, x, y):
+        key = (self.edges[e][2], e)
+        if self.free_nodes:
+            node = self.free_nodes.pop()
+            self.tree.reset_node(node, key)
+        else:
+            node = self.tree.add_node(key)
+        self.tree.link(x, node)
+        self.tree.link(node, y)
+        self.edge_node[e] = node
+        self.tree_adj[x].add(e)
+        self.tree_adj[y].add(e)
+        self._add_weight(self.edges[e][2], 1)
+
+    def _cut(self, e, x, y):
+        node = self.edge_node.pop(e)
+        self.tree.cut(x, node)
+        self.tree.cut(node, y)
+        self.free_nodes.append(node)
+        self.tree_adj[x].discard(e)
+        self.tree_adj[y].discard(e)
+        self._add_weight(self.edges[e][2], -1)
+
+    def _endpoints(self, e):
+        u, v, _ = self.edges[e]
+        return self.index[u], self.index[v]
+
+    def insert_edge(self, u, v, w):
+        """Menambahkan edge u-v berbobot w; mengembalikan ID edge"""
+        x, y = self._vertex(u), self._vertex(v)
+        e = next(self._ids)
+        self.edges[e] = (u, v, w)
+        self.pairs.setdefault(frozenset((u, v)), []).append(e)
+
+        if x == y:
+            self.other_adj[x].add(e)  # Self-loop tidak pernah masuk forest
+        elif not self.tree.connected(x, y):
+            self._link(e, x, y)
+        else:
+            # Edge terberat di path x..y keluar dari forest jika lebih berat dari edge baru
+            heaviest = self.tree.key[self.tree.path_max(x, y)][1]
+            if (self.edges[heaviest][2], heaviest) > (w, e):
+                hx, hy = self._endpoints(heaviest)
+                self._cut(heaviest, hx, hy)
+                self.other_adj[hx].add(heaviest)
+                self.other_adj[hy].add(heaviest)
+                self._link(e, x, y)
+            else:
+                self.other_adj[x].add(e)
+                self.other_adj[y].add(e)
+        return e
+
+    def delete_edge(self, u, v):
+        """Menghapus edge u-v yang paling akhir diinsert; mengembalikan (u, v, w).
+
+        KeyError jika tidak ada edge u-v.
+        """
+        pair = frozenset((u, v))
+        ids = self.pairs.get(pair)
+        if not ids:
+            raise KeyError(f"Edge {u}-{v} tidak ada")
+        e = ids.pop()
+        if not ids:
+            del self.pairs[pair]
+        x, y = self._endpoints(e)
+
+        if e not in self.edge_node:
+            self.other_adj[x].discard(e)
+            self.other_adj[y].discard(e)
+            return self.edges.pop(e)
+
+        self._cut(e, x, y)
+        replacement = self._replacement(x, y)
+        if replacement is not None:
+            rx, ry = self._endpoints(replacement)
+            self.other_adj[rx].discard(replacement)
+            self.other_adj[ry].discard(replacement)
+            self._link(replacement, rx, ry)
+        return self.edges.pop(e)
+
+    def _smaller_side(self, x, y):
+        """Himpunan vertex komponen yang lebih kecil di antara komponen x dan y.
+
+        BFS dari x dan y dijalankan bergantian satu vertex per langkah dan
+        berhenti begitu salah satunya habis, sehingga biayanya O(sisi kecil).
+        """
+        searches = []
+        for start in (x, y):
+            searches.append((deque([start]), {start}))
+        while True:
+            for queue, seen in searches:
+                if not queue:
+                    return seen
+                a = queue.popleft()
+                for e in self.tree_adj[a]:
+                    p, q = self._endpoints(e)
+                    b = q if p == a else p
+                    if b not in seen:
+                        seen.add(b)
+                        queue.append(b)
+
+    def _replacement(self, x, y):
+        """ID edge non-forest termurah yang menyambung kembali komponen x dan y, atau None"""
+        side = self._smaller_side(x, y)
+        best = None
+        for a in side:
+            for e in self.other_adj[a]:
+                p, q = self._endpoints(e)
+                if (p in side) != (q in side) and (best is None or (self.edges[e][2], e) < best):
+                    best = (self.edges[e][2], e)
+        return best[1] if best else None
+
+    def _add_weight(self, w, sign):
+        # Float dijumlahkan sebagai Fraction agar tidak ada galat pembulatan yang menumpuk
+        if isinstance(w, Integral):
+            self.weight += sign * w
+        else:
+            self.weight += sign * Fraction(w)
+            self.float_edges += sign
+
+    def total_weight(self):
+        """Total bobot forest; untuk bobot float dibulatkan sekali (sama dengan math.fsum)"""
+        if self.float_edges:
+            return float(self.weight)
+        return int(self.weight)
+
+    def mst_edges(self):
+        """Edge forest sebagai list (u, v, w) sesuai urutan insert"""
+        return [self.edges[e] for e in sorted(self.edge_node)]
+
+    def connected(self, u, v):
+        if u not in self.index or v not in self.index:
+            return u == v
+        return self.tree.connected(self.index[u], self.index[v])
@@ -0,0 +1,250 @@
+"""Kruskal berbasis array untuk graf besar.
+
+Graph.kruskal_mst lama mengurutkan list [u, v, w] dengan key lambda dan
+menyimpan parent/rank di dict dengan find rekursif (bisa melewati batas
+rekursi pada rantai parent yang panjang). Engine ini:
+  - meng-intern label vertex menjadi ID integer 0..n-1;
+  - mengurutkan bobot dengan numpy.argsort (stable, sehingga urutan edge
+    berbobot sama dan hasil MST sama seperti sorted() lama);
+  - memproses edge terurut per blok: edge yang kedua ujungnya sudah satu
+    komponen pada awal blok ditolak sekaligus dengan NumPy (array root
+    yang dirapatkan dengan pointer jumping), sisanya melalui union-find
+    iteratif (path halving) dengan union by rank;
+  - berhenti setelah n - 1 edge diterima;
+  - mengembalikan MST sebagai array index edge.
+
+filter_kruskal_indices (Filter-Kruskal) tidak mengurutkan semua edge:
+edge dipartisi di sekitar bobot pivot, bagian ringan diproses lebih dulu,
+dan edge berat yang kedua ujungnya sudah terhubung dibuang sebelum
+diurutkan. Pada graf acak hanya sekitar V dari E edge yang masuk MST,
+sehingga sebagian besar edge tidak pernah diurutkan (`python benchmark.py
+filter`). Hasilnya sama persis dengan kruskal_indices.
+
+Contoh:
+    labels, src, dst, weights = intern_edges(g.graph)
+    mst = filter_kruskal_indices(len(labels), src, dst, weights)
+    total = weights[mst].sum()
+"""
+from collections import defaultdict
+from itertools import count
+from operator import itemgetter
+
+import numpy as np
+
+BLOCK_MIN = 1 << 14  # Edge per blok minimum (blok = max(BLOCK_MIN, jumlah vertex))
+PIVOT_SAMPLE = 1024  # Ukuran sampel untuk memilih pivot Filter-Kruskal
+
+def intern_edges(edges, sort_labels=False):
+    """(labels, src, dst, weights) dari list [u, v, w].
+
+    ID label sesuai urutan kemunculan, atau urutan label jika sort_labels
+    (sehingga membandingkan ID sama dengan membandingkan label; diabaikan
+    jika label tidak bisa diurutkan).
+    """
+    # Label baru mendapat ID berikutnya lewat __missing__; map/itemgetter menjaga loop di C
+    index = defaultdict(count().__next__)
+    lookup = index.__getitem__
+    src = np.fromiter(map(lookup, map(itemgetter(0), edges)), dtype=np.int64, count=len(edges))
+    dst = np.fromiter(map(lookup, map(itemgetter(1), edges)), dtype=np.int64, count=len(edges))
+    weights = np.array(list(map(itemgetter(2), edges)))
+    if weights.dtype == object or weights.size == 0:
+        weights = weights.astype(np.float64)
+    labels = list(index)
+    if sort_labels:
+        try:
+            order = sorted(range(len(labels)), key=labels.__getitem__)
+        except TypeError:
+            return labels, src, dst, weights
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        labels = [labels[i] for i in order]
+        src, dst = rank[src], rank[dst]
+    return labels, src, dst, weights
+
+class InternedEdges:
+    """ID integer untuk list edge [u, v, w] milik Graph, di-intern sekali.
+
+    arrays(edges) hanya meng-intern edge yang ditambahkan sejak panggilan
+    sebelumnya, sehingga kruskal_mst berulang tidak mengulang interning.
+    Graph yang dibangun dari EdgeList (nomor_1/edge_loader.py) memakai array
+    ID milik loader langsung lewat assign().
+    """
+
+    def __init__(self):
+        self.index = defaultdict(count().__next__)
+        self.labels = []
+        self.src = self.dst = self.weights = None
+        self.count = 0  # Jumlah edge awal list yang sudah di-intern
+
+    def assign(self, labels, src, dst, weights):
+        """Memakai array ID yang sudah ada; label yang sama (mis. setelah upper()) digabung"""
+        index = defaultdict(count().__next__)
+        remap = np.fromiter(map(index.__getitem__, labels), dtype=np.int64, count=len(labels))
+        if len(index) != len(labels):
+            src, dst = remap[src], remap[dst]
+        self.index, self.labels = index, list(index)
+        self.src, self.dst, self.weights = src, dst, weights
+        self.count = len(src)
+
+    def arrays(self, edges):
+        """(labels, src, dst, weights) untuk seluruh edges, seperti intern_edges(edges)"""
+        if len(edges) < self.count:  # List edge diganti: intern ulang dari awal
+            self.__init__()
+        if len(edges) > self.count or self.src is None:
+            new = edges[self.count:]
+            lookup = self.index.__getitem__
+            src = np.fromiter(map(lookup, map(itemgetter(0), new)), dtype=np.int64, count=len(new))
+            dst = np.fromiter(map(lookup, map(itemgetter(1), new)), dtype=np.int64, count=len(new))
+            weights = np.array(list(map(itemgetter(2), new)))
+            if weights.dtype == object or weights.size == 0:
+                weights = weights.astype(np.float64)
+            if self.src is not None and self.count:
+                src, dst = np.concatenate((self.src, src)), np.concatenate((self.dst, dst))
+                weights = np.concatenate((self.weights, weights))
+            self.src, self.dst, self.weights = src, dst, weights
+            self.labels = list(self.index)
+            self.count = len(edges)
+        return self.labels, self.src, self.dst, self.weights
+
+def sorted_order(weights):
+    """Urutan edge menurut bobot; edge berbobot sama tetap sesuai urutan input"""
+    return np.argsort(weights, kind='stable')
+
+def _scan_sorted(sorted_src, sorted_dst, root, rank, accepted, target, block):
+    """Memproses edge terurut per blok; posisi edge yang diterima ditambahkan ke accepted.
+
+    root harus rapat (setiap vertex menunjuk langsung ke root komponennya)
+    dan tetap rapat saat dikembalikan. Berhenti setelah target edge
+    diterima. Mengembalikan (root, jumlah edge yang diperiksa).
+    """
+    scanned = 0
+    for lo in range(0, len(sorted_src), block):
+        if len(accepted) >= target:
+            break
+        # Edge yang kedua ujungnya sudah satu komponen di awal blok ditolak sekaligus
+        root_u = root[sorted_src[lo:lo + block]]
+        root_v = root[sorted_dst[lo:lo + block]]
+        candidates = np.flatnonzero(root_u != root_v)
+
+        # Sisa edge diproses berurutan; union di dalam blok dicatat di dict merged
+        merged = {}
+        get = merged.get
+        scanned_block = len(root_u)
+        for k, u, v in zip(candidates.tolist(), root_u[candidates].tolist(), root_v[candidates].tolist()):
+            parent = get(u, u)
+            while parent != u:  # find iteratif dengan path halving
+                grand = get(parent, parent)
+                if grand != parent:
+                    merged[u] = grand
+                u = grand
+                parent = get(u, u)
+            parent = get(v, v)
+            while parent != v:
+                grand = get(parent, parent)
+                if grand != parent:
+                    merged[v] = grand
+                v = grand
+                parent = get(v, v)
+            if u == v:
+                continue
+            if rank[u] < rank[v]:  # Union by rank
+                u, v = v, u
+            merged[v] = u
+            if rank[u] == rank[v]:
+                rank[u] += 1
+            accepted.append(lo + k)
+            if len(accepted) == target:
+                scanned_block = k + 1
+                break
+        scanned += scanned_block
+
+        if merged:
+            # Terapkan union ke array root lalu rapatkan dengan pointer jumping
+            root[np.fromiter(merged.keys(), np.int64, len(merged))] = \
+                np.fromiter(merged.values(), np.int64, len(merged))
+            while True:
+                jumped = root[root]
+                if np.array_equal(jumped, root):
+                    break
+                root = jumped
+    return root, scanned
+
+def kruskal_indices(num_vertices, src, dst, weights, stats=None, order=None):
+    """Index edge minimum spanning forest sesuai urutan ditambahkan (np.int64).
+
+    stats: RunStats (nomor_1/instrumentation.py) untuk counter finds, unions
+    dan edges_scanned.
+    order: hasil sorted_order(weights) jika sudah dihitung.
+    """
+    if order is None:
+        order = sorted_order(weights)
+    root = np.arange(num_vertices)  # Root setiap vertex pada awal blok
+    rank = [0] * num_vertices
+    mst = []
+    root, scanned = _scan_sorted(src[order], dst[order], root, rank, mst,
+                                 num_vertices - 1, max(BLOCK_MIN, num_vertices))
+
+    if stats:
+        stats.add(finds=2 * scanned, unions=len(mst), edges_scanned=scanned)
+    return order[np.array(mst, dtype=np.int64)]
+
+def _pivot(weights):
+    """Median dari sampel bobot berjarak tetap (selalu salah satu bobot yang ada)"""
+    sample = weights[::max(len(weights) // PIVOT_SAMPLE, 1)]
+    middle = len(sample) // 2
+    return np.partition(sample, middle)[middle]
+
+def filter_kruskal_indices(num_vertices, src, dst, weights, stats=None):
+    """Seperti kruskal_indices (hasil dan urutan sama persis), dengan Filter-Kruskal.
+
+    Edge dipartisi menurut bobot pivot dan bagian ringan diproses lebih
+    dulu. Edge di bagian berat yang kedua ujungnya sudah satu komponen
+    dibuang sebelum diurutkan, sehingga hanya edge yang masih mungkin masuk
+    MST yang ikut diurutkan. Counter stats: finds, unions, edges_scanned,
+    edges_filtered dan edges_sorted.
+    """
+    root = np.arange(num_vertices)
+    rank = [0] * num_vertices
+    mst = []
+    target = num_vertices - 1
+    block = max(BLOCK_MIN, num_vertices)
+    scanned = filtered = sorted_count = 0
+
+    # Stack (index edge, perlu difilter); bagian ringan selalu di atas bagian beratnya.
+    # Index tetap naik di setiap bagian, sehingga sort stable memutus bobot sama menurut urutan input.
+    stack = [(np.arange(len(weights), dtype=np.int64), False)]
+    while stack and len(mst) < target:
+        ids, needs_filter = stack.pop()
+        if needs_filter:
+            keep = root[src[ids]] != root[dst[ids]]
+            kept = np.flatnonzero(keep)
+            filtered += len(ids) - len(kept)
+            ids = ids[kept]
+        if len(ids) > block:
+            part = weights[ids]
+            pivot = _pivot(part)
+            light = part < pivot
+            if not light.any():  # Pivot adalah bobot terkecil
+                light = part == pivot
+            if not light.all():  # Semua bobot sama: langsung diurutkan
+                stack.append((ids[~light], True))
+                stack.append((ids[light], False))
+                continue
+
+        ids = ids[sorted_order(weights[ids])]
+        sorted_count += len(ids)
+        accepted = []
+        root, count = _scan_sorted(src[ids], dst[ids], root, rank, accepted, target - len(mst), block)
+        scanned += count
+        mst.extend(ids[np.array(accepted, dtype=np.int64)].tolist())
+
+    if stats:
+        stats.add(finds=2 * scanned, unions=len(mst), edges_scanned=scanned,
+                  edges_filtered=filtered, edges_sorted=sorted_count)
+    return np.array(mst, dtype=np.int64)
+
+def minimum_spanning_forest(edges, stats=None):
+    """MST dari list [u, v, w]: (labels, src, dst, weights) berisi edge MST saja"""
+    labels, src, dst, weights = intern_edges(edges)
+    mst = filter_kruskal_indices(len(labels), src, dst, weights, stats)
+    return labels, src[mst], dst[mst], weights[mst]
@@ -1,85 +1,65 @@
+import contextlib
 import heapq
-import networkx as nx
-import matplotlib.pyplot as plt
-from matplotlib.widgets import Button
+import os
+import sys
 from collections import defaultdict
 
+from kruskal_engine import InternedEdges, kruskal_indices, sorted_order
+from mst_steps import StepStream
+from prim_engine import prim_mst_edges
+
+# edge_loader dan layout_cache berada di folder nomor_1
+_NOMOR_1 = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'nomor_1'))
+if _NOMOR_1 not in sys.path:
+    sys.path.append(_NOMOR_1)
+
+from edge_loader import create_graph_from_file
+
 class Graph:
     def __init__(self, vertices_count=0):
         self.V = vertices_count
         self.graph = []
         self.vertices_set = set()
+        self.interned = InternedEdges()  # ID integer edge untuk kruskal_engine
 
     def add_edge(self, u, v, w):
         self.graph.append([u, v, w])
         self.vertices_set.add(u)
         self.vertices_set.add(v)
         self.V = len(self.vertices_set)
-
-    def find(self, parent, i): 
-        if parent[i] != i: 
-            parent[i] = self.find(parent, parent[i]) 
-        return parent[i]
-    
-    def union(self, parent, rank, x, y):        
-        if rank[x] < rank[y]:
-            parent[x] = y
-        elif rank[x] > rank[y]:
-            parent[y] = x
-        else:
-            parent[y] = x
-            rank[x] += 1
     
     # Algoritma Kruskal
-    def kruskal_mst(self):
-        steps = []
+    def kruskal_mst(self, stats=None):
+        """Langkah animasi Kruskal sebagai StepStream (dihitung saat diakses).
+
+        stats: RunStats (nomor_1/instrumentation.py); counter finds, unions dan
+        edges_scanned ditambahkan setelah langkah terakhir dihitung.
+        """
+        return StepStream(self._kruskal_deltas(stats), "Kruskal")
+
+    def _kruskal_deltas(self, stats=None):
         result_edges = []
         total_weight = 0
 
-        sorted_graph = sorted(self.graph, key=lambda item: item[2])
-        
-        parent = {vertex: vertex for vertex in self.vertices_set}
-        rank = {vertex: 0 for vertex in self.vertices_set}
-
-        steps.append({
-            "title": "Algoritma Kruskal",
-            "mst_edges": [],
-            "considered_edge": None,
-            "total_weight": 0
-        })
-
-        for u, v, w in sorted_graph:
-            steps.append({
-                "title": "Algoritma Kruskal",
-                "sub_title": f"Mempertimbangkan edge ({u}, {v}) dengan bobot {w}",
-                "mst_edges": [tuple(edge) for edge in result_edges], 
-                "considered_edge": (u, v, w),
-                "total_weight": total_weight
-            })
-
-            root_u = self.find(parent, u)
-            root_v = self.find(parent, v)
-
-            if root_u != root_v:
-                self.union(parent, rank, root_u, root_v)
-                result_edges.append([u, v, w])
+        # MST dihitung sekaligus oleh kruskal_engine; langkah animasi diputar dari hasilnya
+        with stats.phase('kruskal_engine') if stats else contextlib.nullcontext():
+            labels, src, dst, weights = self.interned.arrays(self.graph)
+            order = sorted_order(weights)
+            accepted = set(kruskal_indices(len(labels), src, dst, weights, stats, order).tolist())
+
+        yield 'start', None
+
+        for i in order.tolist():
+            u, v, w = self.graph[i]
+            edge = (u, v, w)
+            yield 'consider', edge
+
+            if i in accepted:
+                result_edges.append(edge)
                 total_weight += w
-                
-                steps.append({
-                    "title": "Algoritma Kruskal",
-                    "sub_title": f"Edge ({u}, {v}) ditambahkan ke MST",
-                    "mst_edges": [tuple(edge) for edge in result_edges],
-                    "considered_edge": None,
-                    "total_weight": total_weight
-                })
+                yield 'add', edge
             else:
-                steps.append({
-                    "title": "Algoritma Kruskal",
-                    "sub_title": f"Edge ({u}, {v}) ditolak karena membentuk siklus",
-                    "mst_edges": [tuple(edge) for edge in result_edges],
-                    "considered_edge": None,
-                    "total_weight": total_weight
-                })
+                yield 'reject', edge
         
         print("\n=== HASIL KRUSKAL ===")
         print("Edge dalam MST:")
@@ -88,79 +68,49 @@ class Graph:
         print(f"Total bobot MST: {total_weight}")
         print("=" * 25)
         
-        steps.append({
-            "title": "Hasil MST dengan Algoritma Kruskal",
-            "sub_title": f"Total Bobot MST: {total_weight}",
-            "mst_edges": [tuple(edge) for edge in result_edges],
-            "considered_edge": None,
-            "total_weight": total_weight
-        })
-        return steps
+        yield 'done', None
     
     # Algoritma Prim
-    def prim_mst(self, start_vertex):
-        steps = []
-        mst_set = set()
-        min_heap = []
-        total_weight = 0
-        mst_edges = []
+    def prim_mst(self, start_vertex, stats=None):
+        """Langkah animasi Prim sebagai StepStream (dihitung saat diakses).
+
+        stats: RunStats; counter prim_engine (heap_push, heap_pop, decrease_key,
+        expanded dan edges_scanned) ditambahkan saat langkah pertama dihitung.
+        """
+        if start_vertex not in self.vertices_set:
+            print(f"Error: Start vertex '{start_vertex}' tidak ditemukan pada graph untuk Prim.")
+            return StepStream((), "Prim", start_vertex)
+        return StepStream(self._prim_deltas(start_vertex, stats), "Prim", start_vertex)
+
+    def _prim_deltas(self, start_vertex, stats=None):
+        # Hasil MST dari prim_engine; langkah animasi tetap memutar ulang heapq lazy
+        # agar edge kandidat dan pop basi (ditolak) terlihat seperti sebelumnya
+        with stats.phase('prim_engine') if stats else contextlib.nullcontext():
+            mst_edges = prim_mst_edges(self.graph, start_vertex, stats=stats)
+        total_weight = sum(w for _, _, w in mst_edges)
+
+        yield 'start', None
 
         adj = defaultdict(list)
         for u, v, w in self.graph:
             adj[u].append((v, w))
             adj[v].append((u, w))
-        
-        if start_vertex not in self.vertices_set:
-            print(f"Error: Start vertex '{start_vertex}' tidak ditemukan pada graph untuk Prim.")
-            return steps
-
-        steps.append({
-            "title": f"Algoritma Prim - Mulai dari verteks {start_vertex}",
-            "mst_edges": [],
-            "visited_nodes": [start_vertex],
-            "considered_edge": None,
-            "total_weight": 0
-        })
 
-        mst_set.add(start_vertex)
-        for v, w in adj[start_vertex]:
-            heapq.heappush(min_heap, (w, start_vertex, v))
+        mst_set = {start_vertex}
+        min_heap = [(w, start_vertex, v) for v, w in adj[start_vertex]]
+        heapq.heapify(min_heap)
 
         while min_heap and len(mst_set) < len(self.vertices_set):
             w, u, v = heapq.heappop(min_heap)
-            
-            steps.append({
-                "title": "Algoritma Prim",
-                "sub_title": f"Mempertimbangkan edge ({u}, {v}) dengan bobot {w}",
-                "mst_edges": [tuple(edge) for edge in mst_edges],
-                "visited_nodes": list(mst_set),
-                "considered_edge": (u, v, w),
-                "total_weight": total_weight
-            })
+            edge = (u, v, w)
+            yield 'consider', edge
 
             if v in mst_set:
-                steps.append({
-                    "title": "Algoritma Prim",
-                    "sub_title": f"Edge ({u}, {v}) ditolak karena membentuk siklus",
-                    "mst_edges": [tuple(edge) for edge in mst_edges],
-                    "visited_nodes": list(mst_set),
-                    "considered_edge": None, # No longer considered, it's rejected
-                    "total_weight": total_weight
-                })
+                yield 'reject', edge
                 continue
-            
+
             mst_set.add(v)
-            total_weight += w
-            mst_edges.append((u, v, w))
-
-            steps.append({
-                "title": "Algoritma Prim",
-                "sub_title": f"Edge ({u}, {v}) ditambahkan ke MST",
-                "mst_edges": [tuple(edge) for edge in mst_edges],
-                "visited_nodes": list(mst_set),
-                "considered_edge": None,
-                "total_weight": total_weight
-            })
+            yield 'add', edge
 
             for to, weight in adj[v]:
                 if to not in mst_set:
@@ -173,30 +123,42 @@ class Graph:
         print(f"Total bobot MST: {total_weight}")
         print("=" * 25)
         
-        steps.append({
-            "title": "Hasil MST dengan Algoritma Prim",
-            "sub_title": f"Total Bobot MST: {total_weight}",
-            "mst_edges": [tuple(edge) for edge in mst_edges],
-            "visited_nodes": list(mst_set),
-            "considered_edge": None,
-            "total_weight": total_weight
-        })
-        return steps
+        yield 'done', None
 
 class MST_Visualizer:
+    """Animasi langkah Kruskal/Prim dengan blitting.
+
+    Graf dasar (semua edge hitam, node oranye, label, bobot) digambar sekali
+    dan disimpan sebagai background. Di atasnya ada background "progress"
+    = graf dasar + sisi MST dan node yang sudah dikunjungi pada langkah yang
+    sedang tampil. Karena daftar sisi MST hanya bertambah selama satu
+    algoritma berjalan, langkah Next cukup menggambar sisi/node yang baru
+    di atas progress, sehingga biaya per langkah sebanding dengan
+    perubahannya, bukan dengan ukuran graf. Progress hanya dibangun ulang
+    saat mundur melewati penambahan sisi, saat pindah algoritma, atau saat
+    figure digambar ulang penuh (mis. di-resize).
+    """
     def __init__(self, graph_obj, initial_prim_vertex=None):
+        import networkx as nx
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
+        from matplotlib.widgets import Button
+        from layout_cache import default_cache
+
         self.graph_obj = graph_obj
         
         self.G = nx.Graph()
         for u, v, w in self.graph_obj.graph:
             self.G.add_edge(u, v, weight=w)
         
-        self.pos = nx.spring_layout(self.G, seed=41) 
+        self.pos = default_cache.spring_layout(self.G, seed=41)
 
         # Pengaturan gambar
         plt.ion() 
         self.fig, self.ax = plt.subplots(figsize=(10, 6))
         plt.subplots_adjust(bottom=0.2)
+        for spine in self.ax.spines.values():
+            spine.set_visible(False)
 
         # Menentukan sumbu tombol
         self.prev_ax = plt.axes([0.6, 0.05, 0.1, 0.075])
@@ -213,17 +175,43 @@ class MST_Visualizer:
         self.next_button.on_clicked(self.next_step)
         self.method_button.on_clicked(self.switch_algoritma)
 
+        # Graf dasar: digambar sekali, tidak pernah dihapus
+        nx.draw_networkx_nodes(self.G, self.pos, node_color='orange', node_size=800, ax=self.ax)
+        self.node_labels = nx.draw_networkx_labels(self.G, self.pos, ax=self.ax)
+        nx.draw_networkx_edges(self.G, self.pos, edge_color='black', width=1, ax=self.ax)
+        edge_labels = nx.get_edge_attributes(self.G, 'weight')
+        self.edge_labels = nx.draw_networkx_edge_labels(self.G, self.pos, edge_labels=edge_labels, ax=self.ax)
+
+        # Artist yang berubah per langkah (animated: tidak ikut digambar pada draw penuh)
+        self.use_blit = self.fig.canvas.supports_blit
+        self.mst_lines = LineCollection([], colors='red', linewidths=3, zorder=1.5, animated=self.use_blit)
+        self.considered_line = LineCollection([], colors='yellow', linewidths=3, zorder=1.6, animated=self.use_blit)
+        self.ax.add_collection(self.mst_lines, autolim=False)
+        self.ax.add_collection(self.considered_line, autolim=False)
+        self.node_overlay = self.ax.scatter([], [], s=800, zorder=2.5, animated=self.use_blit)
+        self.ax.title.set_animated(self.use_blit)
+        self.step_text = self.ax.text(0.95, 0.05, "", transform=self.ax.transAxes, ha='right', va='bottom',
+                                      fontsize=9, color='gray', animated=self.use_blit)
+
+        self.base = None  # Background graf dasar
+        self.progress = None  # Background graf dasar + sisi MST/node yang tampil
+        self.shown_edges = []  # Sisi MST yang ada di progress
+        self.visited = set()  # Node Prim yang sudah dikunjungi di progress
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
         # Inisialisasi status algoritma
         self.current_algoritma = "Kruskal"
         self.steps_kruskal = self.graph_obj.kruskal_mst()
 
-        self.steps_prim = []
+        # Langkah Prim baru dihitung saat pengguna pindah ke Prim
+        self.steps_prim = None
+        self.prim_vertex = None
         if initial_prim_vertex and initial_prim_vertex in self.graph_obj.vertices_set: #
-            self.steps_prim = self.graph_obj.prim_mst(initial_prim_vertex) #
+            self.prim_vertex = initial_prim_vertex
         elif self.graph_obj.vertices_set: #
             fallback_vertex = next(iter(self.graph_obj.vertices_set)) #
             print(f"Warning: Verteks awal Prim tidak valid atau tidak diberikan. Menggunakan '{fallback_vertex}' sebagai gantinya.")
-            self.steps_prim = self.graph_obj.prim_mst(fallback_vertex) #
+            self.prim_vertex = fallback_vertex
         else: 
             print("Tidak ada verteks dalam graf. Prim's MST tidak dapat dihitung.")
 
@@ -231,78 +219,163 @@ class MST_Visualizer:
         self.update_figure()
 
     def prev_step(self, event):
-        steps = self.steps_kruskal if self.current_algoritma == "Kruskal" else self.steps_prim
+        steps = self._steps()
         if steps and self.current_step > 0:
             self.current_step -= 1
             self.update_figure()
 
     def next_step(self, event):
-        steps = self.steps_kruskal if self.current_algoritma == "Kruskal" else self.steps_prim
-        if steps and self.current_step < len(steps) - 1:
+        steps = self._steps()
+        if steps and steps.has(self.current_step + 1):
             self.current_step += 1
             self.update_figure()
 
+    def _steps(self):
+        return self.steps_kruskal if self.current_algoritma == "Kruskal" else self.steps_prim
+
     def switch_algoritma(self, event):
         if self.current_algoritma == "Kruskal":
+            if self.steps_prim is None and self.prim_vertex is not None:
+                self.steps_prim = self.graph_obj.prim_mst(self.prim_vertex)
             if self.steps_prim: 
                 self.current_algoritma = "Prim"
                 self.current_step = 0
-                self.update_figure()
+                self.update_figure(redraw=True)
             else:
                 print("Vertex awal untuk Prim belum diatur. Silakan atur vertex awal untuk Prim.")
         else:
             self.current_algoritma = "Kruskal"
             self.current_step = 0
-            self.update_figure()
-
-    def update_figure(self):
-        self.ax.clear() 
-        for spine in self.ax.spines.values():
-            spine.set_visible(False)
-
-        steps = self.steps_kruskal if self.current_algoritma == "Kruskal" else self.steps_prim
-
-        if not steps or self.current_step < 0 or self.current_step >= len(steps):
-            self.ax.set_title("Tidak ada langkah tersedia atau graf kosong.")
-            self.fig.canvas.draw_idle()
+            self.update_figure(redraw=True)
+
+    def _current(self):
+        steps = self._steps()
+        if not steps or self.current_step < 0 or not steps.has(self.current_step):
+            return None
+        return steps[self.current_step]
+
+    def _segments(self, edges):
+        return [(self.pos[u], self.pos[v]) for u, v, *_ in edges]
+
+    def _edge_label(self, u, v):
+        return self.edge_labels.get((u, v)) or self.edge_labels.get((v, u))
+
+    def _draw_edges(self, collection, edges):
+        """Sisi di atas background, lalu label bobotnya"""
+        collection.set_segments(self._segments(edges))
+        self.ax.draw_artist(collection)
+        for u, v, *_ in edges:
+            label = self._edge_label(u, v)
+            if label is not None:
+                self.ax.draw_artist(label)
+
+    def _draw_nodes(self, nodes):
+        """Node (oranye, atau biru jika sudah dikunjungi Prim) beserta labelnya, di atas sisi"""
+        nodes = [node for node in dict.fromkeys(nodes) if node in self.pos]
+        if not nodes:
             return
-
-        step = steps[self.current_step]
-
-        nx.draw_networkx_nodes(self.G, self.pos, node_color='orange', node_size=800, ax=self.ax)
-        nx.draw_networkx_labels(self.G, self.pos, ax=self.ax)
-
-        all_edges = [(u, v) for u, v, _ in self.graph_obj.graph]
-        nx.draw_networkx_edges(self.G, self.pos, edgelist=all_edges, edge_color='black', width=1, ax=self.ax)
-
-        edge_labels = nx.get_edge_attributes(self.G, 'weight')
-        nx.draw_networkx_edge_labels(self.G, self.pos, edge_labels=edge_labels, ax=self.ax)
-
-        # Highlight sisi MST dengan warna merah
-        if step["mst_edges"]:
-            mst_edges_tuple_list = [(u, v) for u, v, w in step["mst_edges"]]
-            nx.draw_networkx_edges(self.G, self.pos, edgelist=mst_edges_tuple_list, width=3, edge_color='red', ax=self.ax)
-
-        # Highlight pertimbangan sisi dengan warna yellow
+        self.node_overlay.set_offsets([self.pos[node] for node in nodes])
+        self.node_overlay.set_facecolor(['blue' if node in self.visited else 'orange' for node in nodes])
+        self.ax.draw_artist(self.node_overlay)
+        for node in nodes:
+            self.ax.draw_artist(self.node_labels[node])
+
+    def _rebuild(self, step):
+        """Progress dari graf dasar: semua sisi MST dan node yang dikunjungi pada step"""
+        canvas = self.fig.canvas
+        canvas.restore_region(self.base)
+        self.shown_edges = list(step["mst_edges"])
+        self.visited = set(step.get("visited_nodes", ())) if self.current_algoritma == "Prim" else set()
+        self._draw_edges(self.mst_lines, self.shown_edges)
+        self._draw_nodes([x for u, v, *_ in self.shown_edges for x in (u, v)] + list(self.visited))
+        self.progress = canvas.copy_from_bbox(self.region)
+
+    def _advance(self, step):
+        """Progress ke step; hanya sisi/node baru yang digambar bila daftar sisi MST bertambah"""
+        edges = step["mst_edges"]
+        if len(edges) < len(self.shown_edges):
+            self._rebuild(step)  # Mundur melewati penambahan sisi
+            return
+        added = edges[len(self.shown_edges):]
+        if not added:
+            return
+        self.fig.canvas.restore_region(self.progress)
+        if self.current_algoritma == "Prim":
+            self.visited.update(x for u, v, *_ in added for x in (u, v))
+        self._draw_edges(self.mst_lines, added)
+        self._draw_nodes([x for u, v, *_ in added for x in (u, v)])
+        self.shown_edges.extend(added)
+        self.progress = self.fig.canvas.copy_from_bbox(self.region)
+
+    def _finish(self, step):
+        """Progress + sisi yang sedang dipertimbangkan + judul, lalu blit"""
+        canvas = self.fig.canvas
+        canvas.restore_region(self.progress)
         if step["considered_edge"]:
-            u, v, w = step["considered_edge"]
-            nx.draw_networkx_edges(self.G, self.pos, edgelist=[(u, v)], width=3, edge_color='yellow', ax=self.ax)
-
-        # Highlight node yang sudah dikunjungi untuk algoritma prim
-        if self.current_algoritma == "Prim" and "visited_nodes" in step:
-            valid_visited = [node for node in step["visited_nodes"] if node in self.pos]
-            if valid_visited:
-                nx.draw_networkx_nodes(self.G, self.pos, nodelist=valid_visited,
-                                      node_color='blue', node_size=800, ax=self.ax)
-
+            considered = [step["considered_edge"]]
+            self._draw_edges(self.considered_line, considered)
+            self._draw_nodes(considered[0][:2])
+        self.ax.draw_artist(self.ax.title)
+        self.ax.draw_artist(self.step_text)
+        canvas.blit(self.region)
+
+    def _on_draw(self, event):
+        # Draw penuh (awal, resize, pindah algoritma): background diambil ulang
+        from matplotlib.transforms import Bbox
+
+        if not self.use_blit:
+            return
+        # Area graf dan judul saja, tanpa tombol (efek hover tombol di-blit sendiri oleh widget)
+        fig_box = self.fig.bbox
+        self.region = Bbox.from_extents(fig_box.x0, self.method_ax.bbox.y1, fig_box.x1, fig_box.y1)
+        self.base = self.fig.canvas.copy_from_bbox(self.region)
+        step = self._current()
+        if step is not None:
+            self._rebuild(step)
+            self._finish(step)
+
+    def _set_text(self, step, steps):
         # Set title, sub title dan langkahnya
         self.ax.set_title(f"{step['title']}\n{step.get('sub_title', '')}", pad=15)
-        self.ax.text(0.95, 0.05, f"Step {self.current_step + 1}/{len(steps)}",
-                     transform=self.ax.transAxes, ha='right', va='bottom', fontsize=9, color='gray')
+        # Total langkah baru diketahui setelah stream selesai (len() akan menghitung semuanya);
+        # melihat satu langkah ke depan cukup untuk mengetahui langkah terakhir
+        steps.has(self.current_step + 1)
+        total = f"/{steps.known}" if steps.complete else ""
+        self.step_text.set_text(f"Step {self.current_step + 1}{total}")
+
+    def update_figure(self, redraw=False):
+        steps = self._steps()
+        step = self._current()
 
         # Update button text
         self.method_button.label.set_text("Switch Prim" if self.current_algoritma == "Kruskal" else "Switch Kruskal")
-        self.fig.canvas.draw_idle() 
+
+        if step is None:
+            self.ax.set_title("Tidak ada langkah tersedia atau graf kosong.")
+            self.step_text.set_text("")
+            self.ax.title.set_animated(False)
+            self.fig.canvas.draw_idle()
+            return
+        self._set_text(step, steps)
+
+        if not self.use_blit:
+            # Backend tanpa blitting: artist langkah diperbarui lalu figure digambar ulang
+            visited = step.get("visited_nodes", ()) if self.current_algoritma == "Prim" else ()
+            self.mst_lines.set_segments(self._segments(step["mst_edges"]))
+            self.considered_line.set_segments(self._segments([step["considered_edge"]] if step["considered_edge"] else []))
+            offsets = [self.pos[node] for node in visited if node in self.pos]
+            if offsets:
+                self.node_overlay.set_offsets(offsets)
+                self.node_overlay.set_facecolor('blue')
+            self.node_overlay.set_visible(bool(offsets))
+            self.fig.canvas.draw_idle()
+            return
+
+        if redraw or self.base is None:
+            self.fig.canvas.draw_idle()  # _on_draw membangun ulang background dan progress
+            return
+        self._advance(step)
+        self._finish(step)
 
 def create_graph_from_input():
     g = Graph()
@@ -334,26 +407,32 @@ def create_graph_from_input():
     print(f"\nTotal {edge_count} edges berhasil ditambahkan")
     return g
 
+def create_default_graph():
+    """Graf default dari soal"""
+    g = Graph()
+    g.add_edge('A', 'V1', 4)
+    g.add_edge('A', 'V3', 14)
+    g.add_edge('V1', 'V2', 4)
+    g.add_edge('V1', 'V4', 20)
+    g.add_edge('V2', 'V3', 7)
+    g.add_edge('V2', 'V5', 9)
+    g.add_edge('V3', 'V6', 12)
+    g.add_edge('V4', 'V5', 11)
+    g.add_edge('V4', 'V7', 15)
+    g.add_edge('V4', 'V8', 7)
+    g.add_edge('V5', 'V6', 8)
+    g.add_edge('V6', 'V7', 11)
+    g.add_edge('V7', 'V8', 7)
+    g.add_edge('V7', 'V9', 4)
+    g.add_edge('V8', 'V9', 5)
+    g.add_edge('V8', 'B', 7)
+    g.add_edge('V9', 'B', 3)
+    return g
+
 def main():    
-    # Default graph dari soal
-    g_default = Graph() 
-    g_default.add_edge('A', 'V1', 4)
-    g_default.add_edge('A', 'V3', 14)
-    g_default.add_edge('V1', 'V2', 4)
-    g_default.add_edge('V1', 'V4', 20)
-    g_default.add_edge('V2', 'V3', 7)
-    g_default.add_edge('V2', 'V5', 9)
-    g_default.add_edge('V3', 'V6', 12)
-    g_default.add_edge('V4', 'V5', 11)
-    g_default.add_edge('V4', 'V7', 15)
-    g_default.add_edge('V4', 'V8', 7)
-    g_default.add_edge('V5', 'V6', 8)
-    g_default.add_edge('V6', 'V7', 11)
-    g_default.add_edge('V7', 'V8', 7)
-    g_default.add_edge('V7', 'V9', 4)
-    g_default.add_edge('V8', 'V9', 5)
-    g_default.add_edge('V8', 'B', 7)
-    g_default.add_edge('V9', 'B', 3)
+    import matplotlib.pyplot as plt
+
+    g_default = create_default_graph()
 
     while True:
         print("------------------------------------")
@@ -362,7 +441,8 @@ def main():
         print("Menu:")
         print("1. Gunakan graf default dari soal")
         print("2. Masukkan graf baru")
-        print("3. Keluar")
+        print("3. Muat graf dari file edge list")
+        print("4. Keluar")
         print("------------------------------------")
         choice = input("Pilihan: ")
         
@@ -375,6 +455,9 @@ def main():
             g = create_graph_from_input()
             print(f"\nGraf berhasil dibuat dengan {len(g.vertices_set)} vertices dan {len(g.graph)} edges")
         elif choice == '3':
+            g = create_graph_from_file(Graph)
+            print(f"\nGraf memiliki {len(g.vertices_set)} vertices dan {len(g.graph)} edges")
+        elif choice == '4':
             break
         else:
             print("Pilihan tidak valid!")
@@ -1,52 +1,41 @@
-import heapq
+import os
+import sys
+
+from kruskal_engine import InternedEdges, filter_kruskal_indices
+from prim_engine import prim_mst_edges
+
+# edge_loader berada di folder nomor_1
+_NOMOR_1 = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'nomor_1'))
+if _NOMOR_1 not in sys.path:
+    sys.path.append(_NOMOR_1)
+
+from edge_loader import create_graph_from_file
 
 class Graph:
     def __init__(self, vertices):
         self.V = vertices
         self.graph = []
+        self.interned = InternedEdges()  # ID integer edge untuk kruskal_engine
 
     def add_edge(self, u, v, w):
         self.graph.append([u, v, w])
     
-    def find(self, parent, i): 
-        if parent[i] != i: 
-            parent[i] = self.find(parent, parent[i]) 
-        return parent[i]
-    
-    def union(self, parent, rank, x, y):        
-        if rank[x] < rank[y]:
-            parent[x] = y
-        elif rank[x] > rank[y]:
-            parent[y] = x
-        else:
-            parent[y] = x
-            rank[x] += 1
-    
     # Algoritma Kruskal
-    def kruskal_mst(self):
-        result = []
-        i, e = 0, 0
-        self.graph = sorted(self.graph, key=lambda item: item[2])
-        parent = {}
-        rank = {}
-        for u, v, w in self.graph:
-            parent[u] = u
-            parent[v] = v
-            rank[u] = 0
-            rank[v] = 0
-        
-        while e < self.V - 1:
-            if i >= len(self.graph):
-                break
-            u, v, w = self.graph[i]
-            i += 1
-            x = self.find(parent, u)
-            y = self.find(parent, v)
-            
-            if x != y:
-                e += 1
-                result.append([u, v, w])
-                self.union(parent, rank, x, y)
+    def kruskal_edges(self, stats=None):
+        """Edge MST [u, v, w] sesuai urutan ditambahkan.
+
+        stats: RunStats (nomor_1/instrumentation.py) untuk counter finds, unions,
+        edges_scanned, edges_filtered dan edges_sorted.
+        """
+        # Vertex di-intern sekali (lihat InternedEdges); Filter-Kruskal hanya
+        # mengurutkan edge yang masih mungkin masuk MST (lihat kruskal_engine.py)
+        labels, src, dst, weights = self.interned.arrays(self.graph)
+        mst = filter_kruskal_indices(len(labels), src, dst, weights, stats)
+        return [self.graph[i] for i in mst.tolist()]
+
+    def kruskal_mst(self, stats=None):
+        """stats: lihat kruskal_edges"""
+        result = self.kruskal_edges(stats)
         
         print("\nKruskal's MST:")
         total_weight = 0
@@ -56,32 +45,16 @@ class Graph:
         print(f"Total weight: {total_weight}\n")
     
     #Algoritma Prim
-    def prim_mst(self, start_vertex):
-        mst_set = set()
-        min_heap = []
-        total_weight = 0
-        mst_edges = []
-
-        adj = {}
-        for u, v, w in self.graph:
-            adj.setdefault(u, []).append((v, w))
-            adj.setdefault(v, []).append((u, w))
-
-        mst_set.add(start_vertex)
-        for v, w in adj[start_vertex]:
-            heapq.heappush(min_heap, (w, start_vertex, v))
+    def prim_mst(self, start_vertex, stats=None):
+        """stats: RunStats untuk counter heap_push, heap_pop, decrease_key, expanded dan edges_scanned"""
+        # Heap berindeks dengan decrease-key, atau O(V^2) NumPy untuk graf padat (lihat prim_engine.py)
+        mst_edges = prim_mst_edges(self.graph, start_vertex, stats=stats)
+        if mst_edges is None:
+            print(f"Error: Start vertex '{start_vertex}' tidak ditemukan pada graph.")
+            return
+        total_weight = sum(w for _, _, w in mst_edges)
 
         print(f"Prim's MST (starting from vertex '{start_vertex}'):")
-        while min_heap and len(mst_set) < self.V:
-            w, u, v = heapq.heappop(min_heap)
-            if v not in mst_set:
-                mst_set.add(v)
-                total_weight += w
-                mst_edges.append((u, v, w))
-                for to, weight in adj[v]:
-                    if to not in mst_set:
-                        heapq.heappush(min_heap, (weight, v, to))
-
         for u, v, w in mst_edges:
             print(f"{u} -- {v} == {w}")
         print(f"Total weight: {total_weight}\n")
@@ -136,7 +109,8 @@ def main():
         print("Menu:")
         print("1. Gunakan graf default dari soal")
         print("2. Masukkan graf baru")
-        print("3. Keluar")
+        print("3. Muat graf dari file edge list")
+        print("4. Keluar")
         print("------------------------------------")
         choice = input("Pilihan: ")
         
@@ -145,6 +119,11 @@ def main():
         elif choice == '2':
             g = create_graph_from_input()
         elif choice == '3':
+            g = create_graph_from_file(Graph)
+            if not g.graph:
+                print("Graf kosong! Kembali ke menu utama.")
+                continue
+        elif choice == '4':
             break
         else:
             print("Pilihan tidak valid!")
@@ -0,0 +1,148 @@
+"""Rekaman langkah Kruskal/Prim yang lazy dan disimpan sebagai delta.
+
+Algoritma MST ditulis sebagai generator delta: setiap langkah hanya
+mencatat jenisnya dan satu edge ('consider', 'add', 'reject'), bukan
+salinan seluruh sisi MST. StepStream menjalankan generator itu sesuai
+kebutuhan (hanya sampai indeks yang diminta) dan menyimpan checkpoint
+(jumlah sisi MST, total bobot) setiap CHECKPOINT_EVERY langkah, sehingga
+langkah ke-i direkonstruksi dengan memutar ulang paling banyak
+CHECKPOINT_EVERY delta. Memori O(E) menggantikan O(E * V).
+
+Langkah yang dikembalikan tetap berupa dict dengan key yang sama seperti
+sebelumnya ("title", "sub_title", "mst_edges", "considered_edge",
+"total_weight", dan "visited_nodes" untuk Prim); "mst_edges" dan
+"visited_nodes" berupa view read-only atas list yang hanya bertambah.
+"""
+from collections.abc import Sequence
+
+CHECKPOINT_EVERY = 64
+
+class Prefix(Sequence):
+    """View read-only n elemen pertama dari list yang hanya bertambah"""
+    __slots__ = ('items', 'n')
+
+    def __init__(self, items, n):
+        self.items = items
+        self.n = n
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.items[i] for i in range(*index.indices(self.n))]
+        if index < 0:
+            index += self.n
+        if not 0 <= index < self.n:
+            raise IndexError("index langkah di luar jangkauan")
+        return self.items[index]
+
+    def __iter__(self):
+        items = self.items
+        for i in range(self.n):
+            yield items[i]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+class StepStream(Sequence):
+    """Langkah animasi MST dari generator delta (kind, edge), dihitung saat diakses.
+
+    kind: 'start', 'consider', 'add', 'reject' atau 'done'. Untuk Prim
+    (start_vertex diberikan), node baru dari edge 'add' adalah edge[1].
+    """
+    def __init__(self, deltas, algorithm, start_vertex=None, checkpoint_every=CHECKPOINT_EVERY):
+        self._deltas = iter(deltas)
+        self.algorithm = algorithm
+        self.start_vertex = start_vertex
+        self.checkpoint_every = checkpoint_every
+        self.kinds = []  # Delta per langkah
+        self.edges = []
+        self.mst_edges = []  # Sisi MST sesuai urutan ditambahkan
+        self.visited = [start_vertex] if start_vertex is not None else []
+        self.checkpoints = []  # (jumlah sisi MST, total bobot) pada langkah k * checkpoint_every
+        self.total_weight = 0
+        self.complete = False
+
+    def _fill(self, index):
+        """Menjalankan generator sampai langkah index tersedia (index None: sampai habis)"""
+        while not self.complete and (index is None or len(self.kinds) <= index):
+            try:
+                kind, edge = next(self._deltas)
+            except StopIteration:
+                self.complete = True
+                break
+            if kind == 'add':
+                self.mst_edges.append(edge)
+                self.total_weight += edge[2]
+                if self.start_vertex is not None:
+                    self.visited.append(edge[1])
+            if len(self.kinds) % self.checkpoint_every == 0:
+                self.checkpoints.append((len(self.mst_edges), self.total_weight))
+            self.kinds.append(kind)
+            self.edges.append(edge)
+
+    def __len__(self):
+        """Jumlah total langkah; menjalankan generator sampai habis"""
+        self._fill(None)
+        return len(self.kinds)
+
+    def has(self, index):
+        """True jika langkah index (>= 0) ada; hanya menghitung sampai langkah itu"""
+        self._fill(index)
+        return 0 <= index < len(self.kinds)
+
+    @property
+    def known(self):
+        """Jumlah langkah yang sudah dihitung (belum tentu total)"""
+        return len(self.kinds)
+
+    def __bool__(self):
+        self._fill(0)
+        return bool(self.kinds)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        self._fill(index)
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("index langkah di luar jangkauan")
+
+        # Putar ulang delta dari checkpoint terdekat
+        base = index - index % self.checkpoint_every
+        count, total = self.checkpoints[base // self.checkpoint_every]
+        for i in range(base + 1, index + 1):
+            if self.kinds[i] == 'add':
+                count += 1
+                total += self.edges[i][2]
+        return self._step(self.kinds[index], self.edges[index], count, total)
+
+    def _step(self, kind, edge, count, total):
+        """Dict langkah dengan format yang sama seperti rekaman lama"""
+        name = self.algorithm
+        if kind == 'start':
+            title = f"Algoritma {name}" if self.start_vertex is None else \
+                f"Algoritma {name} - Mulai dari verteks {self.start_vertex}"
+            step = {"title": title}
+        elif kind == 'done':
+            step = {"title": f"Hasil MST dengan Algoritma {name}", "sub_title": f"Total Bobot MST: {total}"}
+        else:
+            u, v, w = edge
+            sub_title = {
+                'consider': f"Mempertimbangkan edge ({u}, {v}) dengan bobot {w}",
+                'add': f"Edge ({u}, {v}) ditambahkan ke MST",
+                'reject': f"Edge ({u}, {v}) ditolak karena membentuk siklus",
+            }[kind]
+            step = {"title": f"Algoritma {name}", "sub_title": sub_title}
+
+        step["mst_edges"] = Prefix(self.mst_edges, count)
+        if self.start_vertex is not None:
+            step["visited_nodes"] = Prefix(self.visited, count + 1)
+        step["considered_edge"] = edge if kind == 'consider' else None
+        step["total_weight"] = total
+        return step
@@ -0,0 +1,234 @@
+"""Prim berbasis array dengan dua mode yang dipilih dari kepadatan graf.
+
+Graph.prim_mst lama memasukkan setiap edge kandidat ke heapq (lazy), sehingga
+heap tumbuh sampai O(E) dan sebagian besar pop sudah basi. Engine ini:
+  - mode 'heap': IndexedMinHeap dengan satu entri per vertex dan
+    decrease-key, sehingga heap paling besar O(V) dan tidak ada pop basi;
+  - mode 'dense': matriks bobot V x V, array min_edge dan np.argmin untuk
+    memilih vertex berikutnya (O(V^2), tanpa heap). Lebih cepat untuk graf
+    yang hampir lengkap (mis. graf jarak untuk clustering).
+Mode dipilih otomatis dari kepadatan edge E / (V(V-1)/2) dengan ambang
+DENSE_DENSITY yang diukur dengan `python benchmark.py prim`.
+
+Kedua mode memilih edge dengan urutan (bobot, vertex asal, vertex tujuan)
+seperti tuple (w, u, v) pada heapq lama; dengan label yang di-intern
+terurut (intern_edges(..., sort_labels=True)) hasilnya sama persis.
+"""
+import numpy as np
+
+from kruskal_engine import intern_edges
+
+DENSE_DENSITY = 0.05  # Mode dense jika kepadatan edge >= nilai ini; titik impas terukur ~0.03-0.1 (benchmark.py prim)
+DENSE_MAX_VERTICES = 4096  # Matriks dense memakai 16 * V^2 byte
+
+class IndexedMinHeap:
+    """Min-heap item 0..n-1 dengan paling banyak satu entri per item dan decrease-key"""
+
+    def __init__(self, n):
+        self.heap = []  # Item, tersusun sebagai binary heap menurut keys
+        self.keys = [None] * n
+        self.pos = [-1] * n  # Posisi item di heap, -1 jika tidak ada
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return self.pos[item] >= 0
+
+    def push(self, item, key):
+        """Menambahkan item baru"""
+        self.keys[item] = key
+        self.pos[item] = len(self.heap)
+        self.heap.append(item)
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, item, key):
+        """Mengecilkan key item yang sudah ada di heap"""
+        self.keys[item] = key
+        self._sift_up(self.pos[item])
+
+    def pop(self):
+        """Mengambil (item, key) dengan key terkecil"""
+        heap, pos = self.heap, self.pos
+        top = heap[0]
+        last = heap.pop()
+        pos[top] = -1
+        if heap:
+            heap[0] = last
+            pos[last] = 0
+            self._sift_down(0)
+        return top, self.keys[top]
+
+    def _sift_up(self, i):
+        heap, keys, pos = self.heap, self.keys, self.pos
+        item = heap[i]
+        key = keys[item]
+        while i:
+            parent = (i - 1) >> 1
+            above = heap[parent]
+            if not key < keys[above]:
+                break
+            heap[i] = above
+            pos[above] = i
+            i = parent
+        heap[i] = item
+        pos[item] = i
+
+    def _sift_down(self, i):
+        heap, keys, pos = self.heap, self.keys, self.pos
+        size = len(heap)
+        item = heap[i]
+        key = keys[item]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            below = heap[child]
+            if not keys[below] < key:
+                break
+            heap[i] = below
+            pos[below] = i
+            i = child
+        heap[i] = item
+        pos[item] = i
+
+def edge_density(num_vertices, num_edges):
+    """E / (V(V-1)/2): 1.0 untuk graf lengkap tanpa edge ganda"""
+    pairs = num_vertices * (num_vertices - 1) / 2
+    return num_edges / pairs if pairs else 0.0
+
+def choose_method(num_vertices, num_edges):
+    """'dense' untuk graf padat yang matriksnya muat di memori, selain itu 'heap'"""
+    if num_vertices <= DENSE_MAX_VERTICES and edge_density(num_vertices, num_edges) >= DENSE_DENSITY:
+        return 'dense'
+    return 'heap'
+
+def _prim_heap(n, src, dst, weights, start, stats):
+    # Adjacency CSR dua arah; tetangga setiap vertex sesuai urutan edge input
+    ids = np.arange(len(src), dtype=np.int64)
+    tails, heads, edge_ids = np.concatenate((src, dst)), np.concatenate((dst, src)), np.concatenate((ids, ids))
+    order = np.lexsort((edge_ids, tails))
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(tails, minlength=n), out=offsets[1:])
+    offsets = offsets.tolist()
+    neighbors = heads[order].tolist()
+    edge_ids = edge_ids[order]
+    edge_weights = weights[edge_ids].tolist()
+    edge_ids = edge_ids.tolist()
+
+    visited = bytearray(n)
+    best_edge = [-1] * n
+    heap = IndexedMinHeap(n)
+    keys, pos = heap.keys, heap.pos
+    result_ids, result_tails, result_heads = [], [], []
+    pushes = decreases = scanned = 0
+
+    u = start
+    visited[u] = 1
+    while True:
+        # Relaksasi edge keluar dari u: key[v] = (w, u, v) terkecil
+        for k in range(offsets[u], offsets[u + 1]):
+            v = neighbors[k]
+            if visited[v]:
+                continue
+            key = (edge_weights[k], u, v)
+            if pos[v] < 0:
+                heap.push(v, key)
+                best_edge[v] = edge_ids[k]
+                pushes += 1
+            elif key < keys[v]:
+                heap.decrease_key(v, key)
+                best_edge[v] = edge_ids[k]
+                decreases += 1
+        scanned += offsets[u + 1] - offsets[u]
+        if not heap:
+            break
+        v, (_, u, _) = heap.pop()
+        visited[v] = 1
+        result_ids.append(best_edge[v])
+        result_tails.append(u)
+        result_heads.append(v)
+        u = v
+
+    if stats:
+        stats.add(heap_push=pushes, heap_pop=len(result_ids), decrease_key=decreases,
+                  expanded=len(result_ids) + 1, edges_scanned=scanned)
+    return result_ids, result_tails, result_heads
+
+def _prim_dense(n, src, dst, weights, start, stats):
+    # Matriks bobot terkecil per pasangan vertex dan ID edge-nya (ID terkecil jika sama)
+    ids = np.arange(len(src), dtype=np.int64)
+    keep = src != dst
+    tails, heads = np.concatenate((src[keep], dst[keep])), np.concatenate((dst[keep], src[keep]))
+    edge_ids = np.concatenate((ids[keep], ids[keep]))
+    flat = tails * n + heads
+    values = weights[edge_ids].astype(np.float64)
+    matrix = np.full(n * n, np.inf)
+    np.minimum.at(matrix, flat, values)
+    matrix_ids = np.full(n * n, np.iinfo(np.int64).max, dtype=np.int64)
+    hit = values == matrix[flat]
+    np.minimum.at(matrix_ids, flat[hit], edge_ids[hit])
+    matrix = matrix.reshape(n, n)
+
+    in_tree = np.zeros(n, dtype=bool)
+    in_tree[start] = True
+    min_edge = matrix[start].copy()
+    min_edge[start] = np.inf
+    parent = np.full(n, start, dtype=np.int64)
+    result_ids, result_tails, result_heads = [], [], []
+
+    for _ in range(n - 1):
+        v = int(np.argmin(min_edge))
+        lowest = min_edge[v]
+        if lowest == np.inf:
+            break
+        tied = np.flatnonzero(min_edge == lowest)
+        if len(tied) > 1:
+            # Urutan (w, u, v) seperti mode heap: vertex asal lalu vertex tujuan terkecil
+            v = int(tied[np.lexsort((tied, parent[tied]))[0]])
+        u = int(parent[v])
+        result_ids.append(int(matrix_ids[u * n + v]))
+        result_tails.append(u)
+        result_heads.append(v)
+
+        in_tree[v] = True
+        min_edge[v] = np.inf
+        row = matrix[v]
+        better = ((row < min_edge) | ((row == min_edge) & (v < parent))) & ~in_tree
+        min_edge[better] = row[better]
+        parent[better] = v
+
+    if stats:
+        stats.add(expanded=len(result_ids) + 1, edges_scanned=n * (len(result_ids) + 1))
+    return result_ids, result_tails, result_heads
+
+def prim_edges(num_vertices, src, dst, weights, start, method=None, stats=None):
+    """MST komponen start: (ID edge, vertex asal, vertex tujuan) per vertex baru, sesuai urutan.
+
+    method: 'heap', 'dense', atau None untuk memilih dari kepadatan graf.
+    stats: RunStats (nomor_1/instrumentation.py) untuk counter heap_push,
+    heap_pop, decrease_key, expanded dan edges_scanned.
+    """
+    src, dst, weights = np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64), np.asarray(weights)
+    if method is None:
+        method = choose_method(num_vertices, len(src))
+    run = _prim_dense if method == 'dense' else _prim_heap
+    edge_ids, tails, heads = run(num_vertices, src, dst, weights, start, stats)
+    return (np.array(edge_ids, dtype=np.int64), np.array(tails, dtype=np.int64),
+            np.array(heads, dtype=np.int64))
+
+def prim_mst_edges(edges, start_vertex, method=None, stats=None):
+    """MST dari list [u, v, w] mulai dari start_vertex.
+
+    Mengembalikan list (u, v, w) sesuai urutan ditambahkan (u sudah di
+    pohon, v vertex baru), atau None jika start_vertex tidak ada di graf.
+    """
+    labels, src, dst, weights = intern_edges(edges, sort_labels=True)
+    index = {label: i for i, label in enumerate(labels)}
+    if start_vertex not in index:
+        return None
+    edge_ids, tails, heads = prim_edges(len(labels), src, dst, weights, index[start_vertex], method, stats)
+    return [(labels[u], labels[v], edges[e][2])
+            for e, u, v in zip(edge_ids.tolist(), tails.tolist(), heads.tolist())]
@@ -1,17 +1,9 @@
 import heapq
 import sys
-import networkx as nx
-import matplotlib.pyplot as plt
 
-node_map = {'s': 0, 'x': 1, 'u': 2, 'v': 3, 'y': 4}
-reverse_map = {v: k for k, v in node_map.items()}
+NODE_MAP = {'s': 0, 'x': 1, 'u': 2, 'v': 3, 'y': 4}
 
-edges_huruf = [['s', 'u', 10], ['s', 'x', 5], ['u', 'x', 2], ['x', 'u', 3], ['x', 'v', 9], ['u', 'v', 1], ['x', 'y', 2], ['y', 'v', 6], ['v', 'y', 4], ['y', 's', 7]]
-
-edges = [[node_map[u], node_map[v], w] for u, v, w in edges_huruf]
-
-V = len(node_map)
-src = node_map['s']
+EDGES_HURUF = [['s', 'u', 10], ['s', 'x', 5], ['u', 'x', 2], ['x', 'u', 3], ['x', 'v', 9], ['u', 'v', 1], ['x', 'y', 2], ['y', 'v', 6], ['v', 'y', 4], ['y', 's', 7]]
 
 def constructAdj(V, edges):
     adj = [[] for _ in range(V)]
@@ -19,41 +11,71 @@ def constructAdj(V, edges):
         adj[u].append([v, wt])
     return adj
 
-adj = constructAdj(V, edges)
-dist = [sys.maxsize] * V
-dist[src] = 0
-prev = [-1] * V 
+def dijkstra(V, adj, src, stats=None):
+    """Jarak terpendek dari src; mengembalikan (dist, prev) berindeks ID simpul.
+
+    stats: RunStats (nomor_1/instrumentation.py) yang menerima counter heap_push,
+    heap_pop, relaxations dan edges_scanned.
+    """
+    dist = [sys.maxsize] * V
+    dist[src] = 0
+    prev = [-1] * V 
+
+    pq = []
+    heapq.heappush(pq, [0, src])
+    pops = relaxations = scanned = 0
+
+    while pq:
+        u = heapq.heappop(pq)[1]
+        pops += 1
+        scanned += len(adj[u])
+
+        for v, weight in adj[u]:
+            if dist[v] > dist[u] + weight:
+                dist[v] = dist[u] + weight
+                prev[v] = u 
+                heapq.heappush(pq, [dist[v], v])
+                relaxations += 1
+
+    if stats:
+        # Setiap relaksasi menambah satu entri heap, ditambah entri sumber
+        stats.add(heap_push=relaxations + 1, heap_pop=pops, relaxations=relaxations, edges_scanned=scanned)
+    return dist, prev
+
+def draw_graph(edges, prev, reverse_map):
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    G = nx.DiGraph()
+    for u, v, w in edges:
+        G.add_edge(reverse_map[u], reverse_map[v], weight=w) 
 
-pq = []
-heapq.heappush(pq, [0, src])
+    path_edges = []
+    for i in range(len(prev)):
+        if prev[i] != -1:
+            path_edges.append((reverse_map[i], reverse_map[prev[i]]))  
 
-while pq:
-    u = heapq.heappop(pq)[1]
+    pos = nx.spring_layout(G)
+    nx.draw(G, pos, with_labels=True, node_color='lightblue', node_size=500, font_weight='bold')
+    labels = nx.get_edge_attributes(G, 'weight')
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels)
+    nx.draw_networkx_edges(G, pos, edgelist=path_edges, edge_color='red', width=2)
 
-    for v, weight in adj[u]:
-        if dist[v] > dist[u] + weight:
-            dist[v] = dist[u] + weight
-            prev[v] = u 
-            heapq.heappush(pq, [dist[v], v])
+    plt.title("Graf Dijkstras")
+    plt.show()  
 
-print("Jarak dari 's':")
-for i in range(V):
-    print(f"{reverse_map[i]}: {dist[i]}")
+def main():
+    reverse_map = {v: k for k, v in NODE_MAP.items()}
+    edges = [[NODE_MAP[u], NODE_MAP[v], w] for u, v, w in EDGES_HURUF]
 
-G = nx.DiGraph()
-for u, v, w in edges:
-    G.add_edge(reverse_map[u], reverse_map[v], weight=w) 
+    V = len(NODE_MAP)
+    dist, prev = dijkstra(V, constructAdj(V, edges), NODE_MAP['s'])
 
-path_edges = []
-for i in range(V):
-    if prev[i] != -1:
-        path_edges.append((reverse_map[i], reverse_map[prev[i]]))  
+    print("Jarak dari 's':")
+    for i in range(V):
+        print(f"{reverse_map[i]}: {dist[i]}")
 
-pos = nx.spring_layout(G)
-nx.draw(G, pos, with_labels=True, node_color='lightblue', node_size=500, font_weight='bold')
-labels = nx.get_edge_attributes(G, 'weight')
-nx.draw_networkx_edge_labels(G, pos, edge_labels=labels)
-nx.draw_networkx_edges(G, pos, edgelist=path_edges, edge_color='red', width=2)
+    draw_graph(edges, prev, reverse_map)
 
-plt.title("Graf Dijkstras")
-plt.show()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,26 @@
+import contextlib
 import heapq
+import os
 import sys
-import networkx as nx
-import matplotlib.pyplot as plt
 
-def dijkstra_and_plot(node_map, edges_huruf, source_label):
+# edge_loader berada di folder nomor_1
+_NOMOR_1 = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'nomor_1'))
+if _NOMOR_1 not in sys.path:
+    sys.path.append(_NOMOR_1)
+
+DEFAULT_NODE_MAP = {'s': 0, 'x': 1, 'u': 2, 'v': 3, 'y': 4}
+DEFAULT_EDGES = [
+    ['s', 'u', 10], ['s', 'x', 5], ['u', 'x', 2], ['x', 'u', 3],
+    ['x', 'v', 9], ['u', 'v', 1], ['x', 'y', 2], ['y', 'v', 6],
+    ['v', 'y', 4], ['y', 's', 7]
+]
+
+def dijkstra(node_map, edges_huruf, source_label, stats=None):
+    """Dijkstra dari source_label; mengembalikan (dist, prev) per label (prev None untuk sumber/tak tercapai).
+
+    stats: RunStats (nomor_1/instrumentation.py); menerima counter heap_push,
+    heap_pop, relaxations dan edges_scanned serta fase 'build' dan 'search'.
+    """
     reverse_map = {v: k for k, v in node_map.items()}
     edges = [[node_map[u], node_map[v], w] for u, v, w in edges_huruf]
 
@@ -16,34 +33,44 @@ def dijkstra_and_plot(node_map, edges_huruf, source_label):
             adj[u].append([v, wt])
         return adj
 
-    adj = constructAdj(V, edges)
+    with stats.phase('build') if stats else contextlib.nullcontext():
+        adj = constructAdj(V, edges)
     dist = [sys.maxsize] * V
     dist[src] = 0
     prev = [-1] * V
 
     pq = []
     heapq.heappush(pq, [0, src])
-
-    while pq:
-        u = heapq.heappop(pq)[1]
-        for v, weight in adj[u]:
-            if dist[v] > dist[u] + weight:
-                dist[v] = dist[u] + weight
-                prev[v] = u
-                heapq.heappush(pq, [dist[v], v])
-
-    print(f"\nJarak dari simpul '{source_label}':")
-    for i in range(V):
-        print(f"{reverse_map[i]}: {dist[i]}")
+    pops = relaxations = scanned = 0
+
+    with stats.phase('search') if stats else contextlib.nullcontext():
+        while pq:
+            u = heapq.heappop(pq)[1]
+            pops += 1
+            scanned += len(adj[u])
+            for v, weight in adj[u]:
+                if dist[v] > dist[u] + weight:
+                    dist[v] = dist[u] + weight
+                    prev[v] = u
+                    heapq.heappush(pq, [dist[v], v])
+                    relaxations += 1
+
+    if stats:
+        # Setiap relaksasi menambah satu entri heap, ditambah entri sumber
+        stats.add(heap_push=relaxations + 1, heap_pop=pops, relaxations=relaxations, edges_scanned=scanned)
+
+    return ({reverse_map[i]: dist[i] for i in range(V)},
+            {reverse_map[i]: reverse_map[prev[i]] if prev[i] != -1 else None for i in range(V)})
+
+def plot_dijkstra(edges_huruf, prev):
+    import networkx as nx
+    import matplotlib.pyplot as plt
 
     G = nx.DiGraph()
-    for u, v, w in edges:
-        G.add_edge(reverse_map[u], reverse_map[v], weight=w)
+    for u, v, w in edges_huruf:
+        G.add_edge(u, v, weight=w)
 
-    path_edges = []
-    for i in range(V):
-        if prev[i] != -1:
-            path_edges.append((reverse_map[prev[i]], reverse_map[i]))
+    path_edges = [(p, v) for v, p in prev.items() if p is not None]
 
     pos = nx.spring_layout(G)
     nx.draw(G, pos, with_labels=True, node_color='lightblue', node_size=500, font_weight='bold')
@@ -54,41 +81,66 @@ def dijkstra_and_plot(node_map, edges_huruf, source_label):
     plt.title("Graf Dijkstra")
     plt.show()
 
-print("=== PROGRAM DIJKSTRA ===")
-print("1. Gunakan graf bawaan")
-print("2. Masukkan graf sendiri")
-choice = input("Pilihan (1/2): ")
-
-if choice == '1':
-    # Graf default
-    node_map = {'s': 0, 'x': 1, 'u': 2, 'v': 3, 'y': 4}
-    edges_huruf = [
-        ['s', 'u', 10], ['s', 'x', 5], ['u', 'x', 2], ['x', 'u', 3],
-        ['x', 'v', 9], ['u', 'v', 1], ['x', 'y', 2], ['y', 'v', 6],
-        ['v', 'y', 4], ['y', 's', 7]
-    ]
-    source_label = 's'
-
-elif choice == '2':
-    print("\nMasukkan daftar simpul, pisahkan dengan koma (contoh: a,b,c):")
-    nodes_input = input("Simpul: ").replace(" ", "").split(',')
-    node_map = {name: idx for idx, name in enumerate(nodes_input)}
-
-    print("\nMasukkan jumlah edge (sisi):")
-    n_edges = int(input("Jumlah edge: "))
-
-    edges_huruf = []
-    print("Masukkan masing-masing edge dalam format: asal tujuan bobot")
-    for i in range(n_edges):
-        raw = input(f"Edge {i+1}: ").split()
-        u, v, w = raw[0], raw[1], int(raw[2])
-        edges_huruf.append([u, v, w])
-
-    print("\nMasukkan simpul asal untuk algoritma Dijkstra:")
-    source_label = input("Simpul asal: ")
-
-else:
-    print("Pilihan tidak valid.")
-    sys.exit(1)
-
-dijkstra_and_plot(node_map, edges_huruf, source_label)
+def dijkstra_and_plot(node_map, edges_huruf, source_label):
+    dist, prev = dijkstra(node_map, edges_huruf, source_label)
+
+    print(f"\nJarak dari simpul '{source_label}':")
+    for label, d in dist.items():
+        print(f"{label}: {d}")
+
+    plot_dijkstra(edges_huruf, prev)
+
+def main():
+    print("=== PROGRAM DIJKSTRA ===")
+    print("1. Gunakan graf bawaan")
+    print("2. Masukkan graf sendiri")
+    print("3. Muat graf dari file edge list")
+    choice = input("Pilihan (1/2/3): ")
+
+    if choice == '1':
+        # Graf default
+        node_map = DEFAULT_NODE_MAP
+        edges_huruf = DEFAULT_EDGES
+        source_label = 's'
+
+    elif choice == '2':
+        print("\nMasukkan daftar simpul, pisahkan dengan koma (contoh: a,b,c):")
+        nodes_input = input("Simpul: ").replace(" ", "").split(',')
+        node_map = {name: idx for idx, name in enumerate(nodes_input)}
+
+        print("\nMasukkan jumlah edge (sisi):")
+        n_edges = int(input("Jumlah edge: "))
+
+        edges_huruf = []
+        print("Masukkan masing-masing edge dalam format: asal tujuan bobot")
+        for i in range(n_edges):
+            raw = input(f"Edge {i+1}: ").split()
+            u, v, w = raw[0], raw[1], int(raw[2])
+            edges_huruf.append([u, v, w])
+
+        print("\nMasukkan simpul asal untuk algoritma Dijkstra:")
+        source_label = input("Simpul asal: ")
+
+    elif choice == '3':
+        from edge_loader import load_edge_list, to_dijkstra_input
+
+        path = input("\nPath file edge list (format per baris: asal tujuan bobot): ").strip()
+        try:
+            edges = load_edge_list(path, weighted=True)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        node_map, edges_huruf = to_dijkstra_input(edges)
+        print(f"{len(edges_huruf)} edge dan {len(node_map)} simpul dimuat")
+
+        print("\nMasukkan simpul asal untuk algoritma Dijkstra:")
+        source_label = input("Simpul asal: ")
+
+    else:
+        print("Pilihan tidak valid.")
+        sys.exit(1)
+
+    dijkstra_and_plot(node_map, edges_huruf, source_label)
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,7 @@ def isMoveValid(board, row, col):
         return False
 
 
-def knightTour(n, posisiX, posisiY, tree_size, max_solution):
+def knightTour(n, posisiX, posisiY, tree_size, max_solution, tracer=None):
     
     board = []
     for x in range(0, n):
@@ -23,12 +23,13 @@ def knightTour(n, posisiX, posisiY, tree_size, max_solution):
 
     board[posisiX][posisiY] = step[0]
 
-    knightTourAlg(board, posisiX, posisiY, step, [], count, solutions, max_solution, m_sol)
+    knightTourAlg(board, posisiX, posisiY, step, [], count, solutions, max_solution, m_sol, tracer)
 
     for i in range(0, len(solutions)):
         show_result(solutions[i], m_sol[i], tree_size)
 
-def knightTourAlg(board, row, col, step, m, count, solutions, max_solution, m_sol):
+def knightTourAlg(board, row, col, step, m, count, solutions, max_solution, m_sol, tracer=None):
+    # tracer: sink dari nomor_1/tracing.py (event expand/backtrack), None = tanpa jejak
 
     xWalk = [2, 1, -1, -2, -2, -1, 1, 2]
     yWalk = [1, 2, 2, 1, -1, -2, -2, -1]
@@ -53,7 +54,8 @@ def knightTourAlg(board, row, col, step, m, count, solutions, max_solution, m_so
 
         return len(solutions) >= max_solution
 
-    print(f"Visiting step {step} at position ({row}, {col})")
+    if tracer:
+        tracer.expand((row, col), step[0])
 
     for nextX, nextY in validMoves:
         step[0] += 1
@@ -62,9 +64,11 @@ def knightTourAlg(board, row, col, step, m, count, solutions, max_solution, m_so
 
         m.append(len(validMoves))
 
-        if knightTourAlg(board, nextX, nextY, step, m, count, solutions, max_solution, m_sol):
+        if knightTourAlg(board, nextX, nextY, step, m, count, solutions, max_solution, m_sol, tracer):
             return True
         
+        if tracer:
+            tracer.backtrack((nextX, nextY), step[0])
         step[0] -= 1
         board[nextX][nextY] = 0
         m.pop()
@@ -1,12 +1,19 @@
+import os
+import sys
 import time
 
+# tracing berada di folder nomor_1
+_NOMOR_1 = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'nomor_1'))
+if _NOMOR_1 not in sys.path:
+    sys.path.append(_NOMOR_1)
+
 def isMovevalid(board, row, col):
     if row >= 0 and row < len(board) and col >= 0 and col < len(board) and board[row][col] == 0:
         return True
     else:
         return False
 
-def knightTour(board, row, col, step, m, count):
+def knightTour(board, row, col, step, m, count, tracer=None):
     xWalk = [2, 1, -1, -2, -2, -1, 1, 2]
     yWalk = [1, 2, 2, 1, -1, -2, -2, -1]
 
@@ -32,7 +39,8 @@ def knightTour(board, row, col, step, m, count):
         print(m)
         return True
 
-    print(f"Visiting step {step} at position ({row}, {col})")
+    if tracer:
+        tracer.expand((row, col), step[0])
 
     for nextX, nextY in validMoves:
         step[0] += 1
@@ -41,9 +49,11 @@ def knightTour(board, row, col, step, m, count):
 
         m.append(len(validMoves))
 
-        if knightTour(board, nextX, nextY, step, m, count):
+        if knightTour(board, nextX, nextY, step, m, count, tracer):
             return True
         
+        if tracer:
+            tracer.backtrack((nextX, nextY), step[0])
         step[0] -= 1
         board[nextX][nextY] = 0
         m.pop()
@@ -73,47 +83,68 @@ def urutan(board, m):
                     count += 1
     return step
 
-# Generate NxN chess board
-n = int(input("Insert the width & length of the chess board (N x N) = "))
-
-board = []
-for x in range(n):
-    row = []
-    for y in range(n):
-        row.append(0)
-    board.append(row)
-
-row = 0
-print("Row")
-for i in board:
-    print(f"{row}\t{i}")
-    row += 1
-
-
-# input section
-print("Select a box to start the knight tour ")
-x = int(input("\nInsert the x-axis (must be a number) = "))
-y = int(input("\nInsert the y-axis (must be a number) = "))
-
-# Start time searching
-start_time = time.time()
-
-m = []
-count = [0]
-step = [1]
-
-# Start node
-board[x][y] = step[0]
-knightTour(board, x, y, step, m, count)
-
-steps = urutan(board, m)
-    
-
-# # Calculate the product of each items in m
-# size = est_tree_size(m)
-
-# print(f"The tree size is {sum(size):,}")
-
-end_time = time.time()
-duration = end_time - start_time
-print(f"To execute this program takes {duration}")
\ No newline at end of file
+def create_board(n):
+    board = []
+    for x in range(n):
+        row = []
+        for y in range(n):
+            row.append(0)
+        board.append(row)
+    return board
+
+def solve(n, x, y, tracer=None, stats=None):
+    """Knight's tour dari kotak (x, y); mengembalikan (berhasil, board, urutan langkah, m, jumlah langkah).
+
+    tracer: sink dari nomor_1/tracing.py yang menerima event expand/backtrack.
+    stats: RunStats dari nomor_1/instrumentation.py untuk counter expanded dan backtracks.
+    """
+    board = create_board(n)
+    m = []
+    count = [0]
+    step = [1]
+
+    # Start node
+    board[x][y] = step[0]
+    found = knightTour(board, x, y, step, m, count, tracer)
+    steps = urutan(board, m) if found else []
+    if stats:
+        # Setiap langkah yang tidak tersisa di board pada akhir pencarian pernah dibatalkan
+        stats.add(expanded=count[0], backtracks=count[0] - (step[0] - 1))
+    return found, board, steps, m, count[0]
+
+def main():
+    # Generate NxN chess board
+    n = int(input("Insert the width & length of the chess board (N x N) = "))
+
+    row = 0
+    print("Row")
+    for i in create_board(n):
+        print(f"{row}\t{i}")
+        row += 1
+
+
+    # input section
+    print("Select a box to start the knight tour ")
+    x = int(input("\nInsert the x-axis (must be a number) = "))
+    y = int(input("\nInsert the y-axis (must be a number) = "))
+
+    from tracing import CounterSink
+
+    # Start time searching; jejak per langkah dihitung, tidak dicetak
+    start_time = time.time()
+
+    counter = CounterSink()
+    solve(n, x, y, counter)
+    print(f"Node dikunjungi: {counter.counts['expand']:,}, backtrack: {counter.counts['backtrack']:,}")
+
+    # # Calculate the product of each items in m
+    # size = est_tree_size(m)
+
+    # print(f"The tree size is {sum(size):,}")
+
+    end_time = time.time()
+    duration = end_time - start_time
+    print(f"To execute this program takes {duration}")
+
+if __name__ == "__main__":
+    main()